@@ -0,0 +1,83 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the per-batch latency of fetching the features PyG loaders request
+for each minibatch (x, y and masks) through DaskGraphStore.multi_get_tensor,
+compared to fetching each tensor attribute separately.
+"""
+
+import pytest
+import numpy as np
+import torch
+
+from cugraph.gnn import FeatureStore
+from cugraph_pyg.data import DaskGraphStore
+
+_seed = 42
+_num_nodes = 1_000_000
+_num_features = 128
+
+
+def create_graph_store(backend):
+    rng = np.random.default_rng(_seed)
+    F = FeatureStore(backend=backend)
+    F.add_data(
+        rng.random((_num_nodes, _num_features), dtype="float32"),
+        type_name="paper",
+        feat_name="x",
+    )
+    F.add_data(rng.integers(0, 172, _num_nodes), type_name="paper", feat_name="y")
+    for mask in ["train_mask", "val_mask", "test_mask"]:
+        F.add_data(rng.random(_num_nodes) < 0.1, type_name="paper", feat_name=mask)
+
+    num_edges = _num_nodes * 4
+    G = {
+        ("paper", "cites", "paper"): [
+            torch.as_tensor(rng.integers(0, _num_nodes, num_edges)),
+            torch.as_tensor(rng.integers(0, _num_nodes, num_edges)),
+        ]
+    }
+    return DaskGraphStore(F, G, {"paper": _num_nodes})
+
+
+@pytest.fixture(scope="module", params=["numpy", "torch"])
+def graph_store(request):
+    return create_graph_store(request.param)
+
+
+def get_batch_attrs(graph_store, batch_size):
+    # Sampled minibatches contain repeated, unsorted node ids.
+    rng = np.random.default_rng(_seed)
+    index = torch.as_tensor(rng.integers(0, _num_nodes, batch_size))
+    attrs = []
+    for attr in graph_store.get_all_tensor_attrs():
+        attr.index = index
+        attrs.append(attr)
+    return attrs
+
+
+###############################################################################
+# Benchmarks
+@pytest.mark.parametrize("batch_size", [1_000, 10_000, 100_000])
+def bench_multi_get_tensor(benchmark, graph_store, batch_size):
+    attrs = get_batch_attrs(graph_store, batch_size)
+    tensors = benchmark(graph_store.multi_get_tensor, attrs)
+    assert len(tensors) == len(attrs)
+
+
+@pytest.mark.parametrize("batch_size", [1_000, 10_000, 100_000])
+def bench_get_tensor_per_attr(benchmark, graph_store, batch_size):
+    attrs = get_batch_attrs(graph_store, batch_size)
+    tensors = benchmark(lambda: [graph_store.get_tensor(attr) for attr in attrs])
+    assert len(tensors) == len(attrs)
@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from threading import Thread
+import time
 
 import pytest
 
@@ -33,6 +34,12 @@ _edge_factor = 16
 _batch_size = 100
 _with_replacement = False
 _rng_seed = 42
+# Serve client connections concurrently from a bounded pool of worker threads
+# so throughput can scale with the number of clients. Use "simple" to compare
+# against the single-threaded server.
+_server_mode = "thread-pool"
+_num_workers = 16
+_requests_per_client = 10
 
 
 @pytest.fixture(scope="module")
@@ -47,7 +54,12 @@ def running_server_for_sampling_with_graph(request):
     started a server subprocess, then it is terminated as well.
     """
     (client, server_process) = utils.ensure_running_server_for_sampling(
-        host=_host, port=_port, dask_scheduler_file=None, start_local_cuda_cluster=True
+        host=_host,
+        port=_port,
+        dask_scheduler_file=None,
+        start_local_cuda_cluster=True,
+        server_mode=_server_mode,
+        num_workers=_num_workers,
     )
     num_edges = (2**_graph_scale) * _edge_factor
     gid = client.call_graph_creation_extension(
@@ -144,3 +156,42 @@ def bench_cgs_client_scaling_total_time(
     with TimerContext():
         [t.start() for t in threads]
         [t.join() for t in threads]
+
+
+@pytest.mark.parametrize("num_clients", params.num_clients.values())
+def bench_cgs_client_scaling_throughput(
+    running_server_for_sampling_with_graph, num_clients
+):
+    """
+    Reports the number of sampling requests per second completed by all
+    clients together. With a thread-pool server this should increase with the
+    number of clients (up to the number of workers), rather than staying flat
+    as it does when requests are served one at a time.
+    """
+    graph_id = running_server_for_sampling_with_graph
+
+    def run_requests(sampling_function):
+        for _ in range(_requests_per_client):
+            sampling_function(None)
+
+    threads = []
+    for _ in range(num_clients):
+        sampling_function = create_sampling_client(_host, _port, graph_id)
+        threads.append(Thread(target=run_requests, args=[sampling_function]))
+
+    st = time.perf_counter()
+    [t.start() for t in threads]
+    [t.join() for t in threads]
+    elapsed = time.perf_counter() - st
+
+    num_requests = num_clients * _requests_per_client
+    print(
+        f"\n{num_clients} clients: {num_requests / elapsed:.2f} requests/sec",
+        flush=True,
+    )
+    server_info = CugraphServiceClient(_host, _port).get_server_info()
+    if "max_queued_connections_seen" in server_info:
+        print(
+            "max queued connections: " f"{server_info['max_queued_connections_seen']}",
+            flush=True,
+        )
@@ -61,7 +61,7 @@ def create_graph(graph_data):
     # Assume strings are names of datasets in the datasets package
     if isinstance(graph_data, str):
         ds = getattr(datasets, graph_data)
-        edgelist_df = ds.get_edgelist()
+        edgelist_df = ds.get_edgelist(cache=True)
         # FIXME: edgelist_df should have column names that match the defaults
         # for G.from_cudf_edgelist()
         G.from_cudf_edgelist(
@@ -127,7 +127,7 @@ def create_mg_graph(graph_data):
     # Assume strings are names of datasets in the datasets package
     if isinstance(graph_data, str):
         ds = getattr(datasets, graph_data)
-        edgelist_df = ds.get_edgelist()
+        edgelist_df = ds.get_edgelist(cache=True)
         # FIXME: edgelist_df should have column names that match the defaults
         # for G.from_cudf_edgelist()
         edgelist_df = dask_cudf.from_cudf(edgelist_df)
@@ -0,0 +1,83 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the runtime of cugraph.hypergraph as the number of columns of the
+input grows, for both hyperedges and direct (column pair) edges.
+"""
+
+import pytest
+import cupy
+import pytest_benchmark
+
+# FIXME: Remove this when rapids_pytest_benchmark.gpubenchmark is available
+# everywhere
+try:
+    from rapids_pytest_benchmark import setFixtureParamNames
+except ImportError:
+    print(
+        "\n\nWARNING: rapids_pytest_benchmark is not installed, "
+        "falling back to pytest_benchmark fixtures.\n"
+    )
+
+    # if rapids_pytest_benchmark is not available, just perfrom time-only
+    # benchmarking and replace the util functions with nops
+    gpubenchmark = pytest_benchmark.plugin.benchmark
+
+    def setFixtureParamNames(*args, **kwargs):
+        pass
+
+
+import cudf
+from pylibcugraph.testing import gen_fixture_params_product
+
+import cugraph
+
+
+_seed = 42
+_num_rows = 10_000
+_num_values = 1_000
+
+num_columns = [4, 16, 48]
+
+fixture_params = gen_fixture_params_product(
+    (num_columns, "num_columns"),
+)
+
+
+@pytest.fixture(scope="module", params=fixture_params)
+def events(request):
+    """
+    Returns a frame of events with alternating int64 and string columns of
+    random values, about one in ten of them null.
+    """
+    (n,) = request.param
+    setFixtureParamNames(request, ["num_columns"])
+    rng = cupy.random.default_rng(_seed)
+    df = cudf.DataFrame()
+    for i in range(n):
+        col = cudf.Series(rng.integers(0, _num_values, _num_rows))
+        if i % 2:
+            col = col.astype(str)
+        df[f"col_{i}"] = col.mask(rng.random(_num_rows) < 0.1)
+    return df
+
+
+###############################################################################
+# Benchmarks
+@pytest.mark.parametrize("direct", [False, True])
+def bench_hypergraph(gpubenchmark, events, direct):
+    n = len(events.columns)
+    result = gpubenchmark(cugraph.hypergraph, events, direct=direct)
+    max_edges = len(events) * (n * (n - 1) // 2 if direct else n)
+    assert len(result["edges"]) <= max_edges
@@ -0,0 +1,111 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares ingesting many small edge batches into a PropertyGraph one
+add_edge_data() call at a time against staging them with begin_bulk_load() and
+adding them with a single commit().
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import pytest_benchmark
+
+# FIXME: Remove this when rapids_pytest_benchmark.gpubenchmark is available
+# everywhere
+try:
+    from rapids_pytest_benchmark import setFixtureParamNames
+except ImportError:
+    print(
+        "\n\nWARNING: rapids_pytest_benchmark is not installed, "
+        "falling back to pytest_benchmark fixtures.\n"
+    )
+
+    # if rapids_pytest_benchmark is not available, just perfrom time-only
+    # benchmarking and replace the util functions with nops
+    gpubenchmark = pytest_benchmark.plugin.benchmark
+
+    def setFixtureParamNames(*args, **kwargs):
+        pass
+
+
+import cudf
+from pylibcugraph.testing import gen_fixture_params_product
+
+from cugraph.experimental import PropertyGraph
+
+
+_seed = 42
+_batch_size = 1000
+
+df_types = [cudf.DataFrame, pd.DataFrame]
+num_batches = [10, 100, 500]
+
+fixture_params = gen_fixture_params_product(
+    (df_types, "df_type"),
+    (num_batches, "num_batches"),
+)
+
+
+@pytest.fixture(scope="module", params=fixture_params)
+def edge_batches(request):
+    """
+    Returns a list of edge DataFrames of _batch_size rows each, as would be
+    received from a streaming source.
+    """
+    (df_type, n) = request.param
+    setFixtureParamNames(request, ["df_type", "num_batches"])
+    rng = np.random.default_rng(_seed)
+    num_vertices = _batch_size * n // 4
+    batches = []
+    for _ in range(n):
+        batches.append(
+            df_type(
+                {
+                    "src": rng.integers(0, num_vertices, _batch_size),
+                    "dst": rng.integers(0, num_vertices, _batch_size),
+                    "weight": rng.random(_batch_size),
+                    "ts": rng.integers(0, 2**40, _batch_size),
+                }
+            )
+        )
+    return batches
+
+
+def add_per_call(batches):
+    pG = PropertyGraph()
+    for df in batches:
+        pG.add_edge_data(df, vertex_col_names=("src", "dst"), type_name="events")
+    return pG
+
+
+def add_bulk(batches):
+    pG = PropertyGraph()
+    pG.begin_bulk_load()
+    for df in batches:
+        pG.add_edge_data(df, vertex_col_names=("src", "dst"), type_name="events")
+    pG.commit()
+    return pG
+
+
+###############################################################################
+# Benchmarks
+def bench_add_edge_data_per_call(gpubenchmark, edge_batches):
+    pG = gpubenchmark(add_per_call, edge_batches)
+    assert pG.get_num_edges() == _batch_size * len(edge_batches)
+
+
+def bench_add_edge_data_bulk_load(gpubenchmark, edge_batches):
+    pG = gpubenchmark(add_bulk, edge_batches)
+    assert pG.get_num_edges() == _batch_size * len(edge_batches)
@@ -0,0 +1,127 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the runtime and peak device memory of symmetrize_df when dropping
+duplicate edges with groupby().min() and with the hash-based method.  The peak
+memory (in bytes allocated during the call) is reported in the extra_info of
+each benchmark.  cupy allocations are routed through RMM so that they are
+counted too.
+"""
+
+import warnings
+
+import pytest
+import cupy
+import pytest_benchmark
+
+# FIXME: Remove this when rapids_pytest_benchmark.gpubenchmark is available
+# everywhere
+try:
+    from rapids_pytest_benchmark import setFixtureParamNames
+except ImportError:
+    print(
+        "\n\nWARNING: rapids_pytest_benchmark is not installed, "
+        "falling back to pytest_benchmark fixtures.\n"
+    )
+
+    # if rapids_pytest_benchmark is not available, just perfrom time-only
+    # benchmarking and replace the util functions with nops
+    gpubenchmark = pytest_benchmark.plugin.benchmark
+
+    def setFixtureParamNames(*args, **kwargs):
+        pass
+
+
+import cudf
+import rmm
+from rmm.allocators.cupy import rmm_cupy_allocator
+from pylibcugraph.testing import gen_fixture_params_product
+
+from cugraph.structure.symmetrize import symmetrize_df
+
+
+_seed = 42
+_avg_degree = 16
+
+num_edges = [1_000_000, 10_000_000, 100_000_000]
+weighted = [False, True]
+
+fixture_params = gen_fixture_params_product(
+    (num_edges, "num_edges"),
+    (weighted, "weighted"),
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def cupy_allocator():
+    """
+    Allocates cupy arrays with RMM while benchmarking, so that get_peak_bytes
+    also counts device memory allocated by cupy.
+    """
+    allocator = cupy.cuda.get_allocator()
+    cupy.cuda.set_allocator(rmm_cupy_allocator)
+    yield
+    cupy.cuda.set_allocator(allocator)
+
+
+@pytest.fixture(scope="module", params=fixture_params)
+def edgelist(request):
+    """
+    Returns a random edge list with int32 vertex ids and, if weighted,
+    float32 weights.
+    """
+    (n, is_weighted) = request.param
+    setFixtureParamNames(request, ["num_edges", "weighted"])
+    rng = cupy.random.default_rng(_seed)
+    num_vertices = n // _avg_degree
+    df = cudf.DataFrame(
+        {
+            "src": rng.integers(0, num_vertices, n, dtype="int32"),
+            "dst": rng.integers(0, num_vertices, n, dtype="int32"),
+        }
+    )
+    if is_weighted:
+        df["wgt"] = rng.random(n, dtype="float32")
+    return df
+
+
+def symmetrize(df, method):
+    weight_name = "wgt" if "wgt" in df.columns else None
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        return symmetrize_df(df, "src", "dst", weight_name, method=method)
+
+
+def get_peak_bytes(df, method):
+    """
+    Returns the peak number of bytes of device memory allocated while
+    symmetrizing df.
+    """
+    mr = rmm.mr.get_current_device_resource()
+    statistics_mr = rmm.mr.StatisticsResourceAdaptor(mr)
+    rmm.mr.set_current_device_resource(statistics_mr)
+    try:
+        symmetrize(df, method)
+    finally:
+        rmm.mr.set_current_device_resource(mr)
+    return statistics_mr.allocation_counts["peak_bytes"]
+
+
+###############################################################################
+# Benchmarks
+@pytest.mark.parametrize("method", ["groupby", "hash"])
+def bench_symmetrize_df(gpubenchmark, edgelist, method):
+    gpubenchmark.extra_info["peak_bytes"] = get_peak_bytes(edgelist, method)
+    result = gpubenchmark(symmetrize, edgelist, method)
+    assert len(result) <= 2 * len(edgelist)
@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from __future__ import annotations
+import os
 from typing import Optional, Sequence, Tuple, Dict, Union
 from functools import cached_property
 from cugraph.utilities.utils import import_optional, MissingModule
@@ -52,6 +53,9 @@ class CuGraphStorage:
         single_gpu: bool = True,
         device_id: int = 0,
         idtype=None if isinstance(F, MissingModule) else F.int64,
+        feature_backend: str = "torch",
+        mmap_dir: Optional[str] = None,
+        feature_cache_size: int = 0,
     ):
         """
         Constructor for creating a object of instance CuGraphStorage
@@ -88,6 +92,25 @@ class CuGraphStorage:
             for PyTorch.
             Defaults to ``torch.int64`` if pytorch is installed
 
+        feature_backend: str ('torch', 'numpy', 'mmap')
+            The cugraph.gnn.FeatureStore backend used to store node and
+            edge features. The 'mmap' backend stores each feature as a
+            memory-mapped file, so features larger than host memory are
+            only read as they are fetched.
+            Defaults to 'torch'
+
+        mmap_dir: str, optional
+            Only used with the 'mmap' feature_backend. The directory to
+            store node and edge features in, in separate subdirectories.
+            Defaults to a new temporary directory
+
+        feature_cache_size: int
+            If positive, the number of rows of each node and edge feature
+            to keep in a cache of frequently fetched rows, which helps when
+            sampled minibatches repeatedly contain high-degree nodes.
+            See ``cugraph.gnn.FeatureStore``.
+            Defaults to 0 (no cache)
+
 
          Examples
          --------
@@ -155,9 +178,22 @@ class CuGraphStorage:
         self._etype_offset_d = self.__get_etype_offset_d(self.num_edges_dict)
         self.single_gpu = single_gpu
 
-        self.ndata_storage = FeatureStore(backend="torch")
+        if feature_backend == "mmap" and mmap_dir is not None:
+            ndata_mmap_dir = os.path.join(mmap_dir, "ndata")
+            edata_mmap_dir = os.path.join(mmap_dir, "edata")
+        else:
+            ndata_mmap_dir = edata_mmap_dir = None
+        self.ndata_storage = FeatureStore(
+            backend=feature_backend,
+            mmap_dir=ndata_mmap_dir,
+            cache_size=feature_cache_size,
+        )
         self.ndata = self.ndata_storage.fd
-        self.edata_storage = FeatureStore(backend="torch")
+        self.edata_storage = FeatureStore(
+            backend=feature_backend,
+            mmap_dir=edata_mmap_dir,
+            cache_size=feature_cache_size,
+        )
         self.edata = self.edata_storage.fd
 
         self._etype_range_d = self.__get_etype_range_d(
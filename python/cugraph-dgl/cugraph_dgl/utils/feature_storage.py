@@ -1,4 +1,4 @@
-# Copyright (c) 2023, NVIDIA CORPORATION.
+# Copyright (c) 2023-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+import numpy as np
 from cugraph.gnn import FeatureStore
 from cugraph.utilities.utils import import_optional
 
@@ -52,6 +53,9 @@ class dgl_FeatureStorage:
         t = self.fs.get_data(
             indices=indices, type_name=self.type_name, feat_name=self.feat_name
         )
+        if isinstance(t, np.ndarray):
+            # numpy and mmap FeatureStore backends
+            t = torch.from_numpy(t)
         if device:
             return t.to(device)
         else:
@@ -1079,11 +1079,12 @@ class DaskGraphStore:
         it = chain.from_iterable(self._tensor_attr_dict.values())
         return [CuGraphTensorAttr.cast(c) for c in it]
 
-    def _get_tensor(self, attr: CuGraphTensorAttr) -> TensorType:
+    def __prepare_tensor_index(self, idx: Optional[TensorType]) -> TensorType:
+        """
+        Checks or converts a tensor attribute index to the index type of the
+        feature store backend.
+        """
         feature_backend = self.__features.backend
-        cols = attr.properties
-
-        idx = attr.index
         if idx is not None:
             if feature_backend in ["torch", "wholegraph"]:
                 if not isinstance(idx, torch.Tensor):
@@ -1091,12 +1092,17 @@ class DaskGraphStore:
                         f"Type {type(idx)} invalid"
                         f" for feature store backend {feature_backend}"
                     )
-            elif feature_backend == "numpy":
+            elif feature_backend in ["numpy", "mmap"]:
                 # allow feature indexing through cupy arrays
                 if isinstance(idx, cupy.ndarray):
                     idx = idx.get()
                 elif isinstance(idx, torch.Tensor):
                     idx = np.asarray(idx.cpu())
+        return idx
+
+    def _get_tensor(self, attr: CuGraphTensorAttr) -> TensorType:
+        cols = attr.properties
+        idx = self.__prepare_tensor_index(attr.index)
 
         if cols is None:
             t = self.__features.get_data(idx, attr.group_name, attr.attr_name)
@@ -1125,7 +1131,84 @@ class DaskGraphStore:
             return t
 
     def _multi_get_tensor(self, attrs: List[CuGraphTensorAttr]) -> List[TensorType]:
-        return [self._get_tensor(attr) for attr in attrs]
+        """
+        Returns the same tensors as calling _get_tensor() for each attr, but
+        attrs with the same group name and index share one index conversion
+        and gather each of their features once.  Features requested by more
+        than one attr are returned as the same tensor, and multi-property
+        attrs are assembled with a single concatenation.
+        """
+        # Group by the index object, as the same index tensor is typically
+        # used for all the attrs of a group (see filter()).
+        groups = defaultdict(list)
+        for i, attr in enumerate(attrs):
+            groups[attr.group_name, id(attr.index)].append(i)
+
+        tensors = [None] * len(attrs)
+        for (group_name, _), positions in groups.items():
+            idx = self.__prepare_tensor_index(attrs[positions[0]].index)
+            feat_names = []
+            for i in positions:
+                for feat_name in attrs[i].properties or [attrs[i].attr_name]:
+                    if feat_name not in feat_names:
+                        feat_names.append(feat_name)
+            feats = self.__gather_features(idx, group_name, feat_names)
+
+            for i in positions:
+                cols = attrs[i].properties
+                if cols is None:
+                    t = feats[attrs[i].attr_name]
+                    if idx is None:
+                        t = t[-1]
+                    if isinstance(t, np.ndarray):
+                        t = torch.as_tensor(t, device="cpu")
+                else:
+                    t = [torch.as_tensor(feats[col]) for col in cols]
+                    t = torch.cat([u.reshape(1, -1) if u.dim() == 1 else u for u in t])
+                tensors[i] = t
+
+        return tensors
+
+    def __gather_features(
+        self, idx: Optional[TensorType], group_name: str, feat_names: List[str]
+    ) -> Dict[str, TensorType]:
+        """
+        Returns a dictionary of feature name to the rows of that feature at
+        idx.  Features stored on the host are gathered at the sorted unique
+        indices, computed once for all of them, and then expanded back to the
+        order of idx.
+        """
+        F = self.__features
+        sort = idx is not None and any(
+            F.get_storage(group_name, feat_name) == "cpu" for feat_name in feat_names
+        )
+        if sort:
+            if isinstance(idx, torch.Tensor):
+                (unique_idx, inverse) = torch.unique(idx, return_inverse=True)
+                is_sorted_unique = len(unique_idx) == len(idx) and bool(
+                    torch.equal(unique_idx, idx)
+                )
+            else:
+                (unique_idx, inverse) = np.unique(idx, return_inverse=True)
+                is_sorted_unique = len(unique_idx) == len(idx) and np.array_equal(
+                    unique_idx, idx
+                )
+            sort = not is_sorted_unique
+
+        feats = {}
+        for feat_name in feat_names:
+            if sort and F.get_storage(group_name, feat_name) == "cpu":
+                t = F.get_data(unique_idx, group_name, feat_name)
+                if isinstance(t, torch.Tensor):
+                    t = t[torch.as_tensor(inverse, device=t.device)]
+                else:
+                    if isinstance(inverse, torch.Tensor):
+                        inverse = inverse.cpu().numpy()
+                    t = t[inverse]
+            else:
+                t = F.get_data(idx, group_name, feat_name)
+            feats[feat_name] = t
+        return feats
 
     def multi_get_tensor(self, attrs: List[CuGraphTensorAttr]) -> List[TensorType]:
         """
@@ -68,6 +68,8 @@ class NeighborLoader(NodeLoader):
         format: str = "parquet",
         compression: Optional[str] = None,
         local_seeds_per_call: Optional[int] = None,
+        prefetch_partitions: int = 0,
+        pin_memory: bool = False,
         **kwargs,
     ):
         """
@@ -152,6 +154,15 @@ class NeighborLoader(NodeLoader):
             all workers.  If not provided, it will be automatically
             calculated.
             See cugraph.gnn.DistSampler.
+        prefetch_partitions: int (optional, default=0)
+            The number of sample partitions to load from disk in the
+            background while the current partition is being consumed.
+            By default, each partition is loaded when it is needed.
+            See cugraph.gnn.DistSampleReader.
+        pin_memory: bool (optional, default=False)
+            Whether to stage prefetched partitions in pinned host memory
+            instead of device memory.
+            See cugraph.gnn.DistSampleReader.
         **kwargs
             Other keyword arguments passed to the superclass.
         """
@@ -216,6 +227,8 @@ class NeighborLoader(NodeLoader):
             ),
             (feature_store, graph_store),
             batch_size=batch_size,
+            prefetch_partitions=prefetch_partitions,
+            pin_memory=pin_memory,
         )
         # TODO add heterogeneous support and pass graph_store._vertex_offsets
 
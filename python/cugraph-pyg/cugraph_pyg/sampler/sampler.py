@@ -150,6 +150,15 @@ class SampleReader:
         self.__num_samples_remaining = 0
         self.__index = 0
 
+    @property
+    def reader_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        The statistics of the underlying DistSampleReader, including
+        the time spent waiting for sampled partitions to be loaded.
+        See DistSampleReader.stats.
+        """
+        return self.__base_reader.stats
+
     def __next__(self):
         if self.__num_samples_remaining == 0:
             # raw_sample_data is already a dict of tensors
@@ -324,10 +333,14 @@ class BaseSampler:
             "torch_geometric.data.FeatureStore", "torch_geometric.data.GraphStore"
         ],
         batch_size: int = 16,
+        prefetch_partitions: int = 0,
+        pin_memory: bool = False,
     ):
         self.__sampler = sampler
         self.__feature_store, self.__graph_store = data
         self.__batch_size = batch_size
+        self.__prefetch_partitions = prefetch_partitions
+        self.__pin_memory = pin_memory
 
     def sample_from_nodes(
         self, index: "torch_geometric.sampler.NodeSamplerInput", **kwargs
@@ -346,7 +359,11 @@ class BaseSampler:
             len(edge_attrs) == 1
             and edge_attrs[0].edge_type[0] == edge_attrs[0].edge_type[2]
         ):
-            return HomogeneousSampleReader(self.__sampler.get_reader())
+            return HomogeneousSampleReader(
+                self.__sampler.get_reader(
+                    prefetch=self.__prefetch_partitions, pin_memory=self.__pin_memory
+                )
+            )
         else:
             # TODO implement heterogeneous sampling
             raise NotImplementedError(
@@ -411,3 +411,29 @@ def test_serialize(multi_edge_multi_vertex_no_graph_1):
         assert cugraph_store.get_edge_index(edge_attr) \
             == cugraph_store_copy.get_edge_index(edge_attr)
     """
+
+
+@pytest.mark.skipif(isinstance(torch, MissingModule), reason="torch not available")
+@pytest.mark.sg
+def test_multi_get_tensor_shared_index(basic_graph_1):
+    F, G, N = basic_graph_1
+    cugraph_store = DaskGraphStore(F, G, N)
+
+    # Unsorted index with repeats, shared by several attrs
+    idx = torch.tensor([4, 0, 0, 2])
+    attrs = [
+        CuGraphTensorAttr("vt1", "prop1", idx),
+        CuGraphTensorAttr("vt1", "prop2", idx),
+        CuGraphTensorAttr(
+            "vt1", "props", idx, properties=["prop1", "prop2"], dtype=torch.int64
+        ),
+        CuGraphTensorAttr("vt1", "prop2", torch.tensor([1, 3])),
+    ]
+    tsr = cugraph_store.multi_get_tensor(attrs)
+
+    assert tsr[0].tolist() == [500, 100, 100, 300]
+    assert tsr[1].tolist() == [1, 5, 5, 3]
+    assert tsr[2].tolist() == [[500, 100, 100, 300], [1, 5, 5, 3]]
+    assert tsr[3].tolist() == [4, 2]
+    for attr, t in zip(attrs, tsr):
+        assert cugraph_store.get_tensor(attr).tolist() == t.tolist()
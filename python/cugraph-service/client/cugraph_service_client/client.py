@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -16,9 +16,8 @@ from cugraph_service_client.remote_graph_utils import import_optional, MissingMo
 
 import numpy as np
 
-from functools import wraps
+from functools import reduce, wraps
 from collections.abc import Sequence
-import pickle
 import ucp
 import asyncio
 import threading
@@ -31,6 +30,7 @@ from cugraph_service_client.types import (
     ValueWrapper,
     GraphVertexEdgeID,
     UniformNeighborSampleResult,
+    GraphDataChunkWrapper,
 )
 from cugraph_service_client.cugraph_service_thrift import create_client
 
@@ -462,6 +462,7 @@ class CugraphServiceClient:
         func_name,
         *func_args,
         result_device=None,
+        result_as_ndarray=False,
         **func_kwargs,
     ):
         """
@@ -489,16 +490,22 @@ class CugraphServiceClient:
             objects on the server using eval(), and therefore only objects that
             can be restored server-side with eval() are supported.
 
-            result_device is reserved for use in specifying an optional GPU
-            device ID to have the server transfer results to.
+            result_device and result_as_ndarray are reserved for use in
+            specifying how results are returned.
 
         result_device : int, default is None
             If specified, must be the integer ID of a GPU device to have the
             server transfer results to as one or more cupy ndarrays
 
+        result_as_ndarray : bool, default is False
+            If True, numeric arrays returned by the extension are returned as
+            read-only numpy ndarrays of the received data instead of lists,
+            which avoids creating a python object per element. Ignored if
+            result_device is specified.
+
         Returns
         -------
-        result : python int, float, string, list
+        result : python int, float, string, list, numpy.ndarray
             The result returned by the extension
 
         Examples
@@ -530,9 +537,7 @@ class CugraphServiceClient:
                 client_result_port=None,
             )
             # Convert the structure returned from the RPC call to a python type
-            # FIXME: ValueWrapper ctor and get_py_obj are recursive and could be slow,
-            # especially if Value is a list. Consider returning the Value obj as-is.
-            return ValueWrapper(result_obj).get_py_obj()
+            return ValueWrapper(result_obj).get_py_obj(as_ndarray=result_as_ndarray)
 
     ###########################################################################
     # Graph management
@@ -1008,20 +1013,10 @@ class CugraphServiceClient:
         """
         # FIXME: finish docstring above
 
-        vertex_edge_id_obj = self.__get_vertex_edge_id_obj(id_or_ids)
-        null_replacement_value_obj = ValueWrapper(
-            null_replacement_value, val_name="null_replacement_value"
-        ).union
-
-        ndarray_bytes = self.__client.get_graph_vertex_data(
-            vertex_edge_id_obj,
-            null_replacement_value_obj,
-            property_keys or [],
-            types or [],
-            graph_id,
+        columns = self.get_graph_vertex_data_columns(
+            id_or_ids, property_keys, types, graph_id
         )
-
-        return pickle.loads(ndarray_bytes)
+        return self.__graph_data_columns_to_ndarray(columns, null_replacement_value)
 
     @__server_connection
     def get_graph_edge_data(
@@ -1062,20 +1057,122 @@ class CugraphServiceClient:
         """
         # FIXME: finish docstring above
 
-        vertex_edge_id_obj = self.__get_vertex_edge_id_obj(id_or_ids)
-        null_replacement_value_obj = ValueWrapper(
-            null_replacement_value, val_name="null_replacement_value"
-        ).union
+        columns = self.get_graph_edge_data_columns(
+            id_or_ids, property_keys, types, graph_id
+        )
+        return self.__graph_data_columns_to_ndarray(columns, null_replacement_value)
+
+    @__server_connection
+    def get_graph_vertex_data_columns(
+        self,
+        id_or_ids=-1,
+        property_keys=None,
+        types=None,
+        graph_id=defaults.graph_id,
+        chunk_size=defaults.graph_data_chunk_size,
+    ):
+        """
+        Returns the vertex data as a dictionary of column names to numpy
+        arrays. Unlike get_graph_vertex_data(), each column keeps its dtype and
+        NA values are not replaced.
+
+        Parameters
+        ----------
+        id_or_ids : int or list of ints (default -1)
+
+        property_keys : list of strings (default [])
+            The keys (names) of properties to retrieve.  If omitted, returns
+            all columns.
+
+        types : list of strings (default [])
+            The vertex types to include in the query.  If ommitted, returns
+            properties for all types.
+
+        graph_id : int, default is defaults.graph_id
+           The graph ID to get the vertex data from. If the ID passed is not
+           valid on the server, CugraphServiceError is raised.
+
+        chunk_size : int, default is defaults.graph_data_chunk_size
+           The maximum number of rows the server sends per response. Large
+           results are transferred in multiple chunks.
+
+        Returns
+        -------
+        dict
+            Column names mapped to numpy arrays. Columns containing NA values
+            are numpy.ma.MaskedArray objects with the NA values masked.
 
-        ndarray_bytes = self.__client.get_graph_edge_data(
-            vertex_edge_id_obj,
-            null_replacement_value_obj,
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> client.load_csv_as_vertex_data(...)
+        >>> columns = client.get_graph_vertex_data_columns()
+        """
+        first_chunk = self.__client.get_graph_vertex_data_columns(
+            self.__get_vertex_edge_id_obj(id_or_ids),
             property_keys or [],
             types or [],
             graph_id,
+            chunk_size,
         )
+        return self.__get_graph_data_columns(first_chunk)
+
+    @__server_connection
+    def get_graph_edge_data_columns(
+        self,
+        id_or_ids=-1,
+        property_keys=None,
+        types=None,
+        graph_id=defaults.graph_id,
+        chunk_size=defaults.graph_data_chunk_size,
+    ):
+        """
+        Returns the edge data as a dictionary of column names to numpy arrays.
+        Unlike get_graph_edge_data(), each column keeps its dtype and NA values
+        are not replaced.
+
+        Parameters
+        ----------
+        id_or_ids : int or list of ints (default -1)
+
+        property_keys : list of strings (default [])
+            The keys (names) of properties to retrieve.  If omitted, returns
+            all columns.
+
+        types : list of strings (default [])
+            The types of edges to include in the query.  If ommitted, returns
+            data for all edge types.
+
+        graph_id : int, default is defaults.graph_id
+           The graph ID to get the edge data from. If the ID passed is not
+           valid on the server, CugraphServiceError is raised.
+
+        chunk_size : int, default is defaults.graph_data_chunk_size
+           The maximum number of rows the server sends per response. Large
+           results are transferred in multiple chunks.
+
+        Returns
+        -------
+        dict
+            Column names mapped to numpy arrays. Columns containing NA values
+            are numpy.ma.MaskedArray objects with the NA values masked.
 
-        return pickle.loads(ndarray_bytes)
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> client.load_csv_as_edge_data(...)
+        >>> columns = client.get_graph_edge_data_columns()
+        """
+        first_chunk = self.__client.get_graph_edge_data_columns(
+            self.__get_vertex_edge_id_obj(id_or_ids),
+            property_keys or [],
+            types or [],
+            graph_id,
+            chunk_size,
+        )
+        return self.__get_graph_data_columns(first_chunk)
 
     @__server_connection
     def is_vertex_property(self, property_key, graph_id=defaults.graph_id):
@@ -1200,18 +1297,36 @@ class CugraphServiceClient:
     @__server_connection
     def batched_ego_graphs(self, seeds, radius=1, graph_id=defaults.graph_id):
         """
+        Extracts the induced subgraph of the vertices within radius of each
+        seed. The subgraphs of all seeds are extracted together on the
+        server, and repeated seeds are only extracted once.
+
         Parameters
         ----------
+        seeds : int or list[int]
+            The seeds of the induced subgraphs.
+
+        radius : int, default is 1
+            Include all vertices at most radius hops from each seed.
+
+        graph_id : int, default is defaults.graph_id
+            The graph ID to extract the subgraphs from.
 
         Returns
         -------
+        A tuple of lists (sources, destinations, weights, seeds_offsets) of
+        the edges of all subgraphs, in the order of seeds. The edges of the
+        subgraph of seeds[i] are at positions seeds_offsets[i] up to
+        seeds_offsets[i + 1]. Edges of unweighted graphs have a weight of 1.
 
         Examples
         --------
-        >>>
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> # Assumes a graph was loaded and extracted to graph ID 1
+        >>> (srcs, dsts, weights, offsets) = client.batched_ego_graphs(
+        ...     [0, 5], radius=2, graph_id=1)
         """
-        # FIXME: finish docstring above
-
         if not isinstance(seeds, list):
             seeds = [seeds]
         batched_ego_graphs_result = self.__client.batched_ego_graphs(
@@ -1538,6 +1653,66 @@ class CugraphServiceClient:
             result = result[0]
         return result
 
+    def __get_graph_data_columns(self, chunk):
+        """
+        Returns a dictionary of column names to numpy arrays containing the
+        data in chunk and all subsequent chunks of the same result, which are
+        retrieved from the server.
+        """
+        chunks = [GraphDataChunkWrapper(chunk).get_py_obj()]
+        try:
+            while chunk.result_id != -1:
+                chunk = self.__client.get_graph_data_chunk(chunk.result_id)
+                chunks.append(GraphDataChunkWrapper(chunk).get_py_obj())
+        except Exception:
+            # Do not leave the rest of the result on the server
+            if chunk.result_id != -1:
+                try:
+                    self.__client.release_graph_data(chunk.result_id)
+                except Exception:
+                    pass
+            raise
+
+        if len(chunks) == 1:
+            return chunks[0]
+
+        columns = {}
+        for col_name in chunks[0]:
+            arrays = [c[col_name] for c in chunks]
+            if any(isinstance(a, np.ma.MaskedArray) for a in arrays):
+                columns[col_name] = np.ma.concatenate(arrays)
+            else:
+                columns[col_name] = np.concatenate(arrays)
+        return columns
+
+    @staticmethod
+    def __graph_data_columns_to_ndarray(columns, null_replacement_value):
+        """
+        Returns a 2-D numpy array of the columns, as returned by
+        __get_graph_data_columns(), with NA values replaced by
+        null_replacement_value and all columns converted to a common dtype.
+        """
+        if len(columns) == 0:
+            return np.ndarray(shape=(0, 0))
+
+        arrays = []
+        for values in columns.values():
+            if isinstance(values, np.ma.MaskedArray):
+                # Replacing NAs in a numeric column with a str requires an
+                # object column
+                if isinstance(null_replacement_value, str):
+                    values = values.astype("object")
+                values = values.filled(null_replacement_value)
+            arrays.append(values)
+
+        # String columns are object arrays, so this is an object dtype if any
+        # column contains strings, otherwise a common numeric dtype.
+        dtype = reduce(np.promote_types, (a.dtype for a in arrays))
+        ndarray = np.empty((len(arrays[0]), len(arrays)), dtype=dtype)
+        for i, values in enumerate(arrays):
+            ndarray[:, i] = values
+        return ndarray
+
     @staticmethod
     def __get_vertex_edge_id_obj(id_or_ids):
         # Force np.ndarray
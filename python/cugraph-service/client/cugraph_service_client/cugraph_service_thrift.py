@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -13,11 +13,14 @@
 # limitations under the License.
 
 import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import thriftpy2
 from thriftpy2.rpc import make_client
 from thriftpy2.protocol import TBinaryProtocolFactory
-from thriftpy2.server import TSimpleServer
+from thriftpy2.server import TSimpleServer, TThreadedServer
 from thriftpy2.thrift import TProcessor
 from thriftpy2.transport import (
     TBufferedTransportFactory,
@@ -65,6 +68,29 @@ struct UniformNeighborSampleResult {
   3:list<double> indices
 }
 
+# A single column of vertex or edge graph data. data contains the raw values
+# of type dtype (a numpy dtype string, or "str" for UTF-8 strings, in which
+# case offsets contains the int64 start offset of each string in data plus the
+# end offset of the last). validity is a little-endian packed bitmap with a 0
+# bit for each null value, and is empty if the column has no nulls.
+struct GraphDataColumn {
+  1:string name
+  2:string dtype
+  3:binary data
+  4:binary validity
+  5:binary offsets
+}
+
+# A chunk of rows of vertex or edge graph data. If more chunks remain,
+# result_id is passed to get_graph_data_chunk() to retrieve the next one,
+# otherwise it is -1.
+struct GraphDataChunk {
+  1:list<GraphDataColumn> columns
+  2:i64 num_rows
+  3:i64 total_num_rows
+  4:i32 result_id
+}
+
 union GraphVertexEdgeID {
   1:i32 int32_id
   2:i64 int64_id
@@ -72,6 +98,14 @@ union GraphVertexEdgeID {
   4:list<i64> int64_ids
 }
 
+# A 1-D array of numbers stored as the raw bytes of its values, which is much
+# faster to serialize than a list_value of individual Values. dtype is the
+# numpy dtype string of the values (eg. "<i4").
+struct PackedArray {
+  1:string dtype
+  2:binary data
+}
+
 union Value {
   1:i32 int32_value
   2:i64 int64_value
@@ -79,6 +113,7 @@ union Value {
   4:bool bool_value
   5:double double_value
   6:list<Value> list_value
+  7:PackedArray packed_array_value
 }
 
 union Offsets {
@@ -189,6 +224,27 @@ service CugraphService {
                              5:i32 graph_id,
                              ) throws (1:CugraphServiceError e),
 
+  GraphDataChunk
+  get_graph_vertex_data_columns(1:GraphVertexEdgeID vertex_id,
+                                2:list<string> property_keys,
+                                3:list<string> types,
+                                4:i32 graph_id,
+                                5:i64 chunk_size
+                                ) throws (1:CugraphServiceError e),
+
+  GraphDataChunk
+  get_graph_edge_data_columns(1:GraphVertexEdgeID edge_id,
+                              2:list<string> property_keys,
+                              3:list<string> types,
+                              4:i32 graph_id,
+                              5:i64 chunk_size
+                              ) throws (1:CugraphServiceError e),
+
+  GraphDataChunk
+  get_graph_data_chunk(1:i32 result_id) throws (1:CugraphServiceError e),
+
+  void release_graph_data(1:i32 result_id) throws (1:CugraphServiceError e),
+
   bool is_vertex_property(1:string property_key,
                           2:i32 graph_id) throws (1:CugraphServiceError e),
 
@@ -262,13 +318,113 @@ service CugraphService {
 spec = thriftpy2.load_fp(io.StringIO(cugraph_thrift_spec), module_name="cugraph_thrift")
 
 
-def create_server(handler, host, port, client_timeout=90000):
+logger = logging.getLogger(__name__)
+
+
+class TThreadPoolServer(TThreadedServer):
+    """
+    Server that handles client connections concurrently using a bounded pool
+    of worker threads.
+
+    Each client connection is served by one worker thread for as long as the
+    connection is open, so num_workers is the number of clients that can be
+    served at the same time. Up to max_queued_connections additional
+    connections are accepted and wait for a free worker; once the queue is
+    full, the server stops accepting connections until a worker frees up (new
+    connections then wait in the listen backlog of the socket).
+    """
+
+    def __init__(self, *args, num_workers=16, max_queued_connections=64, **kwargs):
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be >= 1, got {num_workers}")
+        if max_queued_connections < 0:
+            raise ValueError(
+                f"max_queued_connections must be >= 0, got {max_queued_connections}"
+            )
+        super().__init__(*args, **kwargs)
+        self.num_workers = num_workers
+        self.max_queued_connections = max_queued_connections
+        self.__executor = ThreadPoolExecutor(
+            max_workers=num_workers, thread_name_prefix="cugraph_service_worker"
+        )
+        self.__connection_slots = threading.BoundedSemaphore(
+            num_workers + max_queued_connections
+        )
+        self.__stats_lock = threading.Lock()
+        self.__num_active = 0
+        self.__num_queued = 0
+        self.__max_num_queued = 0
+        self.__num_served = 0
+
+    def get_stats(self):
+        """
+        Return a dictionary of connection counts: active (being served by a
+        worker), queued (waiting for a worker), the largest queue depth seen,
+        and the total number of connections served so far.
+        """
+        with self.__stats_lock:
+            return {
+                "num_workers": self.num_workers,
+                "num_active_connections": self.__num_active,
+                "num_queued_connections": self.__num_queued,
+                "max_queued_connections_seen": self.__max_num_queued,
+                "num_connections_served": self.__num_served,
+            }
+
+    def serve(self):
+        self.trans.listen()
+        while not self.closed:
+            self.__connection_slots.acquire()
+            try:
+                client = self.trans.accept()
+            except KeyboardInterrupt:
+                self.__connection_slots.release()
+                raise
+            except Exception as x:
+                self.__connection_slots.release()
+                logger.exception(x)
+                continue
+            with self.__stats_lock:
+                self.__num_queued += 1
+                self.__max_num_queued = max(self.__max_num_queued, self.__num_queued)
+            self.__executor.submit(self.__handle_queued, client)
+
+    def close(self):
+        super().close()
+        self.__executor.shutdown(wait=False)
+
+    def __handle_queued(self, client):
+        with self.__stats_lock:
+            self.__num_queued -= 1
+            self.__num_active += 1
+        try:
+            self.handle(client)
+        finally:
+            with self.__stats_lock:
+                self.__num_active -= 1
+                self.__num_served += 1
+            self.__connection_slots.release()
+
+
+def create_server(
+    handler,
+    host,
+    port,
+    client_timeout=90000,
+    num_workers=None,
+    max_queued_connections=64,
+):
     """
     Return a server object configured to listen on host/port and use the
     handler object to handle calls from clients. The handler object must have
     an interface compatible with the CugraphService service defined in the
     Thrift specification.
 
+    If num_workers is None, the server handles one client connection at a
+    time. Otherwise, up to num_workers client connections are handled
+    concurrently by a pool of worker threads (see TThreadPoolServer), in which
+    case the handler must be safe to call from multiple threads.
+
     Note: This function is defined here in order to allow it to have easy
     access to the Thrift spec loaded here on import, and to keep all thriftpy2
     calls in this module. However, this function is likely only called from the
@@ -280,12 +436,22 @@ def create_server(handler, host, port, client_timeout=90000):
 
     processor = TProcessor(spec.CugraphService, handler)
     server_socket = TServerSocket(host=host, port=port, client_timeout=client_timeout)
-    server = TSimpleServer(
-        processor,
-        server_socket,
-        iprot_factory=proto_factory,
-        itrans_factory=trans_factory,
-    )
+    if num_workers is None:
+        server = TSimpleServer(
+            processor,
+            server_socket,
+            iprot_factory=proto_factory,
+            itrans_factory=trans_factory,
+        )
+    else:
+        server = TThreadPoolServer(
+            processor,
+            server_socket,
+            iprot_factory=proto_factory,
+            itrans_factory=trans_factory,
+            num_workers=num_workers,
+            max_queued_connections=max_queued_connections,
+        )
     return server
 
 
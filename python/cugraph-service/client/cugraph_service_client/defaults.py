@@ -1,4 +1,4 @@
-# Copyright (c) 2022, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -16,3 +16,12 @@ host = "localhost"
 port = 9090
 results_port = 9091
 graph_id = 0
+server_mode = "simple"
+num_workers = 16
+max_queued_connections = 64
+# Max number of rows of vertex or edge data returned per server response
+graph_data_chunk_size = 2**20
+# Max number of partially-fetched vertex or edge data results held by the
+# server, and the number of seconds one is held after its last chunk request
+max_graph_data_results = 64
+graph_data_result_ttl = 600
@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -25,11 +25,14 @@ except ModuleNotFoundError:
 from cugraph_service_client.cugraph_service_thrift import spec
 
 Value = spec.Value
+PackedArray = spec.PackedArray
 GraphVertexEdgeID = spec.GraphVertexEdgeID
 BatchedEgoGraphsResult = spec.BatchedEgoGraphsResult
 Node2vecResult = spec.Node2vecResult
 UniformNeighborSampleResult = spec.UniformNeighborSampleResult
 Offsets = spec.Offsets
+GraphDataColumn = spec.GraphDataColumn
+GraphDataChunk = spec.GraphDataChunk
 
 
 class UnionWrapper:
@@ -50,6 +53,14 @@ class ValueWrapper(UnionWrapper):
     field.
     """
 
+    # numpy dtype kinds (bool, signed int, unsigned int, float) of arrays sent
+    # as a PackedArray
+    packed_array_dtype_kinds = "biuf"
+
+    # Names of the Value fields, looked up once rather than on each call to
+    # get_py_obj()
+    _value_field_names = tuple(field[1] for field in Value.thrift_spec.values())
+
     valid_types = ["int", "float", "str", "bool"]
     if numpy:
         valid_types += ["numpy.int8", "numpy.int32", "numpy.int64", "numpy.ndarray"]
@@ -94,6 +105,30 @@ class ValueWrapper(UnionWrapper):
             self.union = Value(bool_value=val)
         elif isinstance(val, (list, tuple)):
             self.union = Value(list_value=[ValueWrapper(i) for i in val])
+        # 1-D numeric arrays are sent as their raw bytes rather than as a list
+        # of individual Values.
+        elif (
+            numpy
+            and isinstance(val, numpy.ndarray)
+            and val.ndim == 1
+            and val.dtype.kind in self.packed_array_dtype_kinds
+        ):
+            self.union = Value(
+                packed_array_value=PackedArray(
+                    dtype=val.dtype.str, data=numpy.ascontiguousarray(val).tobytes()
+                )
+            )
+        elif (
+            cupy
+            and isinstance(val, cupy.ndarray)
+            and val.ndim == 1
+            and val.dtype.kind in self.packed_array_dtype_kinds
+        ):
+            self.union = Value(
+                packed_array_value=PackedArray(
+                    dtype=val.dtype.str, data=cupy.asnumpy(val).tobytes()
+                )
+            )
         # FIXME: Assume ndarrays contain values Thrift can accept! Otherwise,
         # check and possibly convert ndarray dtypes.
         elif (numpy and isinstance(val, numpy.ndarray)) or (
@@ -118,29 +153,32 @@ class ValueWrapper(UnionWrapper):
         """
         return getattr(self.union, attr)
 
-    def get_py_obj(self):
+    def get_py_obj(self, as_ndarray=False):
         """
-        Get the python object set in the union.
+        Get the python object set in the union. list_value Values are returned
+        as a list. packed_array_value Values are returned as a read-only numpy
+        array of the received bytes if as_ndarray is True, otherwise as a list
+        of python numbers.
         """
-        attrs = [
-            a
-            for a in dir(self.union)
-            if not (a.startswith("_")) and a not in self.non_attrs
-        ]
         # Much like a C union, only one field will be set. Return the first
         # non-None value encountered.
-        for a in attrs:
+        for a in self._value_field_names:
             val = getattr(self.union, a)
             if val is not None:
+                if isinstance(val, PackedArray):
+                    if numpy is None:
+                        raise RuntimeError(
+                            "numpy is required to convert a packed array Value"
+                        )
+                    array = numpy.frombuffer(val.data, dtype=val.dtype)
+                    return array if as_ndarray else array.tolist()
                 # Assume all lists are homogeneous. Check the first item to see
                 # if it is a Value or ValueWrapper obj, and if so recurse.
-                # FIXME: this might be slow, consider handling lists of numbers
-                # differently
                 if isinstance(val, list) and len(val) > 0:
                     if isinstance(val[0], Value):
-                        return [ValueWrapper(i).get_py_obj() for i in val]
+                        return [ValueWrapper(i).get_py_obj(as_ndarray) for i in val]
                     elif isinstance(val[0], ValueWrapper):
-                        return [i.get_py_obj() for i in val]
+                        return [i.get_py_obj(as_ndarray) for i in val]
                     else:
                         raise TypeError(
                             f"expected Value or ValueWrapper, got {type(val)}"
@@ -191,3 +229,64 @@ class GraphVertexEdgeIDWrapper(UnionWrapper):
                 return val
 
         return None
+
+
+class GraphDataChunkWrapper:
+    """
+    Provides conversion of a GraphDataChunk Thrift struct to a dictionary of
+    column names to numpy arrays, one per column of graph data, each with the
+    dtype of the column on the server.
+    """
+
+    def __init__(self, val):
+        if not isinstance(val, GraphDataChunk):
+            raise TypeError(f"expected GraphDataChunk, got {type(val)}")
+        if numpy is None:
+            raise RuntimeError("numpy is required to convert graph data")
+        self.chunk = val
+
+    def get_py_obj(self):
+        """
+        Return a dictionary of column names to arrays. Columns containing nulls
+        are returned as numpy.ma.MaskedArray objects with nulls masked.
+        Numeric columns are views of the received buffers, not copies.
+        """
+        num_rows = self.chunk.num_rows
+        columns = {}
+        for col in self.chunk.columns:
+            if col.dtype == "str":
+                values = self.__decode_strings(col.data, col.offsets, num_rows)
+            else:
+                values = numpy.frombuffer(col.data, dtype=col.dtype, count=num_rows)
+
+            if col.validity:
+                is_valid = numpy.unpackbits(
+                    numpy.frombuffer(col.validity, dtype="uint8"),
+                    count=num_rows,
+                    bitorder="little",
+                ).view(bool)
+                values = numpy.ma.MaskedArray(values, mask=~is_valid)
+
+            columns[col.name] = values
+
+        return columns
+
+    @staticmethod
+    def __decode_strings(data, offsets, num_rows):
+        """
+        Return an object array of the num_rows UTF-8 strings in data, where
+        string i is data[offsets[i]:offsets[i+1]]. ASCII data is decoded once
+        and sliced, since its byte offsets are also character offsets.
+        """
+        offsets = numpy.frombuffer(offsets, dtype="int64", count=num_rows + 1).tolist()
+        data = bytes(data[: offsets[-1]])
+        if data.isascii():
+            text = data.decode("ascii")
+            strings = [text[start:end] for start, end in zip(offsets, offsets[1:])]
+        else:
+            strings = [
+                data[start:end].decode() for start, end in zip(offsets, offsets[1:])
+            ]
+        values = numpy.empty(num_rows, dtype="object")
+        values[:] = strings
+        return values
@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -28,6 +28,9 @@ def start_server_blocking(
     rmm_pool_size=None,
     dask_worker_devices=None,
     console_message="",
+    server_mode=defaults.server_mode,
+    num_workers=defaults.num_workers,
+    max_queued_connections=defaults.max_queued_connections,
 ):
     """
     Start the cugraph_service server on host/port, with graph creation
@@ -37,7 +40,15 @@ def start_server_blocking(
     string is printed just after the handler is created and before the server
     starts listening for connections. This call blocks indefinitely until
     Ctrl-C.
+
+    server_mode is either "simple", which serves one client connection at a
+    time, or "thread-pool", which serves up to num_workers client connections
+    concurrently and queues up to max_queued_connections more.
     """
+    if server_mode not in ("simple", "thread-pool"):
+        raise ValueError(
+            f'server_mode must be "simple" or "thread-pool", got "{server_mode}"'
+        )
     handler = CugraphHandler()
     if start_local_cuda_cluster and (dask_scheduler_file is not None):
         raise ValueError(
@@ -57,7 +68,17 @@ def start_server_blocking(
 
     if console_message != "":
         print(console_message, flush=True)
-    server = create_server(handler, host=host, port=port)
+    if server_mode == "thread-pool":
+        server = create_server(
+            handler,
+            host=host,
+            port=port,
+            num_workers=num_workers,
+            max_queued_connections=max_queued_connections,
+        )
+        handler._set_server_stats_func(server.get_stats)
+    else:
+        server = create_server(handler, host=host, port=port)
     server.serve()  # blocks until Ctrl-C (kill -2)
 
 
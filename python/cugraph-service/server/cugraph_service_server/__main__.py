@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -66,6 +66,29 @@ def main():
         type=str,
         help="list of GPU device IDs the dask cluster should use, ex. '0,1,2,3'",
     )
+    arg_parser.add_argument(
+        "--server-mode",
+        type=str,
+        choices=["simple", "thread-pool"],
+        default=defaults.server_mode,
+        help="'simple' serves one client connection at a time, 'thread-pool' "
+        "serves many client connections concurrently using a pool of worker "
+        f"threads, default is {defaults.server_mode}",
+    )
+    arg_parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=defaults.num_workers,
+        help="number of client connections served concurrently in thread-pool "
+        f"mode, default is {defaults.num_workers}",
+    )
+    arg_parser.add_argument(
+        "--max-queued-connections",
+        type=int,
+        default=defaults.max_queued_connections,
+        help="number of client connections that can wait for a worker in "
+        f"thread-pool mode, default is {defaults.max_queued_connections}",
+    )
     args = arg_parser.parse_args()
 
     msg = "Starting the cugraph_service server "
@@ -92,6 +115,9 @@ def main():
         args.rmm_pool_size,
         args.dask_worker_devices,
         console_message=msg,
+        server_mode=args.server_mode,
+        num_workers=args.num_workers,
+        max_queued_connections=args.max_queued_connections,
     )
     print("done.")
 
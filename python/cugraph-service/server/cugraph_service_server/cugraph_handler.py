@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from functools import cached_property
+from contextlib import contextmanager
+from functools import cached_property, wraps
 from pathlib import Path
 import importlib
+import threading
 import time
 import traceback
 import re
@@ -64,6 +66,8 @@ from cugraph_service_client.types import (
     ValueWrapper,
     GraphVertexEdgeIDWrapper,
     Offsets,
+    GraphDataColumn,
+    GraphDataChunk,
 )
 
 ogb = import_optional("ogb")
@@ -111,6 +115,75 @@ def call_algo(sg_algo_func, G, **kwargs):
         raise RuntimeError(f"internal error: {sg_algo_func} is not supported")
 
 
+class _ReadWriteLock:
+    """
+    A lock that can be held by any number of readers at once, or by a single
+    writer. Writers are preferred: once a writer is waiting, new readers wait
+    until the writer is done, so a stream of readers cannot starve writers.
+    The lock is not reentrant.
+    """
+
+    def __init__(self):
+        self.__cond = threading.Condition()
+        self.__num_readers = 0
+        self.__num_waiting_writers = 0
+        self.__has_writer = False
+
+    @contextmanager
+    def read(self):
+        with self.__cond:
+            while self.__has_writer or self.__num_waiting_writers > 0:
+                self.__cond.wait()
+            self.__num_readers += 1
+        try:
+            yield
+        finally:
+            with self.__cond:
+                self.__num_readers -= 1
+                if self.__num_readers == 0:
+                    self.__cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self.__cond:
+            self.__num_waiting_writers += 1
+            while self.__has_writer or self.__num_readers > 0:
+                self.__cond.wait()
+            self.__num_waiting_writers -= 1
+            self.__has_writer = True
+        try:
+            yield
+        finally:
+            with self.__cond:
+                self.__has_writer = False
+                self.__cond.notify_all()
+
+
+def graph_locked(mode):
+    """
+    Decorator for CugraphHandler methods that take a graph_id arg. The lock for
+    the graph is held in mode ("read" or "write") for the duration of the call,
+    so concurrent client connections can read the same graph at once while
+    calls that modify a graph get exclusive access to it.
+    """
+    if mode not in ("read", "write"):
+        raise ValueError(f'mode must be "read" or "write", got "{mode}"')
+
+    def decorator(method):
+        method_sig = signature(method)
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            graph_id = method_sig.bind(self, *args, **kwargs).arguments["graph_id"]
+            lock = self._get_graph_lock(graph_id)
+            with lock.read() if mode == "read" else lock.write():
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 class ExtensionServerFacade:
     """
     Instances of this class are passed to server extension functions to be used
@@ -171,6 +244,13 @@ class CugraphHandler:
         self.__start_time = int(time.time())
         self.__next_test_array_id = 0
         self.__test_arrays = {}
+        self.__next_graph_data_result_id = 0
+        self.__graph_data_results = {}
+        # Guards the handler's own state (graph, extension and test array
+        # registries) when client connections are served concurrently.
+        self.__lock = threading.RLock()
+        self.__graph_locks = {}
+        self.__server_stats_func = None
 
     def __del__(self):
         self.shutdown_dask_client()
@@ -212,13 +292,18 @@ class CugraphHandler:
         """
         # FIXME: expose self.__dask_client.scheduler_info() as needed
 
-        return {
+        server_info = {
             "num_gpus": ValueWrapper(self.num_gpus).union,
             "extensions": ValueWrapper(list(self.__extensions.keys())).union,
             "graph_creation_extensions": ValueWrapper(
                 list(self.__graph_creation_extensions.keys())
             ).union,
         }
+        # Connection and queue-depth metrics, if the server provides them
+        if self.__server_stats_func is not None:
+            for key, value in self.__server_stats_func().items():
+                server_info[key] = ValueWrapper(value).union
+        return server_info
 
     def load_graph_creation_extensions(self, extension_dir_or_mod_path):
         """
@@ -247,7 +332,8 @@ class CugraphHandler:
                 )
                 module = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(module)
-                self.__graph_creation_extensions[module_file_path] = module
+                with self.__lock:
+                    self.__graph_creation_extensions[module_file_path] = module
                 modules_loaded.append(module_file_path)
 
             return modules_loaded
@@ -279,7 +365,8 @@ class CugraphHandler:
                 )
                 module = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(module)
-                self.__extensions[module_file_path] = module
+                with self.__lock:
+                    self.__extensions[module_file_path] = module
                 modules_loaded.append(module_file_path)
 
             return modules_loaded
@@ -291,10 +378,11 @@ class CugraphHandler:
         """
         Removes all extension functions in modname.
         """
-        if (self.__graph_creation_extensions.pop(modname, None) is None) and (
-            self.__extensions.pop(modname, None) is None
-        ):
-            raise CugraphServiceError(f"bad extension module {modname}")
+        with self.__lock:
+            if (self.__graph_creation_extensions.pop(modname, None) is None) and (
+                self.__extensions.pop(modname, None) is None
+            ):
+                raise CugraphServiceError(f"bad extension module {modname}")
 
     def call_graph_creation_extension(
         self, func_name, func_args_repr, func_kwargs_repr
@@ -447,13 +535,24 @@ class CugraphHandler:
         pG = self.__create_graph()
         return self._add_graph(pG)
 
+    @graph_locked("write")
     def delete_graph(self, graph_id):
         """
-        Remove the graph identified by graph_id from the server.
+        Remove the graph identified by graph_id from the server. Calls already
+        using the graph finish before it is removed.
         """
-        dG = self.__graph_objs.pop(graph_id, None)
-        if dG is None:
-            raise CugraphServiceError(f"invalid graph_id {graph_id}")
+        with self.__lock:
+            dG = self.__graph_objs.pop(graph_id, None)
+            if dG is None:
+                raise CugraphServiceError(f"invalid graph_id {graph_id}")
+            self.__graph_locks.pop(graph_id, None)
+            # Data results of the graph can no longer be fetched by clients
+            for result_id in [
+                rid
+                for (rid, result) in self.__graph_data_results.items()
+                if result[3] == graph_id
+            ]:
+                del self.__graph_data_results[result_id]
 
         del dG
         print(f"deleted graph with id {graph_id}")
@@ -462,8 +561,10 @@ class CugraphHandler:
         """
         Returns a list of the graph IDs currently in use.
         """
-        return list(self.__graph_objs.keys())
+        with self.__lock:
+            return list(self.__graph_objs.keys())
 
+    @graph_locked("read")
     def get_graph_info(self, keys, graph_id):
         """
         Returns a dictionary of meta-data about the graph identified by
@@ -525,6 +626,7 @@ class CugraphHandler:
 
         return {key: ValueWrapper(value) for (key, value) in info.items()}
 
+    @graph_locked("write")
     def load_csv_as_vertex_data(
         self,
         csv_file_name,
@@ -570,6 +672,7 @@ class CugraphHandler:
         except Exception:
             raise CugraphServiceError(f"{traceback.format_exc()}")
 
+    @graph_locked("write")
     def load_csv_as_edge_data(
         self,
         csv_file_name,
@@ -622,6 +725,7 @@ class CugraphHandler:
 
     # FIXME: ensure edge IDs can also be filtered by edge type
     # See: https://github.com/rapidsai/cugraph/issues/2655
+    @graph_locked("read")
     def get_edge_IDs_for_vertices(self, src_vert_IDs, dst_vert_IDs, graph_id):
         """
         Return a list of edge IDs corresponding to the vertex IDs in each of
@@ -644,6 +748,7 @@ class CugraphHandler:
 
         return self.__get_edge_IDs_from_graph_edge_data(G, src_vert_IDs, dst_vert_IDs)
 
+    @graph_locked("write")
     def renumber_vertices_by_type(self, prev_id_column: str, graph_id: int) -> Offsets:
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -667,6 +772,7 @@ class CugraphHandler:
                 "Renumbering graphs without properties is currently unsupported"
             )
 
+    @graph_locked("write")
     def renumber_edges_by_type(self, prev_id_column: str, graph_id: int) -> Offsets:
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -690,6 +796,7 @@ class CugraphHandler:
                 "Renumbering graphs without properties is currently unsupported"
             )
 
+    @graph_locked("read")
     def extract_subgraph(
         self,
         create_using,
@@ -738,6 +845,7 @@ class CugraphHandler:
 
         return self._add_graph(G)
 
+    @graph_locked("read")
     def get_graph_vertex_data(
         self, id_or_ids, null_replacement_value, property_keys, types, graph_id
     ):
@@ -750,9 +858,100 @@ class CugraphHandler:
         this method does not accept the id_or_ids, property_keys, or types
         arguments, and instead returns a list of valid vertex ids.
         """
+        df = self.__get_graph_vertex_dataframe(
+            id_or_ids, property_keys, types, graph_id
+        )
+        return self.__get_graph_data_as_numpy_bytes(df, null_replacement_value)
+
+    @graph_locked("read")
+    def get_graph_vertex_data_columns(
+        self, id_or_ids, property_keys, types, graph_id, chunk_size
+    ):
+        """
+        Returns the first GraphDataChunk of the vertex data for the given
+        id_or_ids, with each column in its own buffer and of its own dtype,
+        and NA values described by a validity bitmap. Remaining chunks, if any,
+        are returned by get_graph_data_chunk().
+
+        See get_graph_vertex_data() for details on the other args.
+        """
+        df = self.__get_graph_vertex_dataframe(
+            id_or_ids, property_keys, types, graph_id
+        )
+        return self.__get_graph_data_as_chunks(df, chunk_size, graph_id)
+
+    @graph_locked("read")
+    def get_graph_edge_data(
+        self, id_or_ids, null_replacement_value, property_keys, types, graph_id
+    ):
+        """
+        Returns the edge data as a serialized numpy array for the given
+        id_or_ids.  null_replacement_value must be provided if the data
+        contains NA values, since NA values cannot be serialized.
+        """
+        df = self.__get_graph_edge_dataframe(id_or_ids, property_keys, types, graph_id)
+        return self.__get_graph_data_as_numpy_bytes(df, null_replacement_value)
+
+    @graph_locked("read")
+    def get_graph_edge_data_columns(
+        self, id_or_ids, property_keys, types, graph_id, chunk_size
+    ):
+        """
+        Returns the first GraphDataChunk of the edge data for the given
+        id_or_ids. See get_graph_vertex_data_columns() for details.
+        """
+        df = self.__get_graph_edge_dataframe(id_or_ids, property_keys, types, graph_id)
+        return self.__get_graph_data_as_chunks(df, chunk_size, graph_id)
+
+    def get_graph_data_chunk(self, result_id):
+        """
+        Returns the next GraphDataChunk of the vertex or edge data result
+        identified by result_id. The result is removed from the server once
+        its last chunk has been returned, or once it has been evicted (see
+        __get_graph_data_as_chunks()).
+        """
+        with self.__lock:
+            self.__evict_graph_data_results()
+            # Re-insert the result so results are ordered by last use
+            result = self.__graph_data_results.pop(result_id, None)
+            if result is None:
+                raise CugraphServiceError(
+                    f"invalid or expired graph data result_id {result_id}"
+                )
+            (df, start, chunk_size, graph_id, _) = result
+            stop = start + chunk_size
+            if stop < len(df):
+                self.__graph_data_results[result_id] = (
+                    df,
+                    stop,
+                    chunk_size,
+                    graph_id,
+                    time.monotonic(),
+                )
+
+        if stop >= len(df):
+            return self.__get_graph_data_chunk(df.iloc[start:], len(df), -1)
+        return self.__get_graph_data_chunk(df.iloc[start:stop], len(df), result_id)
+
+    def release_graph_data(self, result_id):
+        """
+        Removes the vertex or edge data result identified by result_id from the
+        server without returning its remaining chunks.
+        """
+        with self.__lock:
+            if self.__graph_data_results.pop(result_id, None) is None:
+                raise CugraphServiceError(
+                    f"invalid or expired graph data result_id {result_id}"
+                )
+
+    def __get_graph_vertex_dataframe(self, id_or_ids, property_keys, types, graph_id):
+        """
+        Returns the vertex data of the graph for the given id_or_ids,
+        property_keys and types as a cudf DataFrame, or None if there is no
+        data.
+        """
         G = self._get_graph(graph_id)
         ids = GraphVertexEdgeIDWrapper(id_or_ids).get_py_obj()
-        null_replacement_value = ValueWrapper(null_replacement_value).get_py_obj()
 
         if ids == -1:
             ids = None
@@ -810,16 +1009,16 @@ class CugraphHandler:
                 df["id"] = s
             if G.is_renumbered():
                 df = G.unrenumber(df, "id", preserve_order=True)
+            if isinstance(df, dask_cudf.DataFrame):
+                df = df.compute()
 
-        return self.__get_graph_data_as_numpy_bytes(df, null_replacement_value)
+        return df
 
-    def get_graph_edge_data(
-        self, id_or_ids, null_replacement_value, property_keys, types, graph_id
-    ):
+    def __get_graph_edge_dataframe(self, id_or_ids, property_keys, types, graph_id):
         """
-        Returns the edge data as a serialized numpy array for the given
-        id_or_ids.  null_replacement_value must be provided if the data
-        contains NA values, since NA values cannot be serialized.
+        Returns the edge data of the graph for the given id_or_ids,
+        property_keys and types as a cudf DataFrame, or None if there is no
+        data.
         """
         G = self._get_graph(graph_id)
         ids = GraphVertexEdgeIDWrapper(id_or_ids).get_py_obj()
@@ -844,8 +1043,9 @@ class CugraphHandler:
                     f"Graph does not contain properties. {columns}"
                 )
 
-            # Get the edgelist; API expects edge id, src, dst, type
-            df = G.edgelist.edgelist_df
+            # Get the edgelist; API expects edge id, src, dst, type. Columns are
+            # added to a shallow copy since other readers share the edgelist.
+            df = G.edgelist.edgelist_df.copy(deep=False)
 
             if G.edgeIdCol in df.columns:
                 if ids is not None:
@@ -887,8 +1087,9 @@ class CugraphHandler:
 
         if isinstance(df, dask_cudf.DataFrame):
             df = df.compute()
-        return self.__get_graph_data_as_numpy_bytes(df, null_replacement_value)
+        return df
 
+    @graph_locked("read")
     def is_vertex_property(self, property_key, graph_id):
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -896,6 +1097,7 @@ class CugraphHandler:
 
         raise CugraphServiceError("Graph does not contain properties")
 
+    @graph_locked("read")
     def is_edge_property(self, property_key, graph_id):
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -903,6 +1105,7 @@ class CugraphHandler:
 
         raise CugraphServiceError("Graph does not contain properties")
 
+    @graph_locked("read")
     def get_graph_vertex_property_names(self, graph_id):
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -910,6 +1113,7 @@ class CugraphHandler:
 
         return []
 
+    @graph_locked("read")
     def get_graph_edge_property_names(self, graph_id):
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -917,6 +1121,7 @@ class CugraphHandler:
 
         return []
 
+    @graph_locked("read")
     def get_graph_vertex_types(self, graph_id):
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -924,6 +1129,7 @@ class CugraphHandler:
         else:
             return [""]
 
+    @graph_locked("read")
     def get_graph_edge_types(self, graph_id):
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -940,6 +1146,7 @@ class CugraphHandler:
             else:
                 return [""]
 
+    @graph_locked("read")
     def get_num_vertices(self, vertex_type, include_edge_data, graph_id):
         # FIXME should include_edge_data always be True in the remote case?
         G = self._get_graph(graph_id)
@@ -956,6 +1163,7 @@ class CugraphHandler:
                 raise CugraphServiceError("Graph does not support vertex types")
             return G.number_of_vertices()
 
+    @graph_locked("read")
     def get_num_edges(self, edge_type, graph_id):
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -975,9 +1183,14 @@ class CugraphHandler:
 
     ###########################################################################
     # Algos
+    @graph_locked("read")
     def batched_ego_graphs(self, seeds, radius, graph_id):
-        """ """
-        # FIXME: finish docstring above
+        """
+        Extracts the induced subgraphs of the vertices within radius of each
+        of seeds, all at once, from the graph with ID graph_id. Returns a
+        BatchedEgoGraphsResult with the edges of all subgraphs, in the order
+        of seeds, and the offsets of the edges of each subgraph.
+        """
         # FIXME: exception handling
         G = self._get_graph(graph_id)
         # FIXME: write test to catch an MGPropertyGraph being passed in
@@ -991,22 +1204,19 @@ class CugraphHandler:
             )
         try:
             # FIXME: update this to use call_algo()
-            # FIXME: this should not be needed, need to update
-            # cugraph.batched_ego_graphs to also accept a list
             seeds = cudf.Series(seeds, dtype="int32")
             (ego_edge_list, seeds_offsets) = batched_ego_graphs(G, seeds, radius)
 
-            # batched_ego_graphs_result = BatchedEgoGraphsResult(
-            #     src_verts=ego_edge_list["src"].values_host.tobytes(), #i32
-            #     dst_verts=ego_edge_list["dst"].values_host.tobytes(), #i32
-            #     edge_weights=ego_edge_list["weight"].values_host.tobytes(),
-            #                                                             #f64
-            #     seeds_offsets=seeds_offsets.values_host.tobytes() #i64
-            # )
+            if "weight" in ego_edge_list.columns:
+                edge_weights = ego_edge_list["weight"].values_host
+            else:
+                # The edges of unweighted graphs have a weight of 1
+                edge_weights = np.ones(len(ego_edge_list), dtype="float64")
+
             batched_ego_graphs_result = BatchedEgoGraphsResult(
                 src_verts=ego_edge_list["src"].values_host,
                 dst_verts=ego_edge_list["dst"].values_host,
-                edge_weights=ego_edge_list["weight"].values_host,
+                edge_weights=edge_weights,
                 seeds_offsets=seeds_offsets.values_host,
             )
             return batched_ego_graphs_result
@@ -1015,6 +1225,7 @@ class CugraphHandler:
 
         return batched_ego_graphs_result
 
+    @graph_locked("read")
     def node2vec(self, start_vertices, max_depth, graph_id):
         """ """
         # FIXME: finish docstring above
@@ -1048,6 +1259,7 @@ class CugraphHandler:
 
         return node2vec_result
 
+    @graph_locked("read")
     def uniform_neighbor_sample(
         self,
         start_list,
@@ -1125,16 +1337,18 @@ class CugraphHandler:
 
         The test array must be deleted by calling delete_test_array().
         """
-        aid = self.__next_test_array_id
-        self.__test_arrays[aid] = cp.ones(nbytes, dtype="int8")
-        self.__next_test_array_id += 1
+        with self.__lock:
+            aid = self.__next_test_array_id
+            self.__test_arrays[aid] = cp.ones(nbytes, dtype="int8")
+            self.__next_test_array_id += 1
         return aid
 
     def delete_test_array(self, test_array_id):
         """
         Deletes the test array identified by test_array_id.
         """
-        a = self.__test_arrays.pop(test_array_id, None)
+        with self.__lock:
+            a = self.__test_arrays.pop(test_array_id, None)
         if a is None:
             raise CugraphServiceError(f"invalid test_array_id {test_array_id}")
         del a
@@ -1162,6 +1376,7 @@ class CugraphHandler:
             )
         )
 
+    @graph_locked("read")
     def get_graph_type(self, graph_id):
         """
         Returns a string repr of the graph type associated with graph_id.
@@ -1177,9 +1392,11 @@ class CugraphHandler:
         Create a new graph ID for G and add G to the internal mapping of
         graph ID:graph instance.
         """
-        gid = self.__next_graph_id
-        self.__graph_objs[gid] = G
-        self.__next_graph_id += 1
+        with self.__lock:
+            gid = self.__next_graph_id
+            self.__graph_objs[gid] = G
+            self.__graph_locks[gid] = _ReadWriteLock()
+            self.__next_graph_id += 1
         return gid
 
     def _get_graph(self, graph_id):
@@ -1190,18 +1407,42 @@ class CugraphHandler:
         been created, then instantiate a new PropertyGraph as the default graph
         and return it.
         """
-        pG = self.__graph_objs.get(graph_id)
+        with self.__lock:
+            pG = self.__graph_objs.get(graph_id)
 
-        # Always create the default graph if it does not exist
-        if pG is None:
-            if graph_id == defaults.graph_id:
-                pG = self.__create_graph()
-                self.__graph_objs[graph_id] = pG
-            else:
-                raise CugraphServiceError(f"invalid graph_id {graph_id}")
+            # Always create the default graph if it does not exist
+            if pG is None:
+                if graph_id == defaults.graph_id:
+                    pG = self.__create_graph()
+                    self.__graph_objs[graph_id] = pG
+                else:
+                    raise CugraphServiceError(f"invalid graph_id {graph_id}")
 
         return pG
 
+    def _get_graph_lock(self, graph_id):
+        """
+        Return the _ReadWriteLock for the graph associated with graph_id. Calls
+        that modify the graph must hold it for writing, all others for reading.
+        """
+        with self.__lock:
+            lock = self.__graph_locks.get(graph_id)
+            if lock is None:
+                lock = _ReadWriteLock()
+                # The default graph is created on first use. Locks for invalid
+                # graph_ids are not saved, _get_graph() reports the error.
+                if graph_id == defaults.graph_id:
+                    self.__graph_locks[graph_id] = lock
+        return lock
+
+    def _set_server_stats_func(self, stats_func):
+        """
+        Set a callable returning a dictionary of server metrics (eg. the number
+        of active and queued client connections) to include in the results of
+        get_server_info().
+        """
+        self.__server_stats_func = stats_func
+
     ###########################################################################
     # Private
 
@@ -1392,6 +1633,132 @@ class CugraphHandler:
         except Exception:
             raise CugraphServiceError(f"{traceback.format_exc()}")
 
+    def __get_graph_data_as_chunks(self, dataframe, chunk_size, graph_id):
+        """
+        Returns the first GraphDataChunk of dataframe. If dataframe has more
+        than chunk_size rows (and chunk_size > 0), it is saved so the
+        remaining chunks can be returned by get_graph_data_chunk().
+
+        Saved results hold device memory until fetched, so results not used
+        for defaults.graph_data_result_ttl seconds are evicted, as are the
+        least recently used results beyond defaults.max_graph_data_results and
+        the results of a graph when it is deleted.
+        """
+        if dataframe is None:
+            return GraphDataChunk(
+                columns=[], num_rows=0, total_num_rows=0, result_id=-1
+            )
+
+        num_rows = len(dataframe)
+        if chunk_size <= 0 or num_rows <= chunk_size:
+            return self.__get_graph_data_chunk(dataframe, num_rows, -1)
+
+        with self.__lock:
+            self.__evict_graph_data_results(num_to_add=1)
+            result_id = self.__next_graph_data_result_id
+            self.__graph_data_results[result_id] = (
+                dataframe,
+                chunk_size,
+                chunk_size,
+                graph_id,
+                time.monotonic(),
+            )
+            self.__next_graph_data_result_id += 1
+
+        return self.__get_graph_data_chunk(
+            dataframe.iloc[:chunk_size], num_rows, result_id
+        )
+
+    def __evict_graph_data_results(self, num_to_add=0):
+        """
+        Removes saved graph data results that have not been used within the
+        TTL, then the least recently used ones until num_to_add more results
+        fit within the maximum. Must be called with self.__lock held.
+        """
+        expire_time = time.monotonic() - defaults.graph_data_result_ttl
+        # Results are ordered by last use, oldest first
+        num_to_keep = max(0, defaults.max_graph_data_results - num_to_add)
+        num_to_evict = len(self.__graph_data_results) - num_to_keep
+        for result_id, result in list(self.__graph_data_results.items()):
+            if num_to_evict <= 0 and result[4] >= expire_time:
+                break
+            del self.__graph_data_results[result_id]
+            num_to_evict -= 1
+
+    def __get_graph_data_chunk(self, dataframe, total_num_rows, result_id):
+        """
+        Returns a GraphDataChunk containing the columns of dataframe. Each
+        column is copied to host memory once, as-is: values keep their dtype
+        and NA values are described by a validity bitmap rather than replaced.
+        """
+        try:
+            columns = []
+            for col_name in dataframe.columns:
+                series = dataframe[col_name]
+                if series.dtype == "category":
+                    series = series.astype(series.cat.categories.dtype)
+                # Arrow stores bools as bits, send them as bytes instead
+                is_bool = series.dtype == "bool"
+                if is_bool:
+                    series = series.astype("uint8")
+
+                arr = series.to_arrow()
+                validity = b""
+                if arr.null_count > 0:
+                    is_valid = arr.is_valid().to_numpy(zero_copy_only=False)
+                    validity = np.packbits(is_valid, bitorder="little").tobytes()
+
+                if series.dtype == "object":
+                    arr = arr.cast("large_string")
+                    (_, offsets_buf, data_buf) = arr.buffers()
+                    offsets = np.frombuffer(
+                        offsets_buf,
+                        dtype="int64",
+                        count=len(arr) + 1,
+                        offset=arr.offset * 8,
+                    )
+                    if data_buf is None:
+                        data = b""
+                    else:
+                        data = data_buf.to_pybytes()[offsets[0] : offsets[-1]]
+                    column = GraphDataColumn(
+                        name=str(col_name),
+                        dtype="str",
+                        data=data,
+                        validity=validity,
+                        offsets=(offsets - offsets[0]).tobytes(),
+                    )
+                else:
+                    dtype = np.dtype("bool") if is_bool else np.dtype(series.dtype)
+                    (_, data_buf) = arr.buffers()
+                    if len(arr) == 0:
+                        data = b""
+                    else:
+                        data = np.frombuffer(
+                            data_buf,
+                            dtype=series.dtype,
+                            count=len(arr),
+                            offset=arr.offset * dtype.itemsize,
+                        ).tobytes()
+                    column = GraphDataColumn(
+                        name=str(col_name),
+                        dtype=dtype.str,
+                        data=data,
+                        validity=validity,
+                        offsets=b"",
+                    )
+                columns.append(column)
+
+            return GraphDataChunk(
+                columns=columns,
+                num_rows=len(dataframe),
+                total_num_rows=total_num_rows,
+                result_id=result_id,
+            )
+
+        except Exception:
+            raise CugraphServiceError(f"{traceback.format_exc()}")
+
     def __call_extension(
         self, extension_dict, func_name, func_args_repr, func_kwargs_repr
     ):
@@ -1414,7 +1781,9 @@ class CugraphHandler:
         if func_name.startswith("__"):
             raise CugraphServiceError(f"Cannot call private function {func_name}")
 
-        for module in extension_dict.values():
+        with self.__lock:
+            modules = list(extension_dict.values())
+        for module in modules:
             func = getattr(module, func_name, None)
             if func is not None:
                 # FIXME: look for a way to do this without using eval()
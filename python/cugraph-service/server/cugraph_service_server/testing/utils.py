@@ -1,4 +1,4 @@
-# Copyright (c) 2023, NVIDIA CORPORATION.
+# Copyright (c) 2023-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -54,10 +54,13 @@ def start_server_subprocess(
     start_local_cuda_cluster=False,
     dask_scheduler_file=None,
     env_additions=None,
+    server_mode=defaults.server_mode,
+    num_workers=defaults.num_workers,
 ):
     """
     Start a cugraph_service server as a subprocess. Returns the Popen object
-    for the server.
+    for the server. server_mode and num_workers are passed to the server, see
+    the --server-mode and --num-workers options.
     """
     server_process = None
     env_dict = os.environ.copy()
@@ -97,6 +100,8 @@ def start_server_subprocess(
         ]
     if start_local_cuda_cluster:
         args += ["--start-local-cuda-cluster"]
+    if server_mode != defaults.server_mode:
+        args += ["--server-mode", server_mode, "--num-workers", str(num_workers)]
 
     try:
         print(
@@ -161,6 +166,8 @@ def ensure_running_server(
     port=defaults.port,
     dask_scheduler_file=None,
     start_local_cuda_cluster=False,
+    server_mode=defaults.server_mode,
+    num_workers=defaults.num_workers,
 ):
     """
     Returns a tuple containg a CugraphService instance and a Popen instance for
@@ -184,6 +191,8 @@ def ensure_running_server(
             port=port,
             start_local_cuda_cluster=start_local_cuda_cluster,
             dask_scheduler_file=dask_scheduler_file,
+            server_mode=server_mode,
+            num_workers=num_workers,
         )
 
     return (client, server_process)
@@ -194,6 +203,8 @@ def ensure_running_server_for_sampling(
     port=defaults.port,
     dask_scheduler_file=None,
     start_local_cuda_cluster=False,
+    server_mode=defaults.server_mode,
+    num_workers=defaults.num_workers,
 ):
     """
     Returns a tuple containing a Popen object for the running cugraph-service
@@ -201,7 +212,12 @@ def ensure_running_server_for_sampling(
     detected already running, the Popen object will be None.
     """
     (client, server_process) = ensure_running_server(
-        host, port, dask_scheduler_file, start_local_cuda_cluster
+        host,
+        port,
+        dask_scheduler_file,
+        start_local_cuda_cluster,
+        server_mode=server_mode,
+        num_workers=num_workers,
     )
 
     # Ensure the extensions needed for these benchmarks are loaded
@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -16,6 +16,7 @@ import sys
 import pickle
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 
@@ -117,14 +118,27 @@ def test_load_call_unload_extensions(graph_creation_extension2, extension1):
         "my_nines_function", "(33, 'int32', 21, 'float64')", "{}"
     )
     # results is a ValueWrapper object which Thrift will understand to be a
-    # Value, which it can serialize. Check the ValueWrapper object here.
+    # Value, which it can serialize. Check the ValueWrapper object here. The
+    # arrays are sent packed rather than as lists of individual Values.
     assert len(results.list_value) == 2
-    assert len(results.list_value[0].list_value) == 33
-    assert len(results.list_value[1].list_value) == 21
-    assert type(results.list_value[0].list_value[0].int32_value) is int
-    assert type(results.list_value[1].list_value[0].double_value) is float
-    assert results.list_value[0].list_value[0].int32_value == 9
-    assert results.list_value[1].list_value[0].double_value == 9.0
+    assert results.list_value[0].packed_array_value.dtype == "<i4"
+    assert results.list_value[1].packed_array_value.dtype == "<f8"
+    array1 = results.list_value[0].get_py_obj()
+    array2 = results.list_value[1].get_py_obj()
+    assert len(array1) == 33
+    assert len(array2) == 21
+    assert type(array1[0]) is int
+    assert type(array2[0]) is float
+    assert results.list_value[0].get_py_obj()[0] == 9
+    assert results.list_value[1].get_py_obj()[0] == 9.0
+
+    # Packed arrays can also be returned as numpy arrays without conversion
+    (array1, array2) = results.get_py_obj(as_ndarray=True)
+    assert isinstance(array1, np.ndarray)
+    assert array1.dtype == np.int32
+    assert array2.dtype == np.float64
+    assert array1.tolist() == [9] * 33
+    assert array2.tolist() == [9.0] * 21
 
     # Unloading
     with pytest.raises(CugraphServiceError):
@@ -182,10 +196,11 @@ def test_extension_with_facade_graph_access(
     # results is a ValueWrapper object which Thrift will understand to be a Value, which
     # it can serialize. Check the ValueWrapper object here, it should contain the 3 edge
     # IDs starting from 0 with the values added to each.
-    assert len(results.list_value) == 3
-    assert results.list_value[0].double_value == 0 + val1 + val2
-    assert results.list_value[1].double_value == 1 + val1 + val2
-    assert results.list_value[2].double_value == 2 + val1 + val2
+    values = results.get_py_obj()
+    assert len(values) == 3
+    assert values[0] == 0 + val1 + val2
+    assert values[1] == 1 + val1 + val2
+    assert values[2] == 2 + val1 + val2
 
 
 def test_load_call_unload_testing_extensions():
@@ -260,8 +275,8 @@ def test_load_call_unload_extensions_python_module_path(extension1):
     results = handler.call_extension(
         "my_nines_function", "(33, 'int32', 21, 'float64')", "{}"
     )
-    assert results.list_value[0].list_value[0].int32_value == 9
-    assert results.list_value[1].list_value[0].double_value == 9.0
+    assert results.list_value[0].get_py_obj()[0] == 9
+    assert results.list_value[1].get_py_obj()[0] == 9.0
 
     result = handler.call_extension("foo_func", "()", "{}")
     assert result.int32_value == 33
@@ -286,8 +301,8 @@ def test_load_call_unload_extensions_python_module_path(extension1):
     results = handler.call_extension(
         "my_nines_function", "(33, 'int32', 21, 'float64')", "{}"
     )
-    assert results.list_value[0].list_value[0].int32_value == 9
-    assert results.list_value[1].list_value[0].double_value == 9.0
+    assert results.list_value[0].get_py_obj()[0] == 9
+    assert results.list_value[1].get_py_obj()[0] == 9.0
 
     for mod_name in ext_mod_names2:
         handler.unload_extension_module(mod_name)
@@ -485,3 +500,252 @@ def test_get_server_info(graph_creation_extension1, extension1):
         str(Path(meta_data["extensions"].list_value[0].get_py_obj()).parent)
         == extension1
     )
+
+
+def test_concurrent_graph_access(graph_creation_extension1):
+    """
+    Ensures graphs can be created, read and deleted from multiple threads at
+    once, as happens when the server runs in thread-pool mode.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+
+    handler = CugraphHandler()
+    handler.load_graph_creation_extensions(graph_creation_extension1)
+
+    def create_read_delete(_):
+        gid = handler.call_graph_creation_extension(
+            "custom_graph_creation_function", "()", "{}"
+        )
+        num_edges = handler.get_num_edges(None, gid)
+        handler.delete_graph(gid)
+        return (gid, num_edges)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(create_read_delete, range(32)))
+
+    # Each thread got a distinct graph and all graphs were deleted
+    assert len(set(gid for (gid, _) in results)) == 32
+    assert len(set(num_edges for (_, num_edges) in results)) == 1
+    assert handler.get_graph_ids() == []
+
+
+def test_get_server_info_server_stats():
+    """
+    Ensures the connection metrics of a thread-pool server are included in
+    get_server_info().
+    """
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+
+    handler = CugraphHandler()
+    handler._set_server_stats_func(
+        lambda: {"num_workers": 4, "num_queued_connections": 0}
+    )
+
+    meta_data = handler.get_server_info()
+    assert meta_data["num_workers"].int32_value == 4
+    assert meta_data["num_queued_connections"].int32_value == 0
+
+
+def test_read_write_lock_concurrent_readers():
+    """
+    Ensures any number of readers can hold a _ReadWriteLock at once.
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from cugraph_service_server.cugraph_handler import _ReadWriteLock
+
+    lock = _ReadWriteLock()
+    num_readers = 4
+    # Every reader waits in the barrier while holding the lock, so this only
+    # passes if all readers hold the lock at the same time.
+    barrier = threading.Barrier(num_readers, timeout=10)
+
+    def read(_):
+        with lock.read():
+            return barrier.wait()
+
+    with ThreadPoolExecutor(max_workers=num_readers) as executor:
+        results = list(executor.map(read, range(num_readers)))
+
+    assert sorted(results) == list(range(num_readers))
+
+
+def test_read_write_lock_writer_blocks_readers():
+    """
+    Ensures a writer holding a _ReadWriteLock excludes readers and other
+    writers, and that a waiting writer is preferred over new readers.
+    """
+    import threading
+    import time
+
+    from cugraph_service_server.cugraph_handler import _ReadWriteLock
+
+    lock = _ReadWriteLock()
+    events = []
+
+    def read():
+        with lock.read():
+            events.append("read")
+
+    def write():
+        with lock.write():
+            events.append("write")
+
+    # A writer holding the lock blocks readers and writers
+    with lock.write():
+        reader = threading.Thread(target=read)
+        writer = threading.Thread(target=write)
+        reader.start()
+        writer.start()
+        time.sleep(0.2)
+        assert events == []
+    reader.join(timeout=10)
+    writer.join(timeout=10)
+    assert sorted(events) == ["read", "write"]
+
+    # Once a writer is waiting on a held read lock, new readers wait for it
+    events.clear()
+    with lock.read():
+        writer = threading.Thread(target=write)
+        writer.start()
+        time.sleep(0.2)
+        reader = threading.Thread(target=read)
+        reader.start()
+        time.sleep(0.2)
+        assert events == []
+    writer.join(timeout=10)
+    reader.join(timeout=10)
+    assert events == ["write", "read"]
+
+
+def test_delete_graph_waits_for_readers(graph_creation_extension1):
+    """
+    Ensures delete_graph() waits for calls holding the graph lock to finish.
+    """
+    import threading
+    import time
+
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+
+    handler = CugraphHandler()
+    handler.load_graph_creation_extensions(graph_creation_extension1)
+    gid = handler.call_graph_creation_extension(
+        "custom_graph_creation_function", "()", "{}"
+    )
+
+    deleter = threading.Thread(target=handler.delete_graph, args=(gid,))
+    with handler._get_graph_lock(gid).read():
+        deleter.start()
+        time.sleep(0.2)
+        assert handler.get_graph_ids() == [gid]
+    deleter.join(timeout=10)
+    assert handler.get_graph_ids() == []
+
+
+def test_thread_pool_server():
+    """
+    Ensures a thread-pool server starts and serves multiple client connections
+    at the same time.
+    """
+    import socket
+    import threading
+
+    from cugraph_service_client.cugraph_service_thrift import (
+        TThreadPoolServer,
+        create_client,
+        create_server,
+    )
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+
+    with pytest.raises(ValueError):
+        TThreadPoolServer(None, None, num_workers=0)
+
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        port = s.getsockname()[1]
+
+    handler = CugraphHandler()
+    server = create_server(
+        handler, host="localhost", port=port, num_workers=2, max_queued_connections=1
+    )
+    assert isinstance(server, TThreadPoolServer)
+    handler._set_server_stats_func(server.get_stats)
+
+    # Wait for the server to listen before connecting clients
+    listening = threading.Event()
+    listen = server.trans.listen
+
+    def listen_and_notify():
+        listen()
+        listening.set()
+
+    server.trans.listen = listen_and_notify
+    server_thread = threading.Thread(target=server.serve, daemon=True)
+    server_thread.start()
+    assert listening.wait(timeout=30)
+
+    clients = [create_client("localhost", port) for _ in range(2)]
+    try:
+        # Both connections stay open, so both are served by a worker at once
+        for client in clients:
+            assert client.uptime() >= 0
+        stats = server.get_stats()
+        assert stats["num_workers"] == 2
+        assert stats["num_active_connections"] == 2
+        assert stats["num_queued_connections"] == 0
+        server_info = clients[0].get_server_info()
+        assert server_info["num_active_connections"].int32_value == 2
+    finally:
+        for client in clients:
+            client.close()
+        server.close()
+
+
+def test_graph_data_results_eviction(graph_creation_extension1, monkeypatch):
+    """
+    Ensures partially-fetched graph data results held by the server are
+    evicted when there are too many, when they expire, and when their graph is
+    deleted.
+    """
+    from cugraph_service_client import defaults
+    from cugraph_service_client.exceptions import CugraphServiceError
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+
+    handler = CugraphHandler()
+    handler.load_graph_creation_extensions(graph_creation_extension1)
+    gid = handler.call_graph_creation_extension(
+        "custom_graph_creation_function", "()", "{}"
+    )
+
+    def get_edge_data_result_id():
+        # The graph has 3 edges, so a chunk_size of 1 leaves a saved result
+        chunk = handler.get_graph_edge_data_columns(-1, [], [], gid, 1)
+        assert chunk.result_id != -1
+        return chunk.result_id
+
+    # The least recently used result is evicted once there are too many
+    monkeypatch.setattr(defaults, "max_graph_data_results", 2)
+    rid1 = get_edge_data_result_id()
+    rid2 = get_edge_data_result_id()
+    handler.get_graph_data_chunk(rid1)
+    rid3 = get_edge_data_result_id()
+    with pytest.raises(CugraphServiceError):
+        handler.get_graph_data_chunk(rid2)
+    assert handler.get_graph_data_chunk(rid1).result_id == -1
+    handler.release_graph_data(rid3)
+
+    # Results expire after the TTL
+    monkeypatch.setattr(defaults, "graph_data_result_ttl", -1)
+    rid = get_edge_data_result_id()
+    with pytest.raises(CugraphServiceError):
+        handler.get_graph_data_chunk(rid)
+    monkeypatch.setattr(defaults, "graph_data_result_ttl", 600)
+
+    # Results of a deleted graph are dropped
+    rid = get_edge_data_result_id()
+    handler.delete_graph(gid)
+    with pytest.raises(CugraphServiceError):
+        handler.release_graph_data(rid)
@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -312,6 +312,14 @@ def test_load_call_unload_extension(client, extension1):
     assert results[0][0] == 9
     assert results[1][0] == 9.0
 
+    results = client.call_extension(
+        "my_nines_function", 33, "int32", 21, "float64", result_as_ndarray=True
+    )
+    assert results[0].dtype == "int32"
+    assert results[1].dtype == "float64"
+    assert (results[0] == 9).all()
+    assert (results[1] == 9.0).all()
+
     # Unloading
     for mod_name in ext_mod_names:
         client.unload_extension_module(mod_name)
@@ -387,6 +395,31 @@ def test_get_graph_edge_data(client_with_property_csvs_loaded):
     assert np_array[0][0] == 1
 
 
+def test_get_graph_data_columns(client_with_property_csvs_loaded):
+    (client, test_data) = client_with_property_csvs_loaded
+
+    np_array_all_vertex_data = client.get_graph_vertex_data()
+    vertex_columns = client.get_graph_vertex_data_columns()
+    assert len(vertex_columns) == np_array_all_vertex_data.shape[1]
+    for values in vertex_columns.values():
+        assert len(values) == np_array_all_vertex_data.shape[0]
+
+    # Results larger than chunk_size are returned in multiple chunks
+    np_array_all_rows = client.get_graph_edge_data()
+    edge_columns = client.get_graph_edge_data_columns()
+    chunked_edge_columns = client.get_graph_edge_data_columns(chunk_size=5)
+    assert list(edge_columns) == list(chunked_edge_columns)
+    for col_name in edge_columns:
+        values = edge_columns[col_name]
+        assert len(values) == np_array_all_rows.shape[0]
+        assert values.dtype == chunked_edge_columns[col_name].dtype
+        assert (values == chunked_edge_columns[col_name]).all()
+
+    edge_ids = [0, 1, 2]
+    edge_columns = client.get_graph_edge_data_columns(edge_ids)
+    assert list(list(edge_columns.values())[0]) == edge_ids
+
+
 def test_get_graph_info(client_with_property_csvs_loaded):
     (client, test_data) = client_with_property_csvs_loaded
 
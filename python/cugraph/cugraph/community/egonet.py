@@ -15,6 +15,7 @@
 import warnings
 
 import cudf
+import cupy
 from cugraph.utilities import (
     ensure_cugraph_obj,
     is_nx_graph_type,
@@ -49,11 +50,11 @@ def _convert_df_series_to_output_type(df, offsets, input_type):
         return df, offsets
 
 
-# TODO: add support for a 'batch-mode' option.
 def ego_graph(G, n, radius=1, center=True, undirected=None, distance=None):
     """
     Compute the induced subgraph of neighbors centered at node n,
-    within a given radius.
+    within a given radius.  See batched_ego_graphs to compute the
+    induced subgraphs of many nodes at once.
 
     Parameters
     ----------
@@ -156,14 +157,13 @@ def ego_graph(G, n, radius=1, center=True, undirected=None, distance=None):
 
 def batched_ego_graphs(G, seeds, radius=1, center=True, undirected=None, distance=None):
     """
-    This function is deprecated.
-
-    Deprecated since 24.04. Batched support for multiple seeds will be added
-    to `ego_graph`.
-
     Compute the induced subgraph of neighbors for each node in seeds
     within a given radius.
 
+    The subgraphs of all seeds are extracted together in a single call,
+    and repeated seeds are only extracted once.  The edges of all
+    subgraphs are returned in a single edge list, in the order of seeds.
+
     Parameters
     ----------
     G : cugraph.Graph, networkx.Graph, CuPy or SciPy sparse matrix
@@ -190,21 +190,19 @@ def batched_ego_graphs(G, seeds, radius=1, center=True, undirected=None, distanc
     -------
     ego_edge_lists : cudf.DataFrame or pandas.DataFrame
         GPU data frame containing all induced sources identifiers,
-        destination identifiers, edge weights
+        destination identifiers, and edge weights (if the graph is
+        weighted)
     seeds_offsets: cudf.Series
         Series containing the starting offset in the returned edge list
-        for each seed.
+        for each seed, followed by the number of edges, so the edges of
+        the subgraph of seeds[i] are ego_edge_lists[offsets[i]:offsets[i+1]]
 
     Examples
     --------
     >>> from cugraph.datasets import karate
     >>> G = karate.get_graph(download=True)
-    >>> cugraph.batched_ego_graphs(G, seeds=[1,5], radius=2)  # doctest: +SKIP
+    >>> df, offsets = cugraph.batched_ego_graphs(G, seeds=[1,5], radius=2)
     """
-    warning_msg = "This function is deprecated. Batched support for multiple vertices \
-         will be added to `ego_graph`"
-    warnings.warn(warning_msg, DeprecationWarning)
-
     (G, input_type) = ensure_cugraph_obj(G, nx_weight_attr="weight")
 
     if seeds is not None:
@@ -221,26 +219,38 @@ def batched_ego_graphs(G, seeds, radius=1, center=True, undirected=None, distanc
 
     # Match the seed to the vertex dtype
     seeds_type = G.edgelist.edgelist_df["src"].dtype
-    seeds = seeds.astype(seeds_type)
+    seeds = cupy.asarray(seeds.astype(seeds_type).values)
+
+    # Seeds with shared neighborhoods are extracted together, but repeated
+    # seeds would also be extracted repeatedly, so only extract each once.
+    unique_seeds, inverse = cupy.unique(seeds, return_inverse=True)
 
     do_expensive_check = False
     source, destination, weight, offset = pylibcugraph_ego_graph(
         resource_handle=ResourceHandle(),
         graph=G._plc_graph,
-        source_vertices=seeds,
+        source_vertices=unique_seeds,
         radius=radius,
         do_expensive_check=do_expensive_check,
     )
 
-    offsets = cudf.Series(offset)
+    offset = cupy.asarray(offset, dtype="int64")
+    # The edges of the subgraph of seeds[i] are those of unique_seeds[inverse[i]]
+    lengths = (offset[1:] - offset[:-1])[inverse]
+    offsets = cupy.zeros(len(seeds) + 1, dtype="int64")
+    cupy.cumsum(lengths, out=offsets[1:])
+    positions = cupy.arange(int(offsets[-1]))
+    seed_index = cupy.searchsorted(offsets, positions, side="right") - 1
+    edges = offset[inverse[seed_index]] + positions - offsets[seed_index]
 
     df = cudf.DataFrame()
-    df["src"] = source
-    df["dst"] = destination
-    df["weight"] = weight
+    df["src"] = cupy.asarray(source)[edges]
+    df["dst"] = cupy.asarray(destination)[edges]
+    if weight is not None:
+        df["weight"] = cupy.asarray(weight)[edges]
 
     if G.renumbered:
         df = G.unrenumber(df, "src", preserve_order=True)
         df = G.unrenumber(df, "dst", preserve_order=True)
 
-    return _convert_df_series_to_output_type(df, offsets, input_type)
+    return _convert_df_series_to_output_type(df, cudf.Series(offsets), input_type)
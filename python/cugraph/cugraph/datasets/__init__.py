@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -17,6 +17,7 @@ from pathlib import Path
 from cugraph.datasets.dataset import (
     Dataset,
     download_all,
+    cache_all,
     set_download_dir,
     get_download_dir,
     default_download_dir,
@@ -0,0 +1,49 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+
+from cugraph.datasets import cache_all, get_download_dir, set_download_dir
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description="Pre-warm the cache of parsed dataset edgelists used by "
+        "Dataset.get_edgelist(cache=True) and Dataset.get_dask_edgelist(cache=True)."
+    )
+    arg_parser.add_argument(
+        "--download-dir",
+        type=str,
+        default=None,
+        help="directory containing the datafiles. Default is "
+        "$RAPIDS_DATASET_ROOT_DIR, or ~/.cugraph/datasets if not set",
+    )
+    arg_parser.add_argument(
+        "--download",
+        action="store_true",
+        help="download datafiles that are not present instead of skipping them",
+    )
+    args = arg_parser.parse_args()
+
+    if args.download_dir is not None:
+        set_download_dir(args.download_dir)
+
+    print(f"Caching datasets in {get_download_dir()}...", flush=True)
+    cached = cache_all(download=args.download)
+    for name in cached:
+        print(f"  {name}")
+    print(f"done, {len(cached)} datasets cached.")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,13 +15,28 @@ import cudf
 import dask_cudf
 import yaml
 import os
+import json
+import shutil
+import hashlib
+import tempfile
+import warnings
+import numpy as np
 import pandas as pd
 import cugraph.dask as dcg
+from dask import delayed
 from pathlib import Path
 import urllib.request
 from cugraph.structure.graph_classes import Graph
 
 
+# Increment when the layout of cached edgelists changes, so existing caches
+# are not used.
+_cache_format_version = 1
+# The metadata fields that affect how a datafile is parsed, and therefore
+# which are part of the key of a cached edgelist.
+_cache_metadata_keys = ("delim", "header", "col_names", "col_types")
+
+
 class DefaultDownloadDir:
     """
     Maintains a path to be used as a default download directory.
@@ -161,7 +176,140 @@ class Dataset:
         """
         self._edgelist = None
 
-    def get_edgelist(self, download=False, reader="cudf"):
+    def get_cache_path(self):
+        """
+        Returns the location of the cached, parsed copy of the dataset file,
+        which is in a "cache" directory beside the dataset file. The name of
+        the cache includes a checksum of the dataset file contents and of the
+        metadata used to parse it, so a changed file or metadata is never read
+        from a stale cache.
+
+        The dataset file must exist.
+        """
+        full_path = self.get_path()
+        cache_root = full_path.parent / "cache"
+
+        # Hashing a large datafile takes a while, so save the checksum along
+        # with the size and modification time of the file it was computed from,
+        # and only recompute it if those change.
+        stat = full_path.stat()
+        checksum_file = cache_root / f"{full_path.name}.sha256.json"
+        csv_checksum = None
+        try:
+            saved = json.loads(checksum_file.read_text())
+            if (saved["size"], saved["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                csv_checksum = saved["sha256"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        if csv_checksum is None:
+            csv_hash = hashlib.sha256()
+            with open(full_path, "rb") as csv_file:
+                for block in iter(lambda: csv_file.read(2**24), b""):
+                    csv_hash.update(block)
+            csv_checksum = csv_hash.hexdigest()
+            try:
+                cache_root.mkdir(parents=True, exist_ok=True)
+                checksum_file.write_text(
+                    json.dumps(
+                        {
+                            "size": stat.st_size,
+                            "mtime_ns": stat.st_mtime_ns,
+                            "sha256": csv_checksum,
+                        }
+                    )
+                )
+            except OSError:
+                pass
+
+        cache_key = hashlib.sha256(
+            json.dumps(
+                {
+                    "version": _cache_format_version,
+                    "sha256": csv_checksum,
+                    "metadata": {k: self.metadata[k] for k in _cache_metadata_keys},
+                },
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+
+        return cache_root / f"{self.metadata['name']}-{cache_key[:16]}"
+
+    def __can_cache(self):
+        """
+        Returns True if every column of the dataset is numeric. Only numeric
+        columns can be saved as memory-mappable arrays, so datasets with string
+        columns are always parsed from the CSV.
+        """
+        for dtype in self.metadata["col_types"]:
+            try:
+                if np.dtype(dtype).kind not in "biuf":
+                    return False
+            except TypeError:
+                # eg. "string", which is not a numpy dtype
+                return False
+        return True
+
+    def __read_cached_columns(self, cache_path):
+        """
+        Returns a dictionary of column names to memory-mapped numpy arrays
+        containing the cached edgelist at cache_path, or None if there is no
+        valid cache there.
+        """
+        try:
+            manifest = json.loads((cache_path / "manifest.json").read_text())
+            num_rows = manifest["num_rows"]
+            columns = {}
+            for i, (name, dtype) in enumerate(
+                zip(self.metadata["col_names"], self.metadata["col_types"])
+            ):
+                values = np.load(cache_path / f"col{i}.npy", mmap_mode="r")
+                if values.dtype != np.dtype(dtype) or len(values) != num_rows:
+                    return None
+                columns[name] = values
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return columns
+
+    def __write_cached_columns(self, cache_path, columns):
+        """
+        Saves the columns (a dictionary of column names to numpy arrays) of a
+        parsed edgelist to cache_path. The cache is written to a temporary
+        directory that is renamed when complete, so concurrent readers never
+        see a partially-written cache. Errors are reported as warnings, since
+        the edgelist can still be used without being cached.
+        """
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = Path(tempfile.mkdtemp(dir=cache_path.parent, prefix=".tmp-"))
+            for i, name in enumerate(self.metadata["col_names"]):
+                np.save(tmp_path / f"col{i}.npy", columns[name])
+            (tmp_path / "manifest.json").write_text(
+                json.dumps(
+                    {
+                        "name": self.metadata["name"],
+                        "num_rows": len(columns[self.metadata["col_names"][0]]),
+                        "col_names": self.metadata["col_names"],
+                        "col_types": self.metadata["col_types"],
+                    }
+                )
+            )
+            # An existing cache here could not be read, so replace it
+            if cache_path.exists():
+                shutil.rmtree(cache_path)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except OSError as e:
+            # Another process may have written the same cache first
+            if self.__read_cached_columns(cache_path) is None:
+                warnings.warn(f"Could not cache the edgelist at {cache_path}: {e}")
+        finally:
+            if tmp_path is not None:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def get_edgelist(self, download=False, reader="cudf", cache=False):
         """
         Return an Edgelist.
 
@@ -173,7 +321,14 @@ class Dataset:
 
         reader : 'cudf' or 'pandas' (default='cudf')
             The library used to read a CSV and return an edgelist DataFrame.
+
+        cache : Boolean (default=False)
+            If True, read the edgelist from memory-mapped binary files cached
+            by a prior call (see get_cache_path()) instead of parsing the CSV,
+            or cache it there after parsing the CSV if not yet cached. Datasets
+            with string columns are not cached.
         """
+        cache = cache and self.__can_cache()
         if self._edgelist is None or not isinstance(self._edgelist, cudf.DataFrame):
             full_path = self.get_path()
             if not full_path.is_file():
@@ -200,20 +355,39 @@ class Dataset:
                      cudf.read_csv"
                 )
 
-            self._edgelist = self.__reader(
-                filepath_or_buffer=full_path,
-                delimiter=self.metadata["delim"],
-                names=self.metadata["col_names"],
-                dtype={
-                    self.metadata["col_names"][i]: self.metadata["col_types"][i]
-                    for i in range(len(self.metadata["col_types"]))
-                },
-                header=header,
-            )
+            columns = None
+            if cache:
+                cache_path = self.get_cache_path()
+                columns = self.__read_cached_columns(cache_path)
+
+            if columns is not None:
+                if reader == "cudf":
+                    self._edgelist = cudf.DataFrame(columns)
+                else:
+                    self._edgelist = pd.DataFrame(columns, copy=False)
+            else:
+                self._edgelist = self.__reader(
+                    filepath_or_buffer=full_path,
+                    delimiter=self.metadata["delim"],
+                    names=self.metadata["col_names"],
+                    dtype={
+                        self.metadata["col_names"][i]: self.metadata["col_types"][i]
+                        for i in range(len(self.metadata["col_types"]))
+                    },
+                    header=header,
+                )
+                if cache:
+                    self.__write_cached_columns(
+                        cache_path,
+                        {
+                            name: self._edgelist[name].to_numpy()
+                            for name in self.metadata["col_names"]
+                        },
+                    )
 
         return self._edgelist.copy()
 
-    def get_dask_edgelist(self, download=False):
+    def get_dask_edgelist(self, download=False, cache=False):
         """
         Return a distributed Edgelist.
 
@@ -222,7 +396,14 @@ class Dataset:
         download : Boolean (default=False)
             Automatically download the dataset from the 'url' location within
             the YAML file.
+
+        cache : Boolean (default=False)
+            If True, read the partitions of the edgelist from memory-mapped
+            binary files cached by a prior call (see get_cache_path()) instead
+            of parsing the CSV, or cache it there after parsing the CSV if not
+            yet cached. Datasets with string columns are not cached.
         """
+        cache = cache and self.__can_cache()
         if self._edgelist is None or not isinstance(
             self._edgelist, dask_cudf.DataFrame
         ):
@@ -242,20 +423,64 @@ class Dataset:
                 header = self.metadata["header"]
 
             blocksize = dcg.get_chunksize(full_path)
-            self._edgelist = dask_cudf.read_csv(
-                path=full_path,
-                blocksize=blocksize,
-                delimiter=self.metadata["delim"],
-                names=self.metadata["col_names"],
-                dtype={
-                    self.metadata["col_names"][i]: self.metadata["col_types"][i]
-                    for i in range(len(self.metadata["col_types"]))
-                },
-                header=header,
-            )
+
+            columns = None
+            if cache:
+                cache_path = self.get_cache_path()
+                columns = self.__read_cached_columns(cache_path)
+
+            if columns is not None:
+                self._edgelist = self.__get_dask_edgelist_from_cache(
+                    cache_path, columns, blocksize
+                )
+            else:
+                self._edgelist = dask_cudf.read_csv(
+                    path=full_path,
+                    blocksize=blocksize,
+                    delimiter=self.metadata["delim"],
+                    names=self.metadata["col_names"],
+                    dtype={
+                        self.metadata["col_names"][i]: self.metadata["col_types"][i]
+                        for i in range(len(self.metadata["col_types"]))
+                    },
+                    header=header,
+                )
+                if cache:
+                    # Compute once; each column computed separately would read
+                    # and parse the whole file again
+                    df = self._edgelist.compute()
+                    self.__write_cached_columns(
+                        cache_path,
+                        {
+                            name: df[name].to_numpy()
+                            for name in self.metadata["col_names"]
+                        },
+                    )
 
         return self._edgelist.copy()
 
+    def __get_dask_edgelist_from_cache(self, cache_path, columns, blocksize):
+        """
+        Returns a dask_cudf DataFrame whose partitions are each read by the
+        worker computing it from a slice of the memory-mapped cached columns,
+        with partitions of about blocksize bytes.
+        """
+        col_names = self.metadata["col_names"]
+        num_rows = len(columns[col_names[0]])
+        row_nbytes = sum(values.dtype.itemsize for values in columns.values())
+        rows_per_partition = max(1, blocksize // row_nbytes)
+
+        meta = cudf.DataFrame(
+            {name: cudf.Series([], dtype=col.dtype) for name, col in columns.items()}
+        )
+        partitions = [
+            delayed(_read_cached_partition)(
+                cache_path, col_names, start, min(start + rows_per_partition, num_rows)
+            )
+            for start in range(0, max(num_rows, 1), rows_per_partition)
+        ]
+        return dask_cudf.from_delayed(partitions, meta=meta)
+
     def get_graph(
         self,
         download=False,
@@ -459,6 +684,50 @@ def download_all(force=False):
                     urllib.request.urlretrieve(meta["url"], str(save_to))
 
 
+def _read_cached_partition(cache_path, col_names, start, stop):
+    """
+    Returns a cudf DataFrame of rows [start, stop) of the cached edgelist
+    columns at cache_path.
+    """
+    return cudf.DataFrame(
+        {
+            name: np.load(cache_path / f"col{i}.npy", mmap_mode="r")[start:stop]
+            for i, name in enumerate(col_names)
+        }
+    )
+
+
+def cache_all(download=False):
+    """
+    Looks in `metadata` directory and caches a parsed copy of the datafile of
+    each dataset, so later calls to get_edgelist(cache=True) and
+    get_dask_edgelist(cache=True) do not need to parse the datafiles.
+    Datafiles that have not been downloaded are skipped unless download is
+    True.
+
+    Parameters
+    download : Boolean (default=False)
+        Download datafiles that are not present.
+
+    Returns
+    -------
+    cached : list of str
+        The names of the datasets that were cached.
+    """
+    cached = []
+    meta_path = Path(__file__).parent.absolute() / "metadata"
+    for file in sorted(meta_path.iterdir()):
+        if file.suffix == ".yaml":
+            dataset = Dataset(meta_path / file)
+            if not (download or dataset.get_path().is_file()):
+                continue
+            dataset.get_edgelist(download=download, cache=True)
+            dataset.unload()
+            cached.append(dataset.metadata["name"])
+
+    return cached
+
+
 def set_download_dir(path):
     """
     Set the download location for datasets
@@ -1,4 +1,4 @@
-# Copyright (c) 2023, NVIDIA CORPORATION.
+# Copyright (c) 2023-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -12,10 +12,13 @@
 # limitations under the License.
 
 import os
+import queue
+import threading
 
-from typing import Union
+from typing import Dict, Union
 
 import cudf
+import cupy
 import dask_cudf
 
 from dask.distributed import wait
@@ -58,6 +61,7 @@ class BulkSampler:
         batches_per_partition: int = 100,
         renumber: bool = False,
         log_level: int = None,
+        write_queue_size: int = 0,
         **kwargs,
     ):
         """
@@ -83,6 +87,15 @@ class BulkSampler:
             Whether to enable logging for this sampler. Supports 3 levels
             of logging if enabled (INFO, WARNING, ERROR).  If not provided,
             defaults to WARNING.
+        write_queue_size: int (optional, default=0)
+            The number of sampled windows (of seeds_per_call seeds) that can
+            wait to be written to parquet by a background thread while the
+            next window is sampled.  If 0, each window is written before the
+            next one is sampled.  If greater than 0, up to
+            write_queue_size + 2 windows of results (those waiting, the one
+            being written, and the one being sampled) are held in GPU memory
+            at once, instead of one.  Only used for single-GPU graphs; with
+            dask, writes are already distributed across workers.
         kwargs: kwargs
             Keyword arguments to be passed to the sampler (i.e. fanout).
         """
@@ -110,6 +123,19 @@ class BulkSampler:
         self.__batches = None
         self.__sample_call_args = kwargs
 
+        if write_queue_size < 0:
+            raise ValueError("write_queue_size must be non-negative")
+        self.__write_queue_size = write_queue_size
+        self.__write_queue = None
+        self.__write_thread = None
+        self.__write_error = None
+
+        self.__num_windows = 0
+        self.__calc_batches_time = 0.0
+        self.__sample_time = 0.0
+        self.__write_time = 0.0
+        self.__write_wait_time = 0.0
+
     @property
     def seeds_per_call(self) -> int:
         return self.__seeds_per_call
@@ -126,6 +152,24 @@ class BulkSampler:
     def renumber(self) -> bool:
         return self.__renumber
 
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Returns a dictionary of sampler statistics, accumulated over all
+        calls to flush(): the number of windows sampled, the time in seconds
+        spent calculating the batches of each window, sampling, and writing
+        to parquet (in the background if write_queue_size > 0), and the
+        time in seconds flush() spent waiting on writes (the write stall
+        time).
+        """
+        return {
+            "num_windows": self.__num_windows,
+            "calc_batches_time": self.__calc_batches_time,
+            "sample_time": self.__sample_time,
+            "write_time": self.__write_time,
+            "write_wait_time": self.__write_wait_time,
+        }
+
     @property
     def size(self) -> int:
         if self.__batches is None:
@@ -212,6 +256,48 @@ class BulkSampler:
         if self.size == 0:
             return
 
+        use_writer = self.__write_queue_size > 0 and not isinstance(
+            self.__batches, dask_cudf.DataFrame
+        )
+        if use_writer:
+            self.__start_writer()
+
+        try:
+            while self.size > 0:
+                samples, offsets, renumber_map = self.__sample_next_window()
+                if use_writer:
+                    self.__enqueue_write(samples, offsets, renumber_map)
+                else:
+                    self.__write_window(samples, offsets, renumber_map)
+                del samples
+                del offsets
+                del renumber_map
+
+                current_size = self.size
+                if current_size > 0:
+                    self.__logger.info(
+                        f"There are still {current_size} samples remaining, "
+                        "sampling the next window..."
+                    )
+        except BaseException as e:
+            if use_writer:
+                try:
+                    self.__stop_writer()
+                except BaseException as write_error:
+                    # Keep the error that stopped sampling; don't replace it
+                    if write_error is not e:
+                        raise e from write_error
+            raise
+
+        if use_writer:
+            self.__stop_writer()
+
+    def __sample_next_window(self):
+        """
+        Samples the next window of batches (up to seeds_per_call seeds)
+        and removes them from the batches to sample.  Returns the samples,
+        offsets, and renumber map (None if not renumbering).
+        """
         start_time_calc_batches = time.perf_counter()
         if isinstance(self.__batches, dask_cudf.DataFrame):
             self.__batches = self.__batches.persist()
@@ -237,6 +323,7 @@ class BulkSampler:
             batch_id_filter = batch_id_filter.persist()
 
         end_time_calc_batches = time.perf_counter()
+        self.__calc_batches_time += end_time_calc_batches - start_time_calc_batches
         self.__logger.info(
             f"Calculated batches to sample; min = {min_batch_id}"
             f" and max = {max_batch_id};"
@@ -280,6 +367,8 @@ class BulkSampler:
 
         end_time_sample_call = time.perf_counter()
         sample_runtime = end_time_sample_call - start_time_sample_call
+        self.__sample_time += sample_runtime
+        self.__num_windows += 1
 
         self.__logger.info(
             f"Called uniform neighbor sample, took {sample_runtime:.4f} s"
@@ -291,11 +380,22 @@ class BulkSampler:
         if isinstance(self.__batches, dask_cudf.DataFrame):
             self.__batches = self.__batches.persist()
 
+        return samples, offsets, renumber_map
+
+    def __write_window(
+        self,
+        samples: Union[cudf.DataFrame, dask_cudf.DataFrame],
+        offsets: Union[cudf.DataFrame, dask_cudf.DataFrame],
+        renumber_map: Union[cudf.DataFrame, dask_cudf.DataFrame],
+    ) -> None:
+        """
+        Writes a sampled window to parquet and releases its results.
+        """
         start_time_write = time.perf_counter()
 
         # Write batches to parquet
         self.__write(samples, offsets, renumber_map)
-        if isinstance(self.__batches, dask_cudf.DataFrame):
+        if isinstance(samples, dask_cudf.DataFrame):
             futures = [f.release() for f in futures_of(samples)] + [
                 f.release() for f in futures_of(offsets)
             ]
@@ -303,22 +403,65 @@ class BulkSampler:
                 futures += [f.release() for f in futures_of(renumber_map)]
             wait(futures)
 
-        del samples
-        del offsets
-        if renumber_map is not None:
-            del renumber_map
-
         end_time_write = time.perf_counter()
         write_runtime = end_time_write - start_time_write
+        self.__write_time += write_runtime
         self.__logger.info(f"Wrote samples to parquet, took {write_runtime} seconds")
 
-        current_size = self.size
-        if current_size > 0:
-            self.__logger.info(
-                f"There are still {current_size} samples remaining, "
-                "calling flush() again..."
-            )
-            self.flush()
+    def __start_writer(self):
+        self.__write_queue = queue.Queue(maxsize=self.__write_queue_size)
+        self.__write_error = None
+        self.__write_thread = threading.Thread(
+            target=self.__write_windows,
+            args=(cupy.cuda.runtime.getDevice(),),
+            daemon=True,
+        )
+        self.__write_thread.start()
+
+    def __write_windows(self, device: int):
+        """
+        Writes the windows put in self.__write_queue until None is put.
+        The first error raised while writing is kept to be raised by
+        flush(); later windows are discarded.
+        """
+        cupy.cuda.runtime.setDevice(device)
+        while True:
+            window = self.__write_queue.get()
+            if window is None:
+                return
+            if self.__write_error is None:
+                try:
+                    self.__write_window(*window)
+                except BaseException as e:
+                    self.__write_error = e
+            del window
+
+    def __enqueue_write(self, samples, offsets, renumber_map):
+        """
+        Hands a sampled window to the background writer, blocking while
+        write_queue_size windows are already waiting to be written.
+        """
+        if self.__write_error is not None:
+            raise self.__write_error
+        start_time = time.perf_counter()
+        self.__write_queue.put((samples, offsets, renumber_map))
+        self.__write_wait_time += time.perf_counter() - start_time
+
+    def __stop_writer(self):
+        """
+        Waits for the background writer to write all queued windows, and
+        raises the first error it encountered, if any.
+        """
+        start_time = time.perf_counter()
+        self.__write_queue.put(None)
+        self.__write_thread.join()
+        self.__write_wait_time += time.perf_counter() - start_time
+
+        self.__write_queue = None
+        self.__write_thread = None
+        error, self.__write_error = self.__write_error, None
+        if error is not None:
+            raise error
 
     def __write(
         self,
@@ -13,6 +13,10 @@
 
 import os
 import re
+import time
+import bisect
+import queue
+import threading
 import warnings
 from math import ceil
 from functools import reduce
@@ -21,6 +25,7 @@ import pylibcugraph
 import numpy as np
 import cupy
 import cudf
+import pyarrow.parquet
 
 from typing import Union, List, Dict, Tuple, Iterator, Optional
 
@@ -28,10 +33,18 @@ from cugraph.utilities.utils import import_optional, MissingModule
 from cugraph.gnn.comms import cugraph_comms_get_raft_handle
 
 from cugraph.gnn.data_loading.bulk_sampler_io import create_df_from_disjoint_arrays
+from cugraph.gnn.data_loading.indexed_sample_io import (
+    SUPPORTED_COMPRESSION,
+    write_indexed_partition,
+    read_indexed_footer,
+    read_indexed_batches,
+)
 
 torch = MissingModule("torch")
 TensorType = Union["torch.Tensor", cupy.ndarray, cudf.Series]
 
+SUPPORTED_FORMATS = ("parquet", "indexed")
+
 
 class DistSampleReader:
     def __init__(
@@ -41,18 +54,66 @@ class DistSampleReader:
         format: str = "parquet",
         rank: Optional[int] = None,
         filelist=None,
+        prefetch: int = 0,
+        pin_memory: bool = False,
     ):
+        """
+        Parameters
+        ----------
+        directory: str (required)
+            The directory where samples were written.
+        format: str (optional, default='parquet')
+            The file format of the files containing the sampled
+            minibatches, either 'parquet' or 'indexed'.  Only the
+            'indexed' format supports reading individual batches
+            with read_batch.
+        rank: int (optional, default=None)
+            If provided, only the partitions written by this rank
+            are read.
+        filelist: list (optional, default=None)
+            The partitions to read.  If not provided, all partitions
+            in the directory are read.
+        prefetch: int (optional, default=0)
+            The number of partitions to load ahead of the partition
+            being returned, using a background thread.  If 0, each
+            partition is loaded when it is requested.
+        pin_memory: bool (optional, default=False)
+            Only used if prefetch > 0.  If True, prefetched partitions
+            are staged in pinned host memory and copied to the device
+            when they are requested, rather than held on the device.
+        """
         torch = import_optional("torch")
 
         self.__format = format
         self.__directory = directory
 
-        if format != "parquet":
-            raise ValueError("Invalid format (currently supported: 'parquet')")
+        self.__prefetch = prefetch
+        self.__pin_memory = pin_memory
+        self.__queue = None
+        self.__thread = None
+        self.__stop_event = threading.Event()
+        # Set once the prefetch thread has put its last item (None or an
+        # error) in the queue, since nothing else will be put after it
+        self.__prefetch_done = False
+        self.__prefetch_end = None
+        self.__num_partitions_read = 0
+        self.__read_time = 0.0
+        self.__stall_time = 0.0
+
+        self.__footers = {}
+
+        if format not in SUPPORTED_FORMATS:
+            raise ValueError(
+                "Invalid format (currently supported: 'parquet', 'indexed')"
+            )
+        if prefetch < 0:
+            raise ValueError("prefetch must be non-negative")
 
         if filelist is None:
             files = os.listdir(directory)
-            ex = re.compile(r"batch\=([0-9]+)\.([0-9]+)\-([0-9]+)\.([0-9]+)\.parquet")
+            ex = re.compile(
+                r"batch\=([0-9]+)\.([0-9]+)\-([0-9]+)\.([0-9]+)\." + format + "$"
+            )
             filematch = [ex.match(f) for f in files]
             filematch = [f for f in filematch if f]
 
@@ -66,6 +127,13 @@ class DistSampleReader:
         else:
             self.__files = list(filelist)
 
+        # Files by first batch id, to find the file holding a given batch
+        self.__file_index = sorted((int(f[2]), int(f[4]), f[0]) for f in self.__files)
+        # Each rank numbers its batches separately, so batch ids may repeat
+        self.__unique_batch_ids = all(
+            prev[1] < f[0] for prev, f in zip(self.__file_index, self.__file_index[1:])
+        )
+
         if rank is None:
             self.__batch_count = batch_count
         else:
@@ -73,35 +141,229 @@ class DistSampleReader:
             torch.distributed.all_reduce(batch_count, torch.distributed.ReduceOp.MIN)
             self.__batch_count = int(batch_count)
 
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Returns a dictionary of reader statistics: the number of
+        partitions read, the time in seconds spent reading them
+        (in the background if prefetching), and the time in seconds
+        the caller spent waiting on the reader in __next__ (the
+        stall time).
+        """
+        return {
+            "num_partitions_read": self.__num_partitions_read,
+            "read_time": self.__read_time,
+            "stall_time": self.__stall_time,
+        }
+
+    def close(self):
+        """
+        Stops prefetching, if it was started.  Partitions not yet
+        returned are discarded.
+        """
+        if self.__thread is not None:
+            self.__stop_event.set()
+            # Unblock the prefetch thread if it is waiting on a full queue
+            while self.__thread.is_alive():
+                try:
+                    self.__queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            self.__thread.join()
+            self.__thread = None
+
+    def __del__(self):
+        self.close()
+
     def __iter__(self):
         return self
 
     def __next__(self):
         torch = import_optional("torch")
 
-        if len(self.__files) > 0:
-            f = self.__files.pop()
-            fname = f[0]
-            start_inclusive = int(f[2])
-            end_inclusive = int(f[4])
-
-            if (end_inclusive - start_inclusive + 1) > self.__batch_count:
-                end_inclusive = start_inclusive + self.__batch_count - 1
-                self.__batch_count = 0
+        start_time = time.perf_counter()
+        try:
+            if self.__prefetch == 0:
+                partition = self.__read_next_partition()
+            elif self.__prefetch_done:
+                partition = self.__prefetch_end
             else:
-                self.__batch_count -= end_inclusive - start_inclusive + 1
+                if self.__thread is None:
+                    self.__start_prefetch()
+                partition = self.__queue.get()
+                if partition is None or isinstance(partition, BaseException):
+                    self.__prefetch_done = True
+                    self.__prefetch_end = partition
+
+            if isinstance(partition, BaseException):
+                raise partition
+
+            if partition is None:
+                raise StopIteration
+
+            tensors, start_inclusive, end_inclusive = partition
+            if self.__prefetch > 0 and self.__pin_memory:
+                tensors = {
+                    col: t.to("cuda", non_blocking=True) for col, t in tensors.items()
+                }
+                torch.cuda.current_stream().synchronize()
+
+            return tensors, start_inclusive, end_inclusive
+        finally:
+            self.__stall_time += time.perf_counter() - start_time
 
-            df = cudf.read_parquet(os.path.join(self.__directory, fname))
-            tensors = {}
+    def __start_prefetch(self):
+        torch = import_optional("torch")
+
+        self.__queue = queue.Queue(maxsize=self.__prefetch)
+        self.__thread = threading.Thread(
+            target=self.__prefetch_partitions,
+            args=(torch.cuda.current_device(),),
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def __prefetch_partitions(self, device: int):
+        """
+        Reads partitions into self.__queue until all partitions are read
+        (then puts None) or close() is called.  Any error raised while
+        reading is put in the queue, to be raised by __next__.
+        """
+        torch = import_optional("torch")
+        torch.cuda.set_device(device)
+
+        while not self.__stop_event.is_set():
+            try:
+                partition = self.__read_next_partition()
+            except BaseException as e:
+                partition = e
+
+            # Use a timeout so close() is noticed if the queue stays full
+            while not self.__stop_event.is_set():
+                try:
+                    self.__queue.put(partition, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+            if partition is None or isinstance(partition, BaseException):
+                return
+
+    def __read_next_partition(
+        self,
+    ) -> Optional[Tuple[Dict[str, "torch.Tensor"], int, int]]:
+        """
+        Reads the next partition.  Returns the dictionary of non-empty
+        columns as tensors, and the first and last batch ids in the
+        partition, or None if all partitions have been read.
+        """
+        torch = import_optional("torch")
+
+        if len(self.__files) == 0:
+            return None
+
+        start_time = time.perf_counter()
+
+        f = self.__files.pop()
+        fname = f[0]
+        start_inclusive = int(f[2])
+        end_inclusive = int(f[4])
+
+        if (end_inclusive - start_inclusive + 1) > self.__batch_count:
+            end_inclusive = start_inclusive + self.__batch_count - 1
+            self.__batch_count = 0
+        else:
+            self.__batch_count -= end_inclusive - start_inclusive + 1
+
+        path = os.path.join(self.__directory, fname)
+        pinned = self.__prefetch > 0 and self.__pin_memory
+        tensors = {}
+        if self.__format == "indexed":
+            # Only the batches that will be returned are read
+            tensors = self.__read_indexed_batches(
+                path, 0, end_inclusive - start_inclusive, pinned=pinned
+            )
+        elif pinned:
+            table = pyarrow.parquet.read_table(path)
+            for col in table.column_names:
+                values = table.column(col).drop_null().to_numpy()
+                if len(values) > 0:
+                    # Arrow-backed arrays are read-only, which torch doesn't support
+                    values = np.array(values, copy=True)
+                    tensors[col] = torch.from_numpy(values).pin_memory()
+        else:
+            df = cudf.read_parquet(path)
             for col in list(df.columns):
                 s = df[col].dropna()
                 if len(s) > 0:
                     tensors[col] = torch.as_tensor(s, device="cuda")
                 df.drop(col, axis=1, inplace=True)
 
-            return tensors, start_inclusive, end_inclusive
+        if self.__prefetch > 0 and not pinned:
+            # Make sure the tensors are ready before they are handed off
+            # to the thread calling __next__
+            torch.cuda.current_stream().synchronize()
+
+        self.__num_partitions_read += 1
+        self.__read_time += time.perf_counter() - start_time
 
-        raise StopIteration
+        return tensors, start_inclusive, end_inclusive
+
+    def __read_indexed_batches(
+        self, path: str, start: int, end: int, *, pinned: bool = False
+    ) -> Dict[str, "torch.Tensor"]:
+        """
+        Reads batches start through end (inclusive, counted from the
+        first batch in the file) of an indexed file as tensors.
+        """
+        torch = import_optional("torch")
+
+        footer = self.__footers.get(path)
+        if footer is None:
+            footer = self.__footers[path] = read_indexed_footer(path)
+
+        arrays = read_indexed_batches(path, footer, start, end)
+        if pinned:
+            # The arrays may be read-only, which torch doesn't support
+            return {
+                col: torch.from_numpy(np.array(values, copy=True)).pin_memory()
+                for col, values in arrays.items()
+            }
+        return {
+            col: torch.as_tensor(values, device="cuda")
+            for col, values in arrays.items()
+        }
+
+    def read_batch(self, batch_id: int) -> Tuple[Dict[str, "torch.Tensor"], int, int]:
+        """
+        Reads a single batch without reading the rest of its partition,
+        i.e. to resume training from a given batch or to visit batches
+        in a different order.  Iteration over the partitions is not
+        affected.  Only supported for the 'indexed' format.
+
+        Returns the dictionary of non-empty columns of the batch as
+        tensors, and the batch id as both the first and last batch id,
+        matching the values returned when iterating over the reader.
+        The offsets columns keep their values from the partition, so
+        they are rebased the same way as when reading a partition.
+        """
+        if self.__format != "indexed":
+            raise ValueError("read_batch requires the 'indexed' format")
+        if not self.__unique_batch_ids:
+            raise ValueError(
+                "Batch ids are ambiguous when reading the batches of several "
+                "ranks; pass a rank to read only the batches of that rank"
+            )
+
+        i = bisect.bisect_right(self.__file_index, (batch_id, float("inf"))) - 1
+        if i < 0 or self.__file_index[i][1] < batch_id:
+            raise IndexError(f"Batch {batch_id} was not found in {self.__directory}")
+        start_inclusive, end_inclusive, fname = self.__file_index[i]
+
+        path = os.path.join(self.__directory, fname)
+        local_id = batch_id - start_inclusive
+        tensors = self.__read_indexed_batches(path, local_id, local_id)
+        return tensors, batch_id, batch_id
 
 
 class DistSampleWriter:
@@ -111,6 +373,7 @@ class DistSampleWriter:
         *,
         batches_per_partition: int = 256,
         format: str = "parquet",
+        compression: Optional[str] = None,
     ):
         """
         Parameters
@@ -122,13 +385,27 @@ class DistSampleWriter:
             The number of batches to write in a single file.
         format: str (optional, default='parquet')
             The file format of the output files containing the
-            sampled minibatches.  Currently, only parquet format
-            is supported.
+            sampled minibatches, either 'parquet' or 'indexed'.
+            The 'indexed' format stores an index of the batches
+            in each file, so single batches can be read without
+            reading the rest of the file, and delta encodes the
+            offsets and narrows the integer columns of each batch.
+        compression: str (optional, default=None)
+            Only used if format is 'indexed'.  The compression
+            applied to each column of each batch: None, 'zlib',
+            or 'zstd' (requires the zstandard package).
         """
-        if format != "parquet":
-            raise ValueError("Invalid format (currently supported: 'parquet')")
+        if format not in SUPPORTED_FORMATS:
+            raise ValueError(
+                "Invalid format (currently supported: 'parquet', 'indexed')"
+            )
+        if compression not in SUPPORTED_COMPRESSION:
+            raise ValueError(
+                "Invalid compression (currently supported: None, 'zlib', 'zstd')"
+            )
 
         self.__format = format
+        self.__compression = compression
         self.__directory = directory
         self.__batches_per_partition = batches_per_partition
 
@@ -145,14 +422,21 @@ class DistSampleWriter:
         return self.__batches_per_partition
 
     def get_reader(
-        self, rank: int
+        self, rank: int, *, prefetch: int = 0, pin_memory: bool = False
     ) -> Iterator[Tuple[Dict[str, "torch.Tensor"], int, int]]:
         """
         Returns an iterator over sampled data.
+        See DistSampleReader for the prefetch and pin_memory options.
         """
 
         # currently only disk reading is supported
-        return DistSampleReader(self._directory, format=self._format, rank=rank)
+        return DistSampleReader(
+            self._directory,
+            format=self._format,
+            rank=rank,
+            prefetch=prefetch,
+            pin_memory=pin_memory,
+        )
 
     def __write_minibatches_coo(self, minibatch_dict):
         has_edge_ids = minibatch_dict["edge_id"] is not None
@@ -218,7 +502,10 @@ class DistSampleWriter:
                 renumber_map_start_ix:renumber_map_end_ix
             ]
 
-            results_dataframe_p = create_df_from_disjoint_arrays(
+            end_batch_id = start_batch_id + len(batch_id_array_p) - 1
+            rank = minibatch_dict["rank"] if "rank" in minibatch_dict else 0
+
+            self.__write_partition(
                 {
                     "majors": majors_array_p,
                     "minors": minors_array_p,
@@ -228,23 +515,11 @@ class DistSampleWriter:
                     "edge_id": edge_id_array_p,
                     "edge_type": edge_type_array_p,
                     "renumber_map_offsets": renumber_map_offsets_array_p,
-                }
-            )
-
-            end_batch_id = start_batch_id + len(batch_id_array_p) - 1
-            rank = minibatch_dict["rank"] if "rank" in minibatch_dict else 0
-
-            full_output_path = os.path.join(
-                self.__directory,
-                f"batch={rank:05d}.{start_batch_id:08d}-"
-                f"{rank:05d}.{end_batch_id:08d}.parquet",
-            )
-
-            results_dataframe_p.to_parquet(
-                full_output_path,
-                compression=None,
-                index=False,
-                force_nullable_schema=True,
+                },
+                rank,
+                start_batch_id,
+                end_batch_id,
+                fanout_length,
             )
 
     def __write_minibatches_csr(self, minibatch_dict):
@@ -322,7 +597,10 @@ class DistSampleWriter:
                 renumber_map_start_ix:renumber_map_end_ix
             ]
 
-            results_dataframe_p = create_df_from_disjoint_arrays(
+            end_batch_id = start_batch_id + len(batch_id_array_p) - 1
+            rank = minibatch_dict["rank"] if "rank" in minibatch_dict else 0
+
+            self.__write_partition(
                 {
                     "major_offsets": major_offsets_array_p,
                     "minors": minors_array_p,
@@ -332,18 +610,36 @@ class DistSampleWriter:
                     "edge_id": edge_id_array_p,
                     "edge_type": edge_type_array_p,
                     "renumber_map_offsets": renumber_map_offsets_array_p,
-                }
+                },
+                rank,
+                start_batch_id,
+                end_batch_id,
+                fanout_length,
             )
 
-            end_batch_id = start_batch_id + len(batch_id_array_p) - 1
-            rank = minibatch_dict["rank"] if "rank" in minibatch_dict else 0
+    def __write_partition(
+        self,
+        arrays: Dict[str, cupy.ndarray],
+        rank: int,
+        start_batch_id: int,
+        end_batch_id: int,
+        fanout_length: int,
+    ):
+        full_output_path = os.path.join(
+            self.__directory,
+            f"batch={rank:05d}.{start_batch_id:08d}-"
+            f"{rank:05d}.{end_batch_id:08d}.{self.__format}",
+        )
 
-            full_output_path = os.path.join(
-                self.__directory,
-                f"batch={rank:05d}.{start_batch_id:08d}-"
-                f"{rank:05d}.{end_batch_id:08d}.parquet",
+        if self.__format == "indexed":
+            write_indexed_partition(
+                full_output_path,
+                {name: cupy.asnumpy(values) for name, values in arrays.items()},
+                fanout_length,
+                compression=self.__compression,
             )
-
+        else:
+            results_dataframe_p = create_df_from_disjoint_arrays(arrays)
             results_dataframe_p.to_parquet(
                 full_output_path,
                 compression=None,
@@ -402,13 +698,16 @@ class DistSampler:
         self.__handle = None
         self.__retain_original_seeds = retain_original_seeds
 
-    def get_reader(self) -> Iterator[Tuple[Dict[str, "torch.Tensor"], int, int]]:
+    def get_reader(
+        self, *, prefetch: int = 0, pin_memory: bool = False
+    ) -> Iterator[Tuple[Dict[str, "torch.Tensor"], int, int]]:
         """
         Returns an iterator over sampled data.
+        See DistSampleReader for the prefetch and pin_memory options.
         """
         torch = import_optional("torch")
         rank = torch.distributed.get_rank() if self.is_multi_gpu else None
-        return self.__writer.get_reader(rank)
+        return self.__writer.get_reader(rank, prefetch=prefetch, pin_memory=pin_memory)
 
     def sample_batches(
         self,
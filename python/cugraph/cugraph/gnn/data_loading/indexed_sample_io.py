@@ -0,0 +1,317 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Reading and writing of sampled minibatches in the "indexed" file format.
+
+Each file holds one partition of minibatches.  The batches are stored one
+after another, each as a sequence of encoded (and optionally compressed)
+columns, and are followed by a JSON footer recording the byte offset of
+each batch and the size and encoding of each of its columns.  Any batch
+can be read by seeking to its offset, without reading the rest of the
+partition.
+
+File layout::
+
+    MAGIC | batch 0 | ... | batch n-1 | footer | footer size (uint64) | MAGIC
+
+Column encodings:
+
+    delta: offsets columns are stored as their first value and the
+           differences between consecutive values.
+    for:   other integer columns are stored relative to their minimum
+           value (frame of reference).
+    raw:   all other columns are stored as-is.
+
+The stored values are narrowed to the smallest unsigned integer type that
+holds them, and each column may then be compressed with zlib or zstd.
+"""
+
+import json
+import zlib
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from cugraph.utilities.utils import import_optional
+
+zstandard = import_optional("zstandard")
+
+_MAGIC = b"CUGRAPHS"
+_VERSION = 1
+
+# Columns holding offsets into other columns.  When a partition is split
+# into batches, consecutive batches share one element of these columns.
+OFFSETS_COLUMNS = ("label_hop_offsets", "renumber_map_offsets", "major_offsets")
+
+SUPPORTED_COMPRESSION = (None, "zlib", "zstd")
+
+
+def _check_compression(compression: Optional[str]):
+    if compression not in SUPPORTED_COMPRESSION:
+        raise ValueError(
+            f"Invalid compression {compression!r} "
+            f"(supported: {', '.join(map(repr, SUPPORTED_COMPRESSION))})"
+        )
+
+
+def _get_encoding(name: str, dtype: np.dtype) -> str:
+    if name in OFFSETS_COLUMNS:
+        return "delta"
+    if dtype.kind in "iu":
+        return "for"
+    return "raw"
+
+
+def _narrow(values: np.ndarray) -> np.ndarray:
+    """Casts non-negative integers to the smallest unsigned type holding them."""
+    max_value = int(values.max()) if len(values) > 0 else 0
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_value <= np.iinfo(dtype).max:
+            return values.astype(dtype)
+    return values.astype(np.uint64)
+
+
+def _encode_column(values: np.ndarray, encoding: str):
+    """
+    Returns the stored values and the base value of the column.
+    Integer arithmetic is done modulo 2**64 so any integer column
+    can be encoded and decoded exactly.
+    """
+    if encoding == "raw" or len(values) == 0:
+        return values, 0
+    values = values.astype(np.uint64)
+    if encoding == "delta":
+        return _narrow(np.diff(values)), int(values[0])
+    base = values.min()
+    return _narrow(values - base), int(base)
+
+
+def _decode_column(
+    stored: np.ndarray, encoding: str, base: int, length: int, dtype: np.dtype
+) -> np.ndarray:
+    if encoding == "raw" or length == 0:
+        return stored.astype(dtype, copy=False)
+    if encoding == "delta":
+        values = np.empty(length, dtype=np.uint64)
+        values[0] = 0
+        np.cumsum(stored, dtype=np.uint64, out=values[1:])
+    else:
+        values = stored.astype(np.uint64)
+    values += np.uint64(base)
+    return values.astype(dtype)
+
+
+def _compress(data: bytes, compression: Optional[str]) -> bytes:
+    if compression == "zlib":
+        return zlib.compress(data)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _decompress(data: bytes, compression: Optional[str]) -> bytes:
+    if compression == "zlib":
+        return zlib.decompress(data)
+    if compression == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+def split_partition(
+    arrays: Dict[str, np.ndarray], fanout_length: int
+) -> List[Dict[str, np.ndarray]]:
+    """
+    Splits the columns of a partition (as written to parquet by
+    DistSampleWriter) into the columns of each of its batches.
+    The offsets columns of each batch keep their original values, so
+    merge_batches can concatenate consecutive batches back together.
+    """
+    label_hop_offsets = arrays["label_hop_offsets"]
+    renumber_map_offsets = arrays["renumber_map_offsets"]
+    major_offsets = arrays.get("major_offsets")
+
+    batches = []
+    for i in range(len(renumber_map_offsets) - 1):
+        hop_start, hop_end = i * fanout_length, (i + 1) * fanout_length
+        major_start = label_hop_offsets[hop_start] - label_hop_offsets[0]
+        major_end = label_hop_offsets[hop_end] - label_hop_offsets[0]
+        if major_offsets is None:
+            edge_start, edge_end = major_start, major_end
+        else:
+            edge_start = major_offsets[major_start] - major_offsets[0]
+            edge_end = major_offsets[major_end] - major_offsets[0]
+
+        slices = {
+            "label_hop_offsets": slice(hop_start, hop_end + 1),
+            "renumber_map_offsets": slice(i, i + 2),
+            "major_offsets": slice(major_start, major_end + 1),
+            "map": slice(
+                renumber_map_offsets[i] - renumber_map_offsets[0],
+                renumber_map_offsets[i + 1] - renumber_map_offsets[0],
+            ),
+        }
+        edge_slice = slice(edge_start, edge_end)
+        batches.append(
+            {
+                name: values[slices.get(name, edge_slice)]
+                for name, values in arrays.items()
+            }
+        )
+
+    return batches
+
+
+def merge_batches(batches: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """
+    Concatenates the columns of consecutive batches returned by
+    split_partition, dropping the offsets shared by adjacent batches.
+    """
+    merged = {}
+    for name in batches[0]:
+        parts = [batches[0][name]]
+        for batch in batches[1:]:
+            values = batch[name]
+            parts.append(values[1:] if name in OFFSETS_COLUMNS else values)
+        merged[name] = np.concatenate(parts)
+    return merged
+
+
+def write_indexed_partition(
+    path: str,
+    arrays: Dict[str, np.ndarray],
+    fanout_length: int,
+    compression: Optional[str] = None,
+):
+    """
+    Writes the columns of a partition to path in the indexed format.
+    Empty columns (i.e. edge properties that were not sampled) are not
+    written, matching the columns DistSampleReader returns for parquet.
+
+    Parameters
+    ----------
+    path: str
+        The path of the output file.
+    arrays: Dict[str, np.ndarray]
+        The host arrays of the partition, by column name.
+    fanout_length: int
+        The number of hops sampled for each batch.
+    compression: str (optional, default=None)
+        The compression applied to each encoded column:
+        None, 'zlib' or 'zstd'.
+    """
+    _check_compression(compression)
+
+    arrays = {name: values for name, values in arrays.items() if len(values) > 0}
+    columns = [
+        {
+            "name": name,
+            "dtype": values.dtype.str,
+            "encoding": _get_encoding(name, values.dtype),
+        }
+        for name, values in arrays.items()
+    ]
+
+    index = []
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        for batch in split_partition(arrays, fanout_length):
+            batch_index = {"offset": f.tell(), "columns": []}
+            for column in columns:
+                values = batch[column["name"]]
+                stored, base = _encode_column(values, column["encoding"])
+                data = _compress(stored.tobytes(), compression)
+                f.write(data)
+                batch_index["columns"].append(
+                    [len(data), len(values), base, stored.dtype.str]
+                )
+            index.append(batch_index)
+
+        footer = json.dumps(
+            {
+                "version": _VERSION,
+                "fanout_length": fanout_length,
+                "compression": compression,
+                "columns": columns,
+                "batches": index,
+            }
+        ).encode()
+        f.write(footer)
+        f.write(np.uint64(len(footer)).tobytes())
+        f.write(_MAGIC)
+
+
+def read_indexed_footer(path: str) -> dict:
+    """
+    Reads the footer of a file written by write_indexed_partition.
+    """
+    trailer_size = 8 + len(_MAGIC)
+    with open(path, "rb") as f:
+        f.seek(-trailer_size, 2)
+        trailer = f.read(trailer_size)
+        if trailer[8:] != _MAGIC:
+            raise ValueError(f"{path} is not an indexed sample file")
+        footer_size = int(np.frombuffer(trailer[:8], dtype=np.uint64)[0])
+        f.seek(-(trailer_size + footer_size), 2)
+        footer = json.loads(f.read(footer_size))
+
+    if footer["version"] != _VERSION:
+        raise ValueError(f"Unsupported indexed sample file version {footer['version']}")
+    return footer
+
+
+def read_indexed_batches(
+    path: str, footer: dict, start: int, end: int
+) -> Dict[str, np.ndarray]:
+    """
+    Reads batches start through end (inclusive, counted from the first
+    batch in the file) of a file written by write_indexed_partition,
+    with a single read of the bytes of those batches only.  Returns the
+    merged columns of the batches, in the same form as the columns of
+    a partition.
+    """
+    index = footer["batches"]
+    if not 0 <= start <= end < len(index):
+        raise IndexError(
+            f"Batches {start} through {end} are not in {path}, "
+            f"which holds {len(index)} batches"
+        )
+
+    offset = index[start]["offset"]
+    with open(path, "rb") as f:
+        f.seek(offset)
+        buffer = f.read(
+            index[end]["offset"] + sum(c[0] for c in index[end]["columns"]) - offset
+        )
+
+    batches = []
+    position = 0
+    for batch_index in index[start : end + 1]:
+        batch = {}
+        for column, (nbytes, length, base, stored_dtype) in zip(
+            footer["columns"], batch_index["columns"]
+        ):
+            data = _decompress(
+                buffer[position : position + nbytes], footer["compression"]
+            )
+            position += nbytes
+            batch[column["name"]] = _decode_column(
+                np.frombuffer(data, dtype=stored_dtype),
+                column["encoding"],
+                base,
+                length,
+                np.dtype(column["dtype"]),
+            )
+        batches.append(batch)
+
+    return merge_batches(batches)
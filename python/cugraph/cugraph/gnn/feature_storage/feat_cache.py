@@ -0,0 +1,239 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Callable, Union
+import cupy as cp
+import numpy as np
+from cugraph.utilities.utils import import_optional
+
+torch = import_optional("torch")
+
+
+class FeatureCache:
+    """
+    Fixed-capacity cache of the rows of a single feature (one feat_name and
+    type_name of a FeatureStore), keyed by row (vertex or edge) id.
+
+    Lookups, evictions and insertions are done for a whole batch of indices
+    at once: cached ids are kept sorted so a batch is looked up with a single
+    searchsorted, and victims are chosen with a single partition on the
+    recency (LRU) or frequency (LFU) of each slot.
+    """
+
+    def __init__(self, capacity: int, policy: str = "lru"):
+        """
+        Constructs a new, empty FeatureCache
+
+        Parameters:
+        ----------
+        capacity: int
+            The maximum number of rows to cache.
+
+        policy: str ('lru', 'lfu')
+            Optional (default='lru')
+            Whether to evict the least recently used or the least frequently
+            used rows when the cache is full.
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        if policy not in ["lru", "lfu"]:
+            raise ValueError(
+                f"cache policy {policy} not supported. "
+                "Supported policies are lru, lfu"
+            )
+        self.capacity = capacity
+        self.policy = policy
+
+        # Cached rows, allocated on the first insert so they have the same
+        # type, dtype and device as the data returned by the backend.
+        self.__rows = None
+
+        # Row id stored in each slot (-1 if empty), and the sorted row ids
+        # with their slots for lookups.
+        self.__slot_ids = np.full(capacity, -1, dtype="int64")
+        self.__sorted_ids = np.empty(0, dtype="int64")
+        self.__sorted_slots = np.empty(0, dtype="int64")
+
+        # Batch in which each slot was last used, and number of uses.
+        self.__last_used = np.zeros(capacity, dtype="int64")
+        self.__num_uses = np.zeros(capacity, dtype="int64")
+        self.__batch_num = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.__sorted_ids)
+
+    def stats(self) -> dict:
+        """
+        Returns a dictionary with the number of looked up rows that were
+        cached ("hits") or not ("misses"), the resulting "hit_rate", the
+        number of "evictions", and the current and maximum number of cached
+        rows ("size", "capacity").
+        """
+        num_lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / num_lookups if num_lookups else 0.0,
+            "evictions": self.evictions,
+            "size": len(self),
+            "capacity": self.capacity,
+        }
+
+    def get(
+        self,
+        indices: np.ndarray,
+        gather: Callable[[np.ndarray], Union[np.ndarray, torch.Tensor]],
+    ) -> Union[np.ndarray, torch.Tensor]:
+        """
+        Returns the rows at indices, calling gather() with the sorted unique
+        indices that are not cached and caching the rows it returns.
+
+        Parameters:
+        ----------
+        indices: np.ndarray
+            The 1-D integer row ids to get.
+        gather: callable
+            Called with the sorted unique row ids that are not cached, returns
+            those rows from the backend.
+        """
+        self.__batch_num += 1
+
+        (hit, hit_slots) = self.__lookup(indices)
+        num_hits = int(hit.sum())
+        self.hits += num_hits
+        self.misses += len(indices) - num_hits
+
+        miss = ~hit
+        (miss_ids, miss_inverse) = np.unique(indices[miss], return_inverse=True)
+        if num_hits > 0 and num_hits == len(indices):
+            out = self.__take(self.__rows, hit_slots)
+        else:
+            miss_rows = gather(miss_ids)
+            if num_hits == 0:
+                out = self.__take(miss_rows, miss_inverse)
+            else:
+                out = _empty_like_rows(miss_rows, len(indices))
+                out[self.__as_index(out, hit)] = self.__take(self.__rows, hit_slots)
+                out[self.__as_index(out, miss)] = self.__take(miss_rows, miss_inverse)
+
+        if num_hits > 0:
+            np.add.at(self.__num_uses, hit_slots, 1)
+            self.__last_used[hit_slots] = self.__batch_num
+        if len(miss_ids) > 0:
+            self.insert(miss_ids, miss_rows)
+
+        return out
+
+    def insert(self, ids: np.ndarray, rows: Union[np.ndarray, torch.Tensor]) -> None:
+        """
+        Caches rows for the unique, not already cached row ids, evicting
+        rows according to the cache policy if needed. If there are more ids
+        than the cache capacity, only the first capacity ids are cached.
+        """
+        if len(ids) > self.capacity:
+            ids = ids[: self.capacity]
+            rows = rows[: self.capacity]
+        if self.__rows is None:
+            self.__rows = _empty_like_rows(rows, self.capacity)
+
+        free_slots = np.flatnonzero(self.__slot_ids < 0)
+        num_to_evict = len(ids) - len(free_slots)
+        if num_to_evict > 0:
+            if self.policy == "lru":
+                score = self.__last_used.copy()
+            else:
+                # Break ties between equally frequent rows by recency.
+                score = self.__num_uses * (self.__batch_num + 1) + self.__last_used
+            # Free slots are already being filled, never evict them.
+            score[free_slots] = np.iinfo(score.dtype).max
+            victims = np.argpartition(score, num_to_evict - 1)[:num_to_evict]
+            self.evictions += num_to_evict
+            slots = np.concatenate([free_slots, victims])
+        else:
+            slots = free_slots[: len(ids)]
+
+        self.__rows[self.__as_index(self.__rows, slots)] = rows
+        self.__slot_ids[slots] = ids
+        self.__num_uses[slots] = 1
+        self.__last_used[slots] = self.__batch_num
+
+        cached_slots = np.flatnonzero(self.__slot_ids >= 0)
+        order = np.argsort(self.__slot_ids[cached_slots])
+        self.__sorted_slots = cached_slots[order]
+        self.__sorted_ids = self.__slot_ids[self.__sorted_slots]
+
+    def clear(self) -> None:
+        """
+        Removes all cached rows. The hit, miss and eviction counts are kept.
+        """
+        self.__rows = None
+        self.__slot_ids[:] = -1
+        self.__sorted_ids = np.empty(0, dtype="int64")
+        self.__sorted_slots = np.empty(0, dtype="int64")
+        self.__last_used[:] = 0
+        self.__num_uses[:] = 0
+
+    def __lookup(self, indices):
+        """
+        Returns a boolean array of which indices are cached, and the slots of
+        the cached ones.
+        """
+        if len(self.__sorted_ids) == 0:
+            return (np.zeros(len(indices), dtype=bool), np.empty(0, dtype="int64"))
+        pos = np.searchsorted(self.__sorted_ids, indices)
+        pos[pos == len(self.__sorted_ids)] = 0
+        hit = self.__sorted_ids[pos] == indices
+        return (hit, self.__sorted_slots[pos[hit]])
+
+    @staticmethod
+    def __as_index(rows, ar):
+        if _is_tensor(rows):
+            return torch.as_tensor(ar, device=rows.device)
+        return ar
+
+    @classmethod
+    def __take(cls, rows, positions):
+        return rows[cls.__as_index(rows, positions)]
+
+
+def _is_tensor(ar) -> bool:
+    return type(ar).__name__ == "Tensor"
+
+
+def _empty_like_rows(rows, num_rows):
+    shape = (num_rows,) + tuple(rows.shape[1:])
+    if _is_tensor(rows):
+        return torch.empty(shape, dtype=rows.dtype, device=rows.device)
+    return np.empty(shape, dtype=rows.dtype)
+
+
+def _indices_to_numpy(indices) -> np.ndarray:
+    """
+    Returns the integer indices as a 1-D host array, or None if they are not
+    supported by the cache (None, slices, scalars and boolean masks).
+    """
+    if indices is None or isinstance(indices, (int, np.integer, slice)):
+        return None
+    if _is_tensor(indices):
+        indices = indices.cpu().numpy()
+    elif isinstance(indices, cp.ndarray):
+        indices = indices.get()
+    else:
+        indices = np.asarray(indices)
+    if indices.ndim != 1 or indices.dtype.kind not in "iu":
+        return None
+    return indices.astype("int64", copy=False)
@@ -11,12 +11,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+import os
+import tempfile
 from collections import defaultdict
 from typing import Sequence, Union
 import cudf
 import cupy as cp
 import numpy as np
 import pandas as pd
+from cugraph.gnn.feature_storage.feat_cache import FeatureCache, _indices_to_numpy
 from cugraph.utilities.utils import import_optional, MissingModule
 
 torch = import_optional("torch")
@@ -32,13 +35,16 @@ class FeatureStore:
         wg_comm: object = None,
         wg_type: str = None,
         wg_location: str = None,
+        mmap_dir: str = None,
+        cache_size: int = 0,
+        cache_policy: str = "lru",
     ):
         """
         Constructs a new FeatureStore object
 
         Parameters:
         ----------
-        backend: str ('numpy', 'torch', 'wholegraph')
+        backend: str ('numpy', 'torch', 'wholegraph', 'mmap')
             Optional (default='numpy')
             The name of the backend to use.
 
@@ -59,13 +65,34 @@ class FeatureStore:
             Only used with the 'wholegraph' backend.
             Where the data is stored (cpu or cuda).
             Defaults to storing on the GPU (cuda).
+
+        mmap_dir: str
+            Optional (default=a new temporary directory)
+            Only used with the 'mmap' backend.
+            The directory where each feature is written as a .npy file,
+            which is memory-mapped so features larger than host memory can
+            be stored.  A temporary directory is removed when the
+            FeatureStore is garbage collected; a given directory is not.
+
+        cache_size: int
+            Optional (default=0)
+            If positive, get_data caches up to this many recently or
+            frequently fetched rows of each feature, in the same memory as
+            the backend returns them, and only gathers uncached rows from
+            the backend. Useful when fetched indices are skewed towards
+            high-degree vertices.  See warm_cache and cache_stats.
+
+        cache_policy: str ('lru', 'lfu')
+            Optional (default='lru')
+            Whether the cache evicts the least recently used or the least
+            frequently used rows.
         """
 
         self.fd = defaultdict(dict)
-        if backend not in ["numpy", "torch", "wholegraph"]:
+        if backend not in ["numpy", "torch", "wholegraph", "mmap"]:
             raise ValueError(
                 f"backend {backend} not supported. "
-                "Supported backends are numpy, torch, wholegraph"
+                "Supported backends are numpy, torch, wholegraph, mmap"
             )
         self.backend = backend
 
@@ -85,6 +112,30 @@ class FeatureStore:
             if (self.__wg_location != "cuda") and (self.__wg_location != "cpu"):
                 raise ValueError(f"invalid location {self.__wg_location}")
 
+        self.__mmap_dir = None
+        self.__mmap_tmp_dir = None
+        self.__mmap_num_files = 0
+
+        if backend == "mmap":
+            if mmap_dir is None:
+                self.__mmap_tmp_dir = tempfile.TemporaryDirectory(
+                    prefix="cugraph_feature_store_"
+                )
+                mmap_dir = self.__mmap_tmp_dir.name
+            os.makedirs(mmap_dir, exist_ok=True)
+            self.__mmap_dir = mmap_dir
+
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be non-negative, got {cache_size}")
+        if cache_policy not in ["lru", "lfu"]:
+            raise ValueError(
+                f"cache policy {cache_policy} not supported. "
+                "Supported policies are lru, lfu"
+            )
+        self.cache_size = cache_size
+        self.cache_policy = cache_policy
+        self.__caches = {}
+
     def add_data(
         self, feat_obj: Sequence, type_name: str, feat_name: str, **kwargs
     ) -> None:
@@ -102,12 +153,21 @@ class FeatureStore:
         -------
             None
         """
+        if self.backend == "mmap":
+            mmap_path = os.path.join(
+                self.__mmap_dir, f"feat_{self.__mmap_num_files}.npy"
+            )
+            self.__mmap_num_files += 1
+        else:
+            mmap_path = None
+        self.__caches.pop((feat_name, type_name), None)
         self.fd[feat_name][type_name] = self._cast_feat_obj_to_backend(
             feat_obj,
             self.backend,
             wg_comm=self.__wg_comm,
             wg_type=self.__wg_type,
             wg_location=self.__wg_location,
+            mmap_path=mmap_path,
             **kwargs,
         )
 
@@ -126,6 +186,7 @@ class FeatureStore:
         -------
             None
         """
+        self.__caches.pop((feat_name, type_name), None)
         self.fd[feat_name][type_name] = feat_obj
 
     def get_data(
@@ -164,7 +225,77 @@ class FeatureStore:
             )
 
         feat = self.fd[feat_name][type_name]
-        if not isinstance(wgth, MissingModule) and isinstance(
+        if self.cache_size > 0:
+            cache_indices = _indices_to_numpy(indices)
+            if cache_indices is not None:
+                return self.__get_cache(type_name, feat_name).get(
+                    cache_indices, lambda ids: self.__gather(feat, ids)
+                )
+        return self.__gather(feat, indices)
+
+    def warm_cache(self, type_name: str, feat_name: str, degrees) -> None:
+        """
+        Fills the cache of the given feature with the rows of the
+        highest-degree vertices, replacing any cached rows.
+
+        Parameters:
+        -----------
+        type_name : str
+            The node-type/edge-type of the feature
+        feat_name:
+            The feature name to warm the cache for
+        degrees: cugraph.Graph or array_like
+            Either a graph whose vertex IDs are the row indices of the
+            feature, or the degree of each row of the feature.
+        """
+        if self.cache_size <= 0:
+            raise ValueError("warm_cache requires a FeatureStore with a cache_size")
+        if feat_name not in self.fd or type_name not in self.fd[feat_name]:
+            raise ValueError(
+                f"feature {feat_name} of type {type_name} not found in features"
+            )
+
+        if hasattr(degrees, "degree"):
+            df = degrees.degree()
+            if hasattr(df, "compute"):
+                df = df.compute()
+            ids = df.nlargest(self.cache_size, "degree")["vertex"]
+            ids = _cast_to_numpy_ar(ids.values if hasattr(ids, "values") else ids)
+        else:
+            degrees = _cast_to_numpy_ar(degrees)
+            if len(degrees) > self.cache_size:
+                ids = np.argpartition(-degrees, self.cache_size - 1)[: self.cache_size]
+            else:
+                ids = np.arange(len(degrees))
+        ids = np.unique(ids.astype("int64", copy=False))
+
+        cache = self.__get_cache(type_name, feat_name)
+        cache.clear()
+        if len(ids) > 0:
+            cache.insert(ids, self.__gather(self.fd[feat_name][type_name], ids))
+
+    def cache_stats(self) -> dict[str, dict[str, dict]]:
+        """
+        Returns the hits, misses, hit rate, evictions, size and capacity of
+        the cache of each feature, as a dictionary of feature name to type
+        name to FeatureCache.stats().
+        """
+        stats = defaultdict(dict)
+        for (feat_name, type_name), cache in self.__caches.items():
+            stats[feat_name][type_name] = cache.stats()
+        return dict(stats)
+
+    def __get_cache(self, type_name: str, feat_name: str) -> FeatureCache:
+        key = (feat_name, type_name)
+        if key not in self.__caches:
+            self.__caches[key] = FeatureCache(self.cache_size, self.cache_policy)
+        return self.__caches[key]
+
+    @staticmethod
+    def __gather(feat, indices):
+        if isinstance(feat, np.memmap):
+            return _gather_from_memmap(feat, indices)
+        elif not isinstance(wgth, MissingModule) and isinstance(
             feat, wgth.WholeMemoryEmbedding
         ):
             indices_tensor = (
@@ -230,6 +361,8 @@ class FeatureStore:
             if isinstance(feat_obj, wgth.WholeMemoryEmbedding):
                 return feat_obj
             return _get_wg_embedding(feat_obj, **kwargs)
+        elif backend == "mmap":
+            return _cast_to_memmap(feat_obj, **kwargs)
 
 
 def _get_wg_embedding(feat_obj, wg_comm=None, wg_type=None, wg_location=None, **kwargs):
@@ -270,6 +403,74 @@ def _cast_to_torch_tensor(ar, **kwargs):
     return ar
 
 
+def _cast_to_memmap(feat_obj, mmap_path=None, chunk_size=2**16, **kwargs):
+    """
+    Returns feat_obj as a read-only np.memmap. An existing memmap or a path to
+    a .npy file is opened as-is, anything else is copied into a new .npy file
+    at mmap_path one column (DataFrames) or chunk_size rows at a time so the
+    whole feature is never held in host memory.
+    """
+    if isinstance(feat_obj, (str, os.PathLike)):
+        return np.load(feat_obj, mmap_mode="r")
+    if isinstance(feat_obj, np.memmap):
+        return feat_obj
+
+    if isinstance(feat_obj, (cudf.DataFrame, pd.DataFrame)):
+        dtype = np.result_type(*feat_obj.dtypes)
+        shape = feat_obj.shape
+    else:
+        if not hasattr(feat_obj, "shape"):
+            feat_obj = np.asarray(feat_obj)
+        if type(feat_obj).__name__ == "Tensor":
+            dtype = torch.empty(0, dtype=feat_obj.dtype).numpy().dtype
+        else:
+            dtype = feat_obj.dtype
+        shape = tuple(feat_obj.shape)
+
+    mm = np.lib.format.open_memmap(mmap_path, mode="w+", dtype=dtype, shape=shape)
+    if isinstance(feat_obj, cudf.DataFrame):
+        for i, col in enumerate(feat_obj.columns):
+            mm[:, i] = feat_obj[col].values_host
+    elif isinstance(feat_obj, pd.DataFrame):
+        for i, col in enumerate(feat_obj.columns):
+            mm[:, i] = feat_obj[col].to_numpy()
+    else:
+        is_tensor = type(feat_obj).__name__ == "Tensor"
+        for start in range(0, shape[0], chunk_size):
+            chunk = feat_obj[start : start + chunk_size]
+            # Tensor.numpy() doesn't support CUDA tensors
+            mm[start : start + chunk_size] = _cast_to_numpy_ar(
+                chunk.cpu() if is_tensor else chunk
+            )
+    mm.flush()
+    del mm
+
+    return np.load(mmap_path, mmap_mode="r")
+
+
+def _gather_from_memmap(feat, indices):
+    """
+    Gathers the rows of the memory-mapped feat at indices into a new
+    np.ndarray. Rows are read in sorted order with each row read once, so
+    repeated or nearby indices are served from the same pages.
+    """
+    if indices is None:
+        return feat[None]
+    if isinstance(indices, (int, np.integer, slice)):
+        return np.array(feat[indices])
+
+    indices = _cast_to_numpy_ar(
+        indices.cpu() if type(indices).__name__ == "Tensor" else indices
+    )
+    if indices.dtype == bool:
+        indices = np.flatnonzero(indices)
+    unique_indices, inverse = np.unique(indices, return_inverse=True)
+    rows = feat[unique_indices]
+    if len(unique_indices) == len(indices) and np.array_equal(unique_indices, indices):
+        return rows
+    return rows[inverse.reshape(indices.shape)]
+
+
 def _cast_to_numpy_ar(ar, **kwargs):
     if isinstance(ar, cp.ndarray):
         ar = ar.get()
@@ -35,6 +35,7 @@
 # THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import cudf
+import cupy
 import numpy as np
 from cugraph.structure.graph_classes import Graph
 
@@ -297,54 +298,37 @@ def _create_entity_nodes(
     CATEGORY="category",
     NODETYPE="node_type",
 ):
-    nodes = [
-        cudf.DataFrame(
-            dict(
-                [
-                    (NODEID, cudf.core.column.column_empty(0, "str")),
-                    (
-                        CATEGORY,
-                        cudf.core.column.column_empty(
-                            0, "str" if not categorical_metadata else _empty_cat_dt()
-                        ),
-                    ),
-                    (
-                        NODETYPE,
-                        cudf.core.column.column_empty(
-                            0, "str" if not categorical_metadata else _empty_cat_dt()
-                        ),
-                    ),
-                ]
-                + [
-                    (key, cudf.core.column.column_empty(0, col.dtype))
-                    for key, col in events[columns].items()
-                ]
-            )
-        )
-    ]
-
-    for key, col in events[columns].items():
-        cat = categories.get(key, key)
-        col = col.unique().sort_values()
+    uniques = []
+    for key in columns:
+        col = events[key].unique().sort_values()
         col = col.nans_to_nulls().dropna() if dropna else col
-        if len(col) == 0:
-            continue
-        df = cudf.DataFrame(
-            {
-                key: cudf.core.column.as_column(col),
-                NODEID: _prepend_str(col, cat + DELIM),
-                CATEGORY: cat
-                if not categorical_metadata
-                else _str_scalar_to_category(len(col), cat),
-                NODETYPE: key
-                if not categorical_metadata
-                else _str_scalar_to_category(len(col), key),
-            }
+        uniques.append(col.reset_index(drop=True))
+
+    # The unique values of each column are stacked one column after the
+    # other, and each column of values is padded with nulls outside of
+    # its own rows.
+    sizes = [len(col) for col in uniques]
+    offsets = np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)])
+    cats = [categories.get(key, key) for key in columns]
+    nodes = cudf.DataFrame(
+        dict(
+            [
+                (NODEID, _prepend_strs(uniques, [cat + DELIM for cat in cats])),
+                (CATEGORY, _repeat_str(cats, sizes, categorical_metadata)),
+                (NODETYPE, _repeat_str(columns, sizes, categorical_metadata)),
+            ]
+            + [
+                (
+                    key,
+                    _pad_with_nulls(
+                        col, int(offsets[i]), int(offsets[-1] - offsets[i + 1])
+                    ),
+                )
+                for i, (key, col) in enumerate(zip(columns, uniques))
+            ]
         )
-        df.reset_index(drop=True, inplace=True)
-        nodes.append(df)
+    )
 
-    nodes = cudf.concat(nodes)
     nodes = nodes.drop_duplicates(subset=[NODEID])
     nodes = nodes[[NODEID, NODETYPE, CATEGORY] + list(columns)]
     nodes.reset_index(drop=True, inplace=True)
@@ -396,65 +380,24 @@ def _create_hyper_edges(
     NODETYPE="node_type",
 ):
     edge_attrs = [x for x in events.columns if x != NODETYPE]
-    edges = [
-        cudf.DataFrame(
-            dict(
-                (
-                    [
-                        (EVENTID, cudf.core.column.column_empty(0, "str")),
-                        (ATTRIBID, cudf.core.column.column_empty(0, "str")),
-                        (
-                            EDGETYPE,
-                            cudf.core.column.column_empty(
-                                0,
-                                "str" if not categorical_metadata else _empty_cat_dt(),
-                            ),
-                        ),
-                    ]
-                )
-                + (
-                    []
-                    if len(categories) == 0
-                    else [
-                        (
-                            CATEGORY,
-                            cudf.core.column.column_empty(
-                                0,
-                                "str" if not categorical_metadata else _empty_cat_dt(),
-                            ),
-                        )
-                    ]
-                )
-                + (
-                    []
-                    if drop_edge_attrs
-                    else [
-                        (key, cudf.core.column.column_empty(0, col.dtype))
-                        for key, col in events[edge_attrs].items()
-                    ]
-                )
-            )
-        )
-    ]
-
-    for key, col in events[columns].items():
-        cat = categories.get(key, key)
-        fs = [EVENTID] + ([key] if drop_edge_attrs else edge_attrs)
-        df = events[fs].dropna(subset=[key]) if dropna else events[fs]
-        if len(df) == 0:
-            continue
-        if len(categories) > 0:
-            df[CATEGORY] = (
-                key
-                if not categorical_metadata
-                else _str_scalar_to_category(len(df), key)
-            )
-        df[EDGETYPE] = (
-            cat if not categorical_metadata else _str_scalar_to_category(len(df), cat)
-        )
-        df[ATTRIBID] = _prepend_str(col, cat + DELIM)
-        df.reset_index(drop=True, inplace=True)
-        edges.append(df)
+
+    # One edge per (column, event), ordered by column then by event
+    ids, valid = _melt_entity_ids(events, columns, categories, DELIM)
+    rows = cupy.tile(cupy.arange(len(events)), len(columns))
+    sizes = [len(events)] * len(columns)
+    if dropna:
+        rows = rows[valid]
+        ids = ids[valid].reset_index(drop=True)
+        sizes = valid.reshape(len(columns), len(events)).sum(axis=1).tolist()
+
+    edges = events[[EVENTID] if drop_edge_attrs else edge_attrs].take(rows)
+    edges.reset_index(drop=True, inplace=True)
+    if len(categories) > 0:
+        edges[CATEGORY] = _repeat_str(columns, sizes, categorical_metadata)
+    edges[EDGETYPE] = _repeat_str(
+        [categories.get(key, key) for key in columns], sizes, categorical_metadata
+    )
+    edges[ATTRIBID] = ids
 
     columns = [EVENTID, EDGETYPE, ATTRIBID]
 
@@ -464,8 +407,7 @@ def _create_hyper_edges(
     if not drop_edge_attrs:
         columns += edge_attrs
 
-    edges = cudf.concat(edges)[columns]
-    edges.reset_index(drop=True, inplace=True)
+    edges = edges[list(dict.fromkeys(columns))]
     return edges
 
 
@@ -490,80 +432,56 @@ def _create_direct_edges(
         for i, name in enumerate(columns):
             edge_shape[name] = columns[(i + 1) :]
 
-    edge_attrs = [x for x in events.columns if x != NODETYPE]
-    edges = [
-        cudf.DataFrame(
-            dict(
-                (
-                    [
-                        (EVENTID, cudf.core.column.column_empty(0, "str")),
-                        (SOURCE, cudf.core.column.column_empty(0, "str")),
-                        (TARGET, cudf.core.column.column_empty(0, "str")),
-                        (
-                            EDGETYPE,
-                            cudf.core.column.column_empty(
-                                0,
-                                "str" if not categorical_metadata else _empty_cat_dt(),
-                            ),
-                        ),
-                    ]
-                )
-                + (
-                    []
-                    if len(categories) == 0
-                    else [
-                        (
-                            CATEGORY,
-                            cudf.core.column.column_empty(
-                                0,
-                                "str" if not categorical_metadata else _empty_cat_dt(),
-                            ),
-                        )
-                    ]
-                )
-                + (
-                    []
-                    if drop_edge_attrs
-                    else [
-                        (key, cudf.core.column.column_empty(0, col.dtype))
-                        for key, col in events[edge_attrs].items()
-                    ]
-                )
-            )
-        )
-    ]
-
-    for key1, col1 in events[sorted(edge_shape.keys())].items():
-        cat1 = categories.get(key1, key1)
-
+    pairs = []
+    for key1 in sorted(edge_shape.keys()):
         if isinstance(edge_shape[key1], str):
             edge_shape[key1] = [edge_shape[key1]]
         elif isinstance(edge_shape[key1], dict):
             edge_shape[key1] = list(edge_shape[key1].keys())
         elif not isinstance(edge_shape[key1], (set, list, tuple)):
             raise ValueError("EDGES must be a dict of column name(s)")
+        pairs += [(key1, key2) for key2 in sorted(edge_shape[key1])]
 
-        for key2, col2 in events[sorted(edge_shape[key1])].items():
-            cat2 = categories.get(key2, key2)
-            fs = [EVENTID] + ([key1, key2] if drop_edge_attrs else edge_attrs)
-            df = events[fs].dropna(subset=[key1, key2]) if dropna else events[fs]
-            if len(df) == 0:
-                continue
-            if len(categories) > 0:
-                df[CATEGORY] = (
-                    key1 + DELIM + key2
-                    if not categorical_metadata
-                    else _str_scalar_to_category(len(df), key1 + DELIM + key2)
-                )
-            df[EDGETYPE] = (
-                cat1 + DELIM + cat2
-                if not categorical_metadata
-                else _str_scalar_to_category(len(df), cat1 + DELIM + cat2)
-            )
-            df[SOURCE] = _prepend_str(col1, cat1 + DELIM)
-            df[TARGET] = _prepend_str(col2, cat2 + DELIM)
-            df.reset_index(drop=True, inplace=True)
-            edges.append(df)
+    edge_attrs = [x for x in events.columns if x != NODETYPE]
+
+    # The ids of all the columns of the pairs are computed once, and the
+    # edges of every pair are gathered from them in a single pass,
+    # ordered by pair then by event.
+    keys = list(dict.fromkeys(key for pair in pairs for key in pair))
+    ids, valid = _melt_entity_ids(events, keys, categories, DELIM)
+    n = len(events)
+    starts = {key: i * n for i, key in enumerate(keys)}
+    rows = cupy.tile(cupy.arange(n), len(pairs))
+    src = rows + cupy.repeat(
+        cupy.asarray([starts[key1] for key1, _ in pairs], dtype=np.int64), n
+    )
+    dst = rows + cupy.repeat(
+        cupy.asarray([starts[key2] for _, key2 in pairs], dtype=np.int64), n
+    )
+    sizes = [n] * len(pairs)
+    if dropna:
+        keep = valid[src] & valid[dst]
+        rows, src, dst = rows[keep], src[keep], dst[keep]
+        sizes = keep.reshape(len(pairs), n).sum(axis=1).tolist()
+
+    edges = events[[EVENTID] if drop_edge_attrs else edge_attrs].take(rows)
+    edges.reset_index(drop=True, inplace=True)
+    if len(categories) > 0:
+        edges[CATEGORY] = _repeat_str(
+            [key1 + DELIM + key2 for key1, key2 in pairs],
+            sizes,
+            categorical_metadata,
+        )
+    edges[EDGETYPE] = _repeat_str(
+        [
+            categories.get(key1, key1) + DELIM + categories.get(key2, key2)
+            for key1, key2 in pairs
+        ],
+        sizes,
+        categorical_metadata,
+    )
+    edges[SOURCE] = ids.take(src).reset_index(drop=True)
+    edges[TARGET] = ids.take(dst).reset_index(drop=True)
 
     columns = [EVENTID, EDGETYPE, SOURCE, TARGET]
 
@@ -573,8 +491,7 @@ def _create_direct_edges(
     if not drop_edge_attrs:
         columns += edge_attrs
 
-    edges = cudf.concat(edges)[columns]
-    edges.reset_index(drop=True, inplace=True)
+    edges = edges[list(dict.fromkeys(columns))]
     return edges
 
 
@@ -594,6 +511,83 @@ def _prepend_str(col, val):
     return val + col.astype(str).fillna("null")
 
 
+def _prepend_strs(cols, vals):
+    """
+    Returns _prepend_str(cols[i], vals[i]) for all i, concatenated.
+    Only the conversion of each column to str is done per column.
+    """
+    if len(cols) == 0:
+        return cudf.Series(cudf.core.column.column_empty(0, "str"))
+    prefixes = _repeat_str(vals, [len(col) for col in cols], False)
+    return prefixes + cudf.concat(
+        [col.astype(str).fillna("null") for col in cols], ignore_index=True
+    )
+
+
+def _melt_entity_ids(events, columns, categories, DELIM):
+    """
+    Stacks the entity node ids of the values of columns into a single
+    Series, one column after the other, and returns it with a cupy array
+    of whether each value is not null (or NaN).
+    """
+    cols = [events[key] for key in columns]
+    ids = _prepend_strs(cols, [categories.get(key, key) + DELIM for key in columns])
+    if len(cols) == 0:
+        return ids, cupy.zeros(0, dtype=bool)
+    valid = cudf.concat(
+        [col.nans_to_nulls().notna() for col in cols], ignore_index=True
+    )
+    return ids, valid.values
+
+
+def _repeat_str(vals, sizes, categorical_metadata):
+    """
+    Returns a Series repeating each of vals the corresponding number of
+    times in sizes.  When categorical_metadata is set, the Series is
+    categorical, its categories being the distinct values that are
+    repeated at least once, in order, so a single dictionary is shared
+    by all of vals.
+    """
+    if sum(sizes) == 0:
+        return cudf.Series(
+            cudf.core.column.column_empty(
+                0, "str" if not categorical_metadata else _empty_cat_dt()
+            )
+        )
+    cats = list(dict.fromkeys(val for val, size in zip(vals, sizes) if size > 0))
+    codes = cupy.repeat(
+        cupy.asarray(
+            [cats.index(val) if size > 0 else 0 for val, size in zip(vals, sizes)],
+            dtype=np.int32,
+        ),
+        sizes,
+    )
+    col = cudf.Series(
+        cudf.core.column.build_categorical_column(
+            categories=cudf.core.column.as_column(cats, dtype="str"),
+            codes=cudf.core.column.as_column(codes),
+            mask=None,
+            size=len(codes),
+            offset=0,
+            null_count=0,
+            ordered=False,
+        )
+    )
+    return col if categorical_metadata else col.astype("str")
+
+
+def _pad_with_nulls(col, before, after):
+    """Returns col with before nulls prepended and after nulls appended."""
+    return cudf.concat(
+        [
+            cudf.Series(cudf.core.column.column_empty(before, col.dtype, masked=True)),
+            col,
+            cudf.Series(cudf.core.column.column_empty(after, col.dtype, masked=True)),
+        ],
+        ignore_index=True,
+    )
+
+
 # Make an empty categorical string dtype
 def _empty_cat_dt():
     return cudf.CategoricalDtype(categories=np.array([], dtype="str"), ordered=False)
@@ -15,6 +15,7 @@
 
 from collections.abc import Iterable
 
+import cupy
 import dask_cudf
 import numpy as np
 import cudf
@@ -33,8 +34,99 @@ class NumberMap:
             self.id_type = id_type
             self.store_transposed = store_transposed
             self.numbered = False
+            # Lookup tables of single-column integer vertex ids, built by
+            # indirection_map: the external id of each internal id, and the
+            # external ids in sorted order with their internal ids.
+            self.external_ids = None
+            self.sorted_external_ids = None
+            self.sorted_internal_ids = None
+
+        def build_lookup_tables(self):
+            """
+            Builds the lookup tables used instead of merges with self.df
+            when the vertices are identified by a single integer column.
+            """
+            self.external_ids = None
+            self.sorted_external_ids = None
+            self.sorted_internal_ids = None
+            if len(self.col_names) != 1:
+                return
+            col = self.df[self.col_names[0]]
+            if not cudf.api.types.is_integer_dtype(col.dtype):
+                return
+
+            # The internal ids are the positions in self.df
+            self.external_ids = col.values
+            order = col.argsort().values
+            self.sorted_external_ids = self.external_ids[order]
+            self.sorted_internal_ids = self.df["id"].values[order]
+
+        def can_lookup_internal_ids(self, df, col_names):
+            """
+            Returns True if the internal ids of the vertices in col_names
+            of df can be found in the lookup tables.
+            """
+            return (
+                self.external_ids is not None
+                and len(col_names) == 1
+                and col_names[0] in df.columns
+                and cudf.api.types.is_integer_dtype(df[col_names[0]].dtype)
+                and np.can_cast(df[col_names[0]].dtype, self.external_ids.dtype)
+            )
+
+        def can_lookup_external_ids(self, df, internal_column_name):
+            """
+            Returns True if from_internal_vertex_id gathers the external ids
+            of the internal ids in internal_column_name of df from the
+            lookup tables, which keeps the order of the rows of df.
+            """
+            return (
+                self.external_ids is not None
+                and cudf.api.types.is_integer_dtype(df[internal_column_name].dtype)
+                and self.col_names[0] not in df.columns
+            )
+
+        def lookup_internal_ids(self, vertices):
+            """
+            Returns the internal ids of the external ids in vertices, found
+            by binary search, with nulls for the vertices not in the map.
+            """
+            num_ids = len(self.sorted_external_ids)
+            if num_ids == 0:
+                return cudf.Series(
+                    cudf.core.column.column_empty(
+                        len(vertices), self.id_type, masked=True
+                    )
+                )
+            values = vertices.fillna(0).values.astype(self.sorted_external_ids.dtype)
+            positions = cupy.minimum(
+                cupy.searchsorted(self.sorted_external_ids, values), num_ids - 1
+            )
+            found = vertices.notna().values & (
+                self.sorted_external_ids[positions] == values
+            )
+            return cudf.Series(self.sorted_internal_ids[positions]).where(found)
+
+        def lookup_external_ids(self, ids):
+            """
+            Returns the external ids of the internal ids in ids, gathered
+            from the lookup table, with nulls for the ids not in the map.
+            """
+            num_ids = len(self.external_ids)
+            if num_ids == 0:
+                return cudf.Series(
+                    cudf.core.column.column_empty(
+                        len(ids), self.external_ids.dtype, masked=True
+                    )
+                )
+            valid = ((ids >= 0) & (ids < num_ids)).fillna(False).values
+            positions = cupy.where(valid, ids.fillna(0).values, 0)
+            return cudf.Series(self.external_ids[positions]).where(valid)
 
         def to_internal_vertex_id(self, df, col_names):
+            if self.can_lookup_internal_ids(df, col_names):
+                return self.lookup_internal_ids(df[col_names[0]]).rename("id")
+
             tmp_df = df[col_names].rename(
                 columns=dict(zip(col_names, self.col_names)), copy=False
             )
@@ -51,14 +143,22 @@ class NumberMap:
         def from_internal_vertex_id(
             self, df, internal_column_name, external_column_names
         ):
-            tmp_df = self.df.merge(
-                df,
-                right_on=internal_column_name,
-                left_on="id",
-                how="right",
-            )
-            if internal_column_name != "id":
-                tmp_df = tmp_df.drop(columns=["id"])
+            if self.can_lookup_external_ids(df, internal_column_name):
+                tmp_df = df.reset_index(drop=True)
+                tmp_df.insert(
+                    0,
+                    self.col_names[0],
+                    self.lookup_external_ids(tmp_df[internal_column_name]),
+                )
+            else:
+                tmp_df = self.df.merge(
+                    df,
+                    right_on=internal_column_name,
+                    left_on="id",
+                    how="right",
+                )
+                if internal_column_name != "id":
+                    tmp_df = tmp_df.drop(columns=["id"])
             if external_column_names is None:
                 return tmp_df
             else:
@@ -72,6 +172,16 @@ class NumberMap:
         ):
             ret = None
 
+            if self.can_lookup_internal_ids(df, col_names):
+                # The lookup keeps the order of the rows of df
+                ret = df.drop(columns=col_names) if drop else df.copy(deep=False)
+                if id_column_name not in ret.columns:
+                    ret = ret.reset_index(drop=True)
+                    ret.insert(
+                        0, id_column_name, self.lookup_internal_ids(df[col_names[0]])
+                    )
+                    return ret
+
             if preserve_order:
                 index_name = NumberMap.generate_unused_column_name(df.columns)
                 tmp_df = df
@@ -136,6 +246,7 @@ class NumberMap:
             tmp_df = tmp_df.groupby(self.col_names).count().reset_index()
             tmp_df["id"] = tmp_df.index.astype(self.id_type)
             self.df = tmp_df
+            self.build_lookup_tables()
             return tmp_df
 
     class MultiGPU:
@@ -152,6 +263,10 @@ class NumberMap:
             self.store_transposed = store_transposed
             self.numbered = False
 
+        def can_lookup_external_ids(self, ddf, internal_column_name):
+            # The ids are always converted by merging with self.ddf
+            return False
+
         def to_internal_vertex_id(self, ddf, col_names):
             tmp_ddf = ddf[col_names].rename(
                 columns=dict(zip(col_names, self.col_names))
@@ -696,6 +811,13 @@ class NumberMap:
         if len(self.implementation.col_names) == 1:
             col_names = col_names[0]
 
+        # Gathering the external ids from the lookup table keeps the order
+        # of the rows
+        if preserve_order and self.implementation.can_lookup_external_ids(
+            df, column_name
+        ):
+            preserve_order = False
+
         if preserve_order:
             index_name = NumberMap.generate_unused_column_name(df)
             df[index_name] = df.index
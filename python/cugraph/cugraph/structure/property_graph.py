@@ -11,6 +11,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
+from functools import lru_cache
+
 import cudf
 import numpy as np
 
@@ -30,6 +33,15 @@ if not isinstance(pd, MissingModule):
     _dataframe_types.append(pd.DataFrame)
 
 
+@lru_cache(maxsize=1024)
+def _compile_selection_expr(expr):
+    """
+    Returns the code object for a select_vertices() or select_edges()
+    expression, so each distinct expression is only parsed once.
+    """
+    return compile(expr, "<selection>", "eval")
+
+
 # FIXME: remove leading EXPERIMENTAL__ when no longer experimental
 class EXPERIMENTAL__PropertySelection:
     """
@@ -123,6 +135,12 @@ class EXPERIMENTAL__PropertyGraph:
 
     _default_type_name = ""
 
+    selection_cache_maxsize = 512
+    """
+    Maximum number of select_vertices() and select_edges() results cached
+    per PropertyGraph. Set to 0 to disable caching.
+    """
+
     _internal_col_names = set(
         (
             vertex_col_name,
@@ -214,6 +232,24 @@ class EXPERIMENTAL__PropertyGraph:
         self.__vertex_type_value_counts = None
         self.__edge_type_value_counts = None
 
+        # Incremented each time the vertex or edge property DataFrame changes,
+        # these are part of the key of cached selections so results are only
+        # reused while the DataFrame they were computed from is unchanged.
+        self.__vertex_prop_version = 0
+        self.__edge_prop_version = 0
+
+        # LRU cache of select_vertices()/select_edges() results, keyed by
+        # ("vertex" or "edge", expression, vertex or edge prop version).
+        self.__selection_cache = OrderedDict()
+        self.__selection_cache_hits = 0
+        self.__selection_cache_misses = 0
+
+        # Batches staged by add_vertex_data()/add_edge_data() between calls to
+        # begin_bulk_load() and commit(), or None if not bulk loading. Each
+        # item is a ("vertex" or "edge", add_*_data kwargs, [dataframes])
+        # tuple, where consecutive batches with identical kwargs are grouped.
+        self.__bulk_load_batches = None
+
     def _build_from_components(
         self,
         *,
@@ -266,6 +302,8 @@ class EXPERIMENTAL__PropertyGraph:
         self.__num_vertices = num_vertices
         self.__vertex_type_value_counts = vertex_type_value_counts
         self.__edge_type_value_counts = edge_type_value_counts
+        self.__invalidate_selections("vertex")
+        self.__invalidate_selections("edge")
 
     # PropertyGraph read-only attributes
     @property
@@ -602,6 +640,154 @@ class EXPERIMENTAL__PropertyGraph:
         """
         return self.__edge_prop_dataframe[self.type_col_name].dtype.categories[nums]
 
+    def begin_bulk_load(self):
+        """
+        Start staging vertex and edge data for a bulk load.
+
+        Until commit() is called, add_vertex_data() and add_edge_data() only
+        stage their DataFrames instead of merging each one into the internal
+        property tables, so staged data is not visible in the PropertyGraph.
+        commit() then concatenates consecutive batches added with the same
+        arguments and adds them with a single add_*_data() call, so the
+        dtype reconciliation, type categories update, edge ID assignment and
+        merge are done once per group rather than once per batch.
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> import cudf
+        >>> from cugraph.experimental import PropertyGraph
+        >>> pG = PropertyGraph()
+        >>> pG.begin_bulk_load()
+        >>> for i in range(4):
+        ...     df = cudf.DataFrame({"src": [i], "dst": [i + 1], "w": [i * 0.5]})
+        ...     pG.add_edge_data(df, vertex_col_names=("src", "dst"))
+        >>> pG.get_num_edges()
+        0
+        >>> pG.commit()
+        >>> pG.get_num_edges()
+        4
+        """
+        if self.__bulk_load_batches is not None:
+            raise RuntimeError("a bulk load has already been started")
+        self.__bulk_load_batches = []
+
+    def commit(self):
+        """
+        Add all vertex and edge data staged since begin_bulk_load().
+
+        Batches are added in the order they were staged, so automatically
+        generated edge IDs are the same as if each batch had been added
+        individually. Only consecutive batches with the same columns and
+        dtypes are concatenated, and vertex IDs that appear more than once in
+        a group are combined like separate add_vertex_data() calls would: the
+        first values are kept, and missing values are filled from later rows.
+
+        The arguments of each batch are validated when it is staged, but if
+        adding a group of batches still fails, the groups before it remain
+        added and the failed group and the groups after it remain staged, so
+        the bulk load is still in progress.
+
+        Returns
+        -------
+        None
+        """
+        if self.__bulk_load_batches is None:
+            raise RuntimeError("commit() called without begin_bulk_load()")
+        batches = self.__bulk_load_batches
+
+        while batches:
+            (kind, kwargs, dataframes) = batches[0]
+            if len(dataframes) == 1:
+                df = dataframes[0]
+            else:
+                if type(dataframes[0]) is cudf.DataFrame:
+                    df = cudf.concat(dataframes)
+                else:
+                    df = pd.concat(dataframes)
+                if kind == "vertex":
+                    df = self.__combine_duplicate_vertices(
+                        df, kwargs["vertex_col_name"]
+                    )
+            # Add the group as if not bulk loading
+            self.__bulk_load_batches = None
+            try:
+                if kind == "vertex":
+                    self.add_vertex_data(df, **kwargs)
+                else:
+                    self.add_edge_data(df, **kwargs)
+            finally:
+                self.__bulk_load_batches = batches
+            batches.pop(0)
+
+        self.__bulk_load_batches = None
+
+    @staticmethod
+    def __combine_duplicate_vertices(df, vertex_col_name):
+        """
+        Returns df with the rows of each vertex ID combined into one row the
+        same way add_vertex_data() combines the data of a vertex added more
+        than once: existing values are kept and missing values are filled in.
+        """
+        index_is_set = vertex_col_name not in df.columns
+        vertex_ids = df.index if index_is_set else df[vertex_col_name]
+        if not vertex_ids.duplicated().any():
+            return df
+
+        if index_is_set:
+            df = df.reset_index()
+        dtypes = df.dtypes.drop(vertex_col_name)
+        occurrence = df.groupby(vertex_col_name, sort=False).cumcount()
+        combined = df[occurrence == 0].set_index(vertex_col_name)
+        for i in range(1, int(occurrence.max()) + 1):
+            later = df[occurrence == i].set_index(vertex_col_name)
+            joined = combined.join(later, how="left", rsuffix="_NEW_")
+            rename_cols = {f"{col}_NEW_": col for col in later.columns}
+            new_cols = list(rename_cols)
+            sub_df = joined[new_cols].rename(columns=rename_cols)
+            joined.drop(columns=new_cols, inplace=True)
+            # This only adds data--it doesn't replace existing data
+            joined.fillna(sub_df, inplace=True)
+            combined = joined
+        # Restore dtypes changed by the joins (values missing from every row
+        # of a vertex were already missing, so the original dtypes hold them)
+        combined = combined.astype(dtypes)
+
+        if index_is_set:
+            return combined
+        return combined.reset_index()
+
+    def __stage_bulk_load_batch(self, kind, dataframe, kwargs):
+        """
+        Stages dataframe to be added by commit(), grouping it with the previous
+        batch if that was staged for the same kind of data with the same
+        add_*_data() arguments and has the same columns and dtypes.
+        """
+        batches = self.__bulk_load_batches
+        if batches:
+            expected_type = type(batches[0][2][0])
+        else:
+            expected_type = self.__dataframe_type
+        if expected_type is not None and type(dataframe) is not expected_type:
+            raise TypeError(
+                f"dataframe is type {type(dataframe)} but "
+                "the PropertyGraph was already initialized "
+                f"using type {expected_type}"
+            )
+        if (
+            batches
+            and batches[-1][0] == kind
+            and batches[-1][1] == kwargs
+            # Concatenating different columns would change their dtypes
+            and batches[-1][2][-1].dtypes.equals(dataframe.dtypes)
+        ):
+            batches[-1][2].append(dataframe)
+        else:
+            batches.append((kind, kwargs, [dataframe]))
+
     def add_vertex_data(
         self,
         dataframe,
@@ -653,6 +839,11 @@ class EXPERIMENTAL__PropertyGraph:
         -------
         None
 
+        Notes
+        -----
+        If begin_bulk_load() was called, dataframe is only staged and is added
+        by the next call to commit().
+
         Examples
         --------
         >>> import cugraph
@@ -718,17 +909,17 @@ class EXPERIMENTAL__PropertyGraph:
                     f"vector properties: {', '.join(sorted(existing_vectors))}"
                 )
 
-        # Save the DataFrame and Series types for future instantiations
-        if self.__dataframe_type is None or self.__series_type is None:
-            self.__dataframe_type = type(dataframe)
-            self.__series_type = type(dataframe[dataframe.columns[0]])
-        else:
-            if type(dataframe) is not self.__dataframe_type:
-                raise TypeError(
-                    f"dataframe is type {type(dataframe)} but "
-                    "the PropertyGraph was already initialized "
-                    f"using type {self.__dataframe_type}"
-                )
+        bulk_load_kwargs = dict(
+            vertex_col_name=vertex_col_name,
+            type_name=type_name,
+            property_columns=property_columns,
+            vector_properties=vector_properties,
+            vector_property=vector_property,
+        )
+        # Check vector properties against a copy of the known lengths, which
+        # is only saved once the data is added (staged data is added later)
+        vector_property_lengths = dict(self.__vertex_vector_property_lengths)
+
         TCN = self.type_col_name
         if vector_properties is not None:
             invalid_keys = {self.vertex_col_name, TCN}
@@ -737,7 +928,7 @@ class EXPERIMENTAL__PropertyGraph:
             self._check_vector_properties(
                 dataframe,
                 vector_properties,
-                self.__vertex_vector_property_lengths,
+                vector_property_lengths,
                 invalid_keys,
             )
         if vector_property is not None:
@@ -755,7 +946,7 @@ class EXPERIMENTAL__PropertyGraph:
             self._check_vector_properties(
                 dataframe,
                 d,
-                self.__vertex_vector_property_lengths,
+                vector_property_lengths,
                 invalid_keys,
             )
             # Update vector_properties, but don't mutate the original
@@ -763,6 +954,23 @@ class EXPERIMENTAL__PropertyGraph:
                 d.update(vector_properties)
             vector_properties = d
 
+        if self.__bulk_load_batches is not None:
+            self.__stage_bulk_load_batch("vertex", dataframe, bulk_load_kwargs)
+            return
+
+        # Save the DataFrame and Series types for future instantiations
+        if self.__dataframe_type is None or self.__series_type is None:
+            self.__dataframe_type = type(dataframe)
+            self.__series_type = type(dataframe[dataframe.columns[0]])
+        else:
+            if type(dataframe) is not self.__dataframe_type:
+                raise TypeError(
+                    f"dataframe is type {type(dataframe)} but "
+                    "the PropertyGraph was already initialized "
+                    f"using type {self.__dataframe_type}"
+                )
+        self.__vertex_vector_property_lengths.update(vector_property_lengths)
+
         # Clear the cached values related to the number of vertices since more
         # could be added in this method.
         self.__num_vertices = None
@@ -877,6 +1085,7 @@ class EXPERIMENTAL__PropertyGraph:
             self.__vertex_prop_dataframe,
             self.vertex_col_name,
         )
+        self.__invalidate_selections("vertex")
 
     def _update_eval_dict(self, eval_dict, df, index_name):
         # Update the vertex eval dict with the latest column instances
@@ -1034,6 +1243,11 @@ class EXPERIMENTAL__PropertyGraph:
         -------
         None
 
+        Notes
+        -----
+        If begin_bulk_load() was called, dataframe is only staged and is added
+        by the next call to commit().
+
         Examples
         --------
         >>> import cugraph
@@ -1105,24 +1319,33 @@ class EXPERIMENTAL__PropertyGraph:
                     f"vector properties: {', '.join(sorted(existing_vectors))}"
                 )
 
-        # Save the DataFrame and Series types for future instantiations
-        if self.__dataframe_type is None or self.__series_type is None:
-            self.__dataframe_type = type(dataframe)
-            self.__series_type = type(dataframe[dataframe.columns[0]])
-        else:
-            if type(dataframe) is not self.__dataframe_type:
-                raise TypeError(
-                    f"dataframe is type {type(dataframe)} but "
-                    "the PropertyGraph was already initialized "
-                    f"using type {self.__dataframe_type}"
-                )
-        if self.__is_edge_id_autogenerated is False and edge_id_col_name is None:
+        bulk_load_kwargs = dict(
+            vertex_col_names=vertex_col_names,
+            edge_id_col_name=edge_id_col_name,
+            type_name=type_name,
+            property_columns=property_columns,
+            vector_properties=vector_properties,
+            vector_property=vector_property,
+        )
+        # Check vector properties against a copy of the known lengths, which
+        # is only saved once the data is added (staged data is added later)
+        vector_property_lengths = dict(self.__edge_vector_property_lengths)
+        is_edge_id_autogenerated = self.__is_edge_id_autogenerated
+        if self.__bulk_load_batches is not None:
+            if is_edge_id_autogenerated is None:
+                # The first staged edge batch determines how edge IDs are set
+                for kind, kwargs, _ in self.__bulk_load_batches:
+                    if kind == "edge":
+                        is_edge_id_autogenerated = kwargs["edge_id_col_name"] is None
+                        break
+
+        if is_edge_id_autogenerated is False and edge_id_col_name is None:
             raise NotImplementedError(
                 "Unable to automatically generate edge IDs. "
                 "`edge_id_col_name` must be specified if edge data has been "
                 "previously added with edge_id_col_name."
             )
-        if self.__is_edge_id_autogenerated is True and edge_id_col_name is not None:
+        if is_edge_id_autogenerated is True and edge_id_col_name is not None:
             raise NotImplementedError(
                 "Invalid use of `edge_id_col_name`. Edge data has already "
                 "been added with automatically generated IDs, so now all "
@@ -1137,7 +1360,7 @@ class EXPERIMENTAL__PropertyGraph:
             self._check_vector_properties(
                 dataframe,
                 vector_properties,
-                self.__edge_vector_property_lengths,
+                vector_property_lengths,
                 invalid_keys,
             )
         if vector_property is not None:
@@ -1161,7 +1384,7 @@ class EXPERIMENTAL__PropertyGraph:
             self._check_vector_properties(
                 dataframe,
                 d,
-                self.__edge_vector_property_lengths,
+                vector_property_lengths,
                 invalid_keys,
             )
             # Update vector_properties, but don't mutate the original
@@ -1169,6 +1392,23 @@ class EXPERIMENTAL__PropertyGraph:
                 d.update(vector_properties)
             vector_properties = d
 
+        if self.__bulk_load_batches is not None:
+            self.__stage_bulk_load_batch("edge", dataframe, bulk_load_kwargs)
+            return
+
+        # Save the DataFrame and Series types for future instantiations
+        if self.__dataframe_type is None or self.__series_type is None:
+            self.__dataframe_type = type(dataframe)
+            self.__series_type = type(dataframe[dataframe.columns[0]])
+        else:
+            if type(dataframe) is not self.__dataframe_type:
+                raise TypeError(
+                    f"dataframe is type {type(dataframe)} but "
+                    "the PropertyGraph was already initialized "
+                    f"using type {self.__dataframe_type}"
+                )
+        self.__edge_vector_property_lengths.update(vector_property_lengths)
+
         # Clear the cached value for num_vertices since more could be added in
         # this method. This method cannot affect __node_type_value_counts
         self.__num_vertices = None
@@ -1289,6 +1529,7 @@ class EXPERIMENTAL__PropertyGraph:
             self.__edge_prop_dataframe,
             self.edge_id_col_name,
         )
+        self.__invalidate_selections("edge")
 
     def get_edge_data(self, edge_ids=None, types=None, columns=None):
         """
@@ -1401,6 +1642,12 @@ class EXPERIMENTAL__PropertyGraph:
             val = dict((k, val) for k in user_col_names)
 
         self.__vertex_prop_dataframe.fillna(val, inplace=True)
+        self._update_eval_dict(
+            self.__vertex_prop_eval_dict,
+            self.__vertex_prop_dataframe,
+            self.vertex_col_name,
+        )
+        self.__invalidate_selections("vertex")
 
     def fillna_edges(self, val=0):
         """
@@ -1424,6 +1671,12 @@ class EXPERIMENTAL__PropertyGraph:
             val = dict((k, val) for k in user_col_names)
 
         self.__edge_prop_dataframe.fillna(val, inplace=True)
+        self._update_eval_dict(
+            self.__edge_prop_eval_dict,
+            self.__edge_prop_dataframe,
+            self.edge_id_col_name,
+        )
+        self.__invalidate_selections("edge")
 
     def select_vertices(self, expr, from_previous_selection=None):
         """
@@ -1488,11 +1741,17 @@ class EXPERIMENTAL__PropertyGraph:
 
             locals = dict([(n, rows_to_eval[n]) for n in rows_to_eval.columns])
             locals[self.vertex_col_name] = rows_to_eval.index
+            cache_key = None
         else:
             locals = self.__vertex_prop_eval_dict
+            cache_key = ("vertex", expr, self.__vertex_prop_version)
+
+        selected_col = self.__get_cached_selection(cache_key)
+        if selected_col is not None:
+            return EXPERIMENTAL__PropertySelection(vertex_selection_series=selected_col)
 
         globals = {}
-        selected_col = eval(expr, globals, locals)
+        selected_col = eval(_compile_selection_expr(expr), globals, locals)
 
         num_rows = len(self.__vertex_prop_dataframe)
         # Ensure the column is the same size as the DataFrame, then replace any
@@ -1505,6 +1764,7 @@ class EXPERIMENTAL__PropertyGraph:
                 self.__vertex_prop_dataframe.index, fill_value=False, copy=False
             )
 
+        self.__cache_selection(cache_key, selected_col)
         return EXPERIMENTAL__PropertySelection(vertex_selection_series=selected_col)
 
     def select_edges(self, expr):
@@ -1549,12 +1809,69 @@ class EXPERIMENTAL__PropertyGraph:
         0   96   88
         """
         # FIXME: check types
-        globals = {}
-        locals = self.__edge_prop_eval_dict
+        cache_key = ("edge", expr, self.__edge_prop_version)
+        selected_col = self.__get_cached_selection(cache_key)
+        if selected_col is None:
+            globals = {}
+            locals = self.__edge_prop_eval_dict
+
+            selected_col = eval(_compile_selection_expr(expr), globals, locals)
+            self.__cache_selection(cache_key, selected_col)
 
-        selected_col = eval(expr, globals, locals)
         return EXPERIMENTAL__PropertySelection(edge_selection_series=selected_col)
 
+    def selection_cache_info(self):
+        """
+        Returns a dictionary with the number of select_vertices() and
+        select_edges() calls whose result was reused from the cache ("hits")
+        or had to be evaluated ("misses"), the number of cached results
+        ("currsize") and the maximum ("maxsize").
+
+        Cached results are reused until the vertex or edge properties they
+        were selected from change.
+        """
+        return {
+            "hits": self.__selection_cache_hits,
+            "misses": self.__selection_cache_misses,
+            "currsize": len(self.__selection_cache),
+            "maxsize": self.selection_cache_maxsize,
+        }
+
+    def __get_cached_selection(self, cache_key):
+        """
+        Returns the cached selection Series for cache_key, or None if not
+        cached. A cache_key of None is never cached.
+        """
+        if cache_key is None or self.selection_cache_maxsize <= 0:
+            return None
+        selected_col = self.__selection_cache.get(cache_key)
+        if selected_col is None:
+            self.__selection_cache_misses += 1
+        else:
+            self.__selection_cache_hits += 1
+            self.__selection_cache.move_to_end(cache_key)
+        return selected_col
+
+    def __cache_selection(self, cache_key, selected_col):
+        if cache_key is None or self.selection_cache_maxsize <= 0:
+            return
+        self.__selection_cache[cache_key] = selected_col
+        while len(self.__selection_cache) > self.selection_cache_maxsize:
+            self.__selection_cache.popitem(last=False)
+
+    def __invalidate_selections(self, kind):
+        """
+        Called whenever the vertex (kind="vertex") or edge (kind="edge")
+        property DataFrame changes, so selections made from the prior data are
+        no longer reused.
+        """
+        if kind == "vertex":
+            self.__vertex_prop_version += 1
+        else:
+            self.__edge_prop_version += 1
+        for key in [k for k in self.__selection_cache if k[0] == kind]:
+            del self.__selection_cache[key]
+
     def extract_subgraph(
         self,
         create_using=None,
@@ -2109,6 +2426,19 @@ class EXPERIMENTAL__PropertyGraph:
             df.rename(columns={self.vertex_col_name: prev_id_column}, inplace=True)
         df.index.name = self.vertex_col_name
         self.__vertex_prop_dataframe = df
+        self._update_eval_dict(
+            self.__vertex_prop_eval_dict,
+            self.__vertex_prop_dataframe,
+            self.vertex_col_name,
+        )
+        self.__invalidate_selections("vertex")
+        if self.__edge_prop_dataframe is not None:
+            self._update_eval_dict(
+                self.__edge_prop_eval_dict,
+                self.__edge_prop_dataframe,
+                self.edge_id_col_name,
+            )
+            self.__invalidate_selections("edge")
         rv = self._vertex_type_value_counts.sort_index().cumsum().to_frame("stop")
         rv["start"] = rv["stop"].shift(1, fill_value=0)
         rv["stop"] -= 1  # Make inclusive
@@ -2197,6 +2527,12 @@ class EXPERIMENTAL__PropertyGraph:
         df.index = df.index.astype(index_dtype)
         df.index.name = self.edge_id_col_name
         self.__edge_prop_dataframe = df
+        self._update_eval_dict(
+            self.__edge_prop_eval_dict,
+            self.__edge_prop_dataframe,
+            self.edge_id_col_name,
+        )
+        self.__invalidate_selections("edge")
         rv = self._edge_type_value_counts.sort_index().cumsum().to_frame("stop")
         rv["start"] = rv["stop"].shift(1, fill_value=0)
         rv["stop"] -= 1  # Make inclusive
@@ -13,13 +13,20 @@
 
 from cugraph.structure import graph_classes as csg
 import cudf
+import cupy
 import dask_cudf
 from dask.distributed import default_client
 import warnings
 
 
 def symmetrize_df(
-    df, src_name, dst_name, weight_name=None, multi=False, symmetrize=True
+    df,
+    src_name,
+    dst_name,
+    weight_name=None,
+    multi=False,
+    symmetrize=True,
+    method="auto",
 ):
     """
     Take a COO stored in a DataFrame, along with the column names of
@@ -67,6 +74,18 @@ def symmetrize_df(
         Default is True to perform symmetrization. If False only duplicate
         edges are dropped.
 
+    method : str, optional (default='auto')
+        How duplicate edges are dropped if multi is False.  'groupby' groups
+        the symmetrized data frame by the source and destination columns and
+        keeps the smallest value of each other column.  'hash' packs each
+        (source, destination) pair into a 64-bit key, drops duplicate keys
+        with a hash-based pass over the keys and weights only, and then
+        gathers the weights of the remaining edges, using much less memory.
+        'hash' requires a single source and destination column of the same
+        integer type with ids in [0, 2**32), no nulls, and at most one
+        other column (the weight).  'auto' uses 'hash' if it is supported,
+        and 'groupby' otherwise.
+
     Examples
     --------
     >>> from cugraph.structure.symmetrize import symmetrize_df
@@ -81,6 +100,29 @@ def symmetrize_df(
         dst_name = [dst_name]
     if weight_name is not None and not isinstance(weight_name, list):
         weight_name = [weight_name]
+    if method not in ["auto", "groupby", "hash"]:
+        raise ValueError(
+            f"method must be one of 'auto', 'groupby' or 'hash', got: {method}"
+        )
+
+    if not multi:
+        warnings.warn(
+            "Multi is deprecated and the removal of multi edges will no longer be "
+            "supported from 'symmetrize'. Multi edges will be removed upon creation "
+            "of graph instance.",
+            FutureWarning,
+        )
+        if method != "groupby":
+            if _is_hash_supported(df, src_name, dst_name, weight_name):
+                return _symmetrize_df_hash(
+                    df, src_name[0], dst_name[0], weight_name, symmetrize
+                )
+            if method == "hash":
+                raise ValueError(
+                    "method='hash' requires single source and destination "
+                    "columns of the same integer type with ids in [0, 2**32), "
+                    "no nulls, and at most one weight column"
+                )
 
     if symmetrize:
         result = _add_reverse_edges(df, src_name, dst_name, weight_name)
@@ -89,17 +131,77 @@ def symmetrize_df(
     if multi:
         return result
     else:
-        warnings.warn(
-            "Multi is deprecated and the removal of multi edges will no longer be "
-            "supported from 'symmetrize'. Multi edges will be removed upon creation "
-            "of graph instance.",
-            FutureWarning,
-        )
         vertex_col_name = src_name + dst_name
         result = result.groupby(by=[*vertex_col_name], as_index=False).min()
         return result
 
 
+def _is_hash_supported(df, src_name, dst_name, weight_name):
+    """
+    Returns True if the (src, dst) pairs of df can be packed into 64-bit
+    keys and the other columns of df are at most a single weight column.
+    """
+    weight_name = weight_name or []
+    if len(src_name) != 1 or len(dst_name) != 1 or len(weight_name) > 1:
+        return False
+    if set(df.columns) != {*src_name, *dst_name, *weight_name}:
+        return False
+    if any(df[col].has_nulls for col in df.columns):
+        return False
+
+    src = df[src_name[0]]
+    dst = df[dst_name[0]]
+    if src.dtype != dst.dtype or src.dtype.kind not in "iu":
+        return False
+    if len(df) == 0:
+        return True
+    return min(src.min(), dst.min()) >= 0 and max(src.max(), dst.max()) < 2**32
+
+
+def _symmetrize_df_hash(df, src_name, dst_name, weight_name, symmetrize):
+    """
+    symmetrize_df (with multi=False) for the edge lists supported by
+    _is_hash_supported.  Only the packed keys and weights are copied to
+    add the reverse edges and drop duplicates; the weight of each
+    remaining edge is then gathered from df.
+    """
+    src = df[src_name].values.astype("uint64")
+    dst = df[dst_name].values.astype("uint64")
+    shift = cupy.uint64(32)
+    keys = (src << shift) | dst
+    if symmetrize:
+        keys = cupy.concatenate([keys, (dst << shift) | src])
+    del src, dst
+
+    if weight_name:
+        # Keep the edge with the smallest weight, like groupby().min()
+        weight = df[weight_name[0]].reset_index(drop=True)
+        edges = cudf.DataFrame(
+            {
+                "key": keys,
+                "weight": cudf.concat([weight, weight], ignore_index=True)
+                if symmetrize
+                else weight,
+            }
+        )
+        del keys
+        rows = edges.groupby("key", sort=False)["weight"].idxmin()
+        del edges
+        keys = rows.index.values
+        # Rows of the reverse edges refer to the rows of the original edges
+        weight = weight.iloc[rows.values % len(df)].reset_index(drop=True)
+    else:
+        keys = cudf.Series(keys).unique().values
+
+    result = cudf.DataFrame()
+    dtype = df[src_name].dtype
+    result[src_name] = (keys >> cupy.uint64(32)).astype(dtype)
+    result[dst_name] = (keys & cupy.uint64(0xFFFFFFFF)).astype(dtype)
+    if weight_name:
+        result[weight_name[0]] = weight
+    return result
+
+
 def symmetrize_ddf(
     ddf, src_name, dst_name, weight_name=None, multi=False, symmetrize=True
 ):
@@ -205,6 +307,7 @@ def symmetrize(
     multi=False,
     symmetrize=True,
     do_expensive_check=False,
+    method="auto",
 ):
     """
     Take a dataframe of source destination pairs along with associated
@@ -244,6 +347,9 @@ def symmetrize(
         Default is True to perform symmetrization. If False only duplicate
         edges are dropped.
 
+    method : str, optional (default='auto')
+        How duplicate edges are dropped from a cudf.DataFrame, see
+        symmetrize_df.  Ignored for a dask_cudf.DataFrame.
 
     Examples
     --------
@@ -283,6 +389,7 @@ def symmetrize(
             value_col_name,
             multi,
             symmetrize,
+            method=method,
         )
     if value_col_name is not None:
         value_col = output_df[value_col_name]
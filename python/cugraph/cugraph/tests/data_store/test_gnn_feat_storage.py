@@ -1,4 +1,4 @@
-# Copyright (c) 2023, NVIDIA CORPORATION.
+# Copyright (c) 2023-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -106,3 +106,89 @@ def test_feature_storage_pytorch_backend():
     expected = ar3[indices_to_fetch]
     assert isinstance(output_fs, torch.Tensor)
     np.testing.assert_array_equal(output_fs.numpy(), expected)
+
+
+@pytest.mark.sg
+def test_feature_storage_mmap_backend(tmp_path):
+    ar1 = np.random.randint(low=0, high=100, size=100_000)
+    ar2 = np.random.randint(low=0, high=100, size=100_000).reshape(10_000, -1)
+    df2 = cudf.DataFrame(ar2)
+    ar3 = np.random.random(size=100_000).reshape(-1, 10)
+    np.save(tmp_path / "ar3.npy", ar3)
+
+    fs = FeatureStore(backend="mmap", mmap_dir=str(tmp_path / "fs"))
+    fs.add_data(ar1, "type1", "feat1")
+    fs.add_data(df2, "type1", "feat2")
+    fs.add_data(str(tmp_path / "ar3.npy"), "type2", "feat1")
+    assert fs.get_storage("type1", "feat1") == "cpu"
+    for feat in fs.fd.values():
+        for ar in feat.values():
+            assert isinstance(ar, np.memmap)
+
+    # Unsorted indices with repeats
+    indices_to_fetch = np.random.randint(low=0, high=len(ar1), size=1024)
+    output_fs = fs.get_data(indices_to_fetch, type_name="type1", feat_name="feat1")
+    assert not isinstance(output_fs, np.memmap)
+    np.testing.assert_array_equal(output_fs, ar1[indices_to_fetch])
+
+    indices_to_fetch = np.random.randint(low=0, high=len(ar2), size=1024)
+    output_fs = fs.get_data(indices_to_fetch, type_name="type1", feat_name="feat2")
+    np.testing.assert_array_equal(output_fs, ar2[indices_to_fetch])
+
+    indices_to_fetch = np.arange(100, 200)
+    output_fs = fs.get_data(indices_to_fetch, type_name="type2", feat_name="feat1")
+    np.testing.assert_array_equal(output_fs, ar3[indices_to_fetch])
+
+
+@pytest.mark.sg
+def test_feature_storage_mmap_backend_from_cuda_tensor(tmp_path):
+    try:
+        import torch
+    except ModuleNotFoundError:
+        pytest.skip("pytorch not available")
+
+    ar1 = np.random.random(size=100_000).reshape(-1, 10).astype("float32")
+    fs = FeatureStore(backend="mmap", mmap_dir=str(tmp_path / "fs"))
+    fs.add_data(torch.as_tensor(ar1, device="cuda"), "type1", "feat1")
+    assert isinstance(fs.fd["feat1"]["type1"], np.memmap)
+
+    indices_to_fetch = np.random.randint(low=0, high=len(ar1), size=1024)
+    output_fs = fs.get_data(indices_to_fetch, type_name="type1", feat_name="feat1")
+    np.testing.assert_array_equal(output_fs, ar1[indices_to_fetch])
+
+
+@pytest.mark.sg
+@pytest.mark.parametrize("cache_policy", ["lru", "lfu"])
+def test_feature_storage_cache(cache_policy):
+    ar1 = np.random.randint(low=0, high=100, size=100_000).reshape(10_000, -1)
+    fs = FeatureStore(backend="numpy", cache_size=100, cache_policy=cache_policy)
+    fs.add_data(ar1, "type1", "feat1")
+
+    # Warm the cache with the 100 highest-degree rows
+    degrees = np.zeros(len(ar1), dtype="int64")
+    degrees[500:600] = 10
+    fs.warm_cache("type1", "feat1", degrees)
+    assert fs.cache_stats()["feat1"]["type1"]["size"] == 100
+
+    indices_to_fetch = np.random.randint(low=500, high=600, size=1024)
+    output_fs = fs.get_data(indices_to_fetch, type_name="type1", feat_name="feat1")
+    np.testing.assert_array_equal(output_fs, ar1[indices_to_fetch])
+    stats = fs.cache_stats()["feat1"]["type1"]
+    assert stats["hits"] == 1024
+    assert stats["misses"] == 0
+
+    # Partial hits, evicting rows not fetched again
+    for _ in range(3):
+        indices_to_fetch = np.random.randint(low=550, high=650, size=1024)
+        output_fs = fs.get_data(indices_to_fetch, type_name="type1", feat_name="feat1")
+        np.testing.assert_array_equal(output_fs, ar1[indices_to_fetch])
+    stats = fs.cache_stats()["feat1"]["type1"]
+    assert stats["size"] == 100
+    assert stats["evictions"] > 0
+    assert stats["hits"] + stats["misses"] == 4 * 1024
+    assert 0 < stats["hit_rate"] < 1
+
+    # Replacing the data invalidates the cache
+    fs.add_data(ar1 + 1, "type1", "feat1")
+    output_fs = fs.get_data(indices_to_fetch, type_name="type1", feat_name="feat1")
+    np.testing.assert_array_equal(output_fs, ar1[indices_to_fetch] + 1)
@@ -1325,6 +1325,206 @@ def test_extract_subgraph_specific_query(dataset1_PropertyGraph, as_pg_first):
     assert_frame_equal(expected_edgelist, actual_edgelist, check_like=True)
 
 
+@pytest.mark.sg
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_bulk_load(df_type):
+    """
+    Ensures data staged between begin_bulk_load() and commit() results in the
+    same PropertyGraph as adding each batch individually.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    (merchants, users, _, transactions, relationships, _) = dataset1.values()
+
+    def add_data(pG):
+        for row in users[1]:
+            pG.add_vertex_data(
+                df_type(columns=users[0], data=[row]),
+                type_name="users",
+                vertex_col_name="user_id",
+            )
+        pG.add_vertex_data(
+            df_type(columns=merchants[0], data=merchants[1]),
+            type_name="merchants",
+            vertex_col_name="merchant_id",
+        )
+        for i in range(0, len(transactions[1]), 2):
+            pG.add_edge_data(
+                df_type(columns=transactions[0], data=transactions[1][i : i + 2]),
+                type_name="transactions",
+                vertex_col_names=("user_id", "merchant_id"),
+            )
+        for row in relationships[1]:
+            pG.add_edge_data(
+                df_type(columns=relationships[0], data=[row]),
+                type_name="relationships",
+                vertex_col_names=("user_id_1", "user_id_2"),
+            )
+
+    expected_pG = PropertyGraph()
+    add_data(expected_pG)
+
+    pG = PropertyGraph()
+    pG.begin_bulk_load()
+    add_data(pG)
+    assert pG.get_num_vertices() == 0
+    assert pG.get_num_edges() == 0
+    with pytest.raises(RuntimeError):
+        pG.begin_bulk_load()
+    pG.commit()
+    with pytest.raises(RuntimeError):
+        pG.commit()
+
+    if df_type is cudf.DataFrame:
+        afe = assert_frame_equal
+    else:
+        afe = pd.testing.assert_frame_equal
+    vcn = PropertyGraph.vertex_col_name
+    eidcn = PropertyGraph.edge_id_col_name
+    afe(
+        pG.get_vertex_data().sort_values(vcn).reset_index(drop=True),
+        expected_pG.get_vertex_data().sort_values(vcn).reset_index(drop=True),
+        check_like=True,
+    )
+    afe(
+        pG.get_edge_data().sort_values(eidcn).reset_index(drop=True),
+        expected_pG.get_edge_data().sort_values(eidcn).reset_index(drop=True),
+        check_like=True,
+    )
+    assert pG.edge_types == expected_pG.edge_types
+    expr = "(_TYPE_ == 'relationships') & (relationship_type == 9)"
+    selected = pG.select_edges(expr).edge_selections
+    assert selected.sum() == expected_pG.select_edges(expr).edge_selections.sum()
+
+
+@pytest.mark.sg
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+@pytest.mark.parametrize("set_index", [False, True])
+def test_bulk_load_duplicate_vertices(df_type, set_index):
+    """
+    Ensures vertices staged more than once get the same properties as when
+    adding each batch individually, where later batches only fill in missing
+    values.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    batches = [
+        df_type({"vid": [1, 2], "a": [1.0, None], "b": ["x", None]}),
+        df_type({"vid": [2, 3], "a": [5.0, 6.0], "b": ["y", "z"]}),
+        df_type({"vid": [1, 2], "a": [9.0, 9.0], "b": [None, "w"]}),
+        df_type({"vid": [4], "a": [1.0], "b": ["q"]}),
+    ]
+    if set_index:
+        batches = [df.set_index("vid") for df in batches]
+
+    expected_pG = PropertyGraph()
+    pG = PropertyGraph()
+    pG.begin_bulk_load()
+    for df in batches:
+        expected_pG.add_vertex_data(df, vertex_col_name="vid", type_name="t")
+        pG.add_vertex_data(df, vertex_col_name="vid", type_name="t")
+    pG.commit()
+
+    if df_type is cudf.DataFrame:
+        afe = assert_frame_equal
+    else:
+        afe = pd.testing.assert_frame_equal
+    vcn = PropertyGraph.vertex_col_name
+    afe(
+        pG.get_vertex_data().sort_values(vcn).reset_index(drop=True),
+        expected_pG.get_vertex_data().sort_values(vcn).reset_index(drop=True),
+        check_like=True,
+    )
+    # The missing values of vertex 2 are filled from the second batch
+    df = pG.get_vertex_data(vertex_ids=[2])
+    assert df["a"].iloc[0] == 5.0
+    assert df["b"].iloc[0] == "y"
+
+
+@pytest.mark.sg
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_bulk_load_errors(df_type):
+    """
+    Ensures invalid arguments are rejected when data is staged, and that a
+    failed commit() keeps the data it could not add staged.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    pG = PropertyGraph()
+    pG.begin_bulk_load()
+    vert_df = df_type({"vid": [1, 2], "a": [3, 4], "b": [5, 6], "c": [7, 8]})
+    edge_df = df_type({"src": [1, 2], "dst": [2, 3], "eid": [0, 1]})
+
+    with pytest.raises(TypeError):
+        pG.add_vertex_data(vert_df, vertex_col_name="vid", type_name=42)
+    with pytest.raises(ValueError):
+        pG.add_vertex_data(vert_df, vertex_col_name="vid", property_columns=["x"])
+    with pytest.raises(TypeError):
+        pG.add_edge_data(edge_df, vertex_col_names=("src", "dst"), type_name=42)
+
+    # Edge IDs must be given for all staged edge data or for none of it
+    pG.add_edge_data(edge_df, vertex_col_names=("src", "dst"))
+    with pytest.raises(NotImplementedError):
+        pG.add_edge_data(
+            edge_df, vertex_col_names=("src", "dst"), edge_id_col_name="eid"
+        )
+
+    # Each batch is valid on its own, but the second batch uses a different
+    # size for the same vector property, so only commit() can detect it.
+    pG.add_vertex_data(vert_df, vertex_col_name="vid", vector_properties={"v": ["a"]})
+    pG.add_vertex_data(
+        vert_df, vertex_col_name="vid", vector_properties={"v": ["a", "b"]}
+    )
+    with pytest.raises(ValueError):
+        pG.commit()
+    assert pG.get_num_edges() == 2
+    assert pG.get_num_vertices() == 3
+    with pytest.raises(RuntimeError):
+        pG.begin_bulk_load()
+    with pytest.raises(ValueError):
+        pG.commit()
+    assert pG.get_num_edges() == 2
+
+
+@pytest.mark.sg
+def test_select_cache(dataset1_PropertyGraph):
+    """
+    Ensures repeated selections are served from the selection cache, and that
+    cached selections are not reused after the properties change.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    (pG, _) = dataset1_PropertyGraph
+    tcn = PropertyGraph.type_col_name
+
+    vexpr = f"{tcn} == 'users'"
+    eexpr = f"{tcn} == 'referrals'"
+    vselection = pG.select_vertices(vexpr)
+    eselection = pG.select_edges(eexpr)
+    assert pG.selection_cache_info()["misses"] == 2
+    assert pG.selection_cache_info()["currsize"] == 2
+
+    assert pG.select_vertices(vexpr).vertex_selections is vselection.vertex_selections
+    assert pG.select_edges(eexpr).edge_selections is eselection.edge_selections
+    assert pG.selection_cache_info()["hits"] == 2
+
+    # Adding vertex data only invalidates cached vertex selections
+    df_type = type(pG.get_vertex_data())
+    new_users = df_type({"user_id": [1, 2], "user_location": [47906, 78757]})
+    pG.add_vertex_data(new_users, type_name="users", vertex_col_name="user_id")
+    assert pG.selection_cache_info()["currsize"] == 1
+
+    num_selected = pG.select_vertices(vexpr).vertex_selections.sum()
+    assert num_selected == vselection.vertex_selections.sum() + 2
+    assert pG.select_edges(eexpr).edge_selections is eselection.edge_selections
+    assert pG.selection_cache_info() == {
+        "hits": 3,
+        "misses": 3,
+        "currsize": 2,
+        "maxsize": PropertyGraph.selection_cache_maxsize,
+    }
+
+
 @pytest.mark.sg
 @pytest.mark.parametrize("as_pg_first", [False, True])
 def test_select_vertices_from_previous_selection(dataset1_PropertyGraph, as_pg_first):
@@ -1,4 +1,4 @@
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -258,3 +258,59 @@ def test_renumber_unrenumber_non_default_vert_names():
     assert sorted(expected_values) == sorted(
         some_result_gdf["vertex"].to_arrow().to_pylist()
     )
+
+
+@pytest.mark.sg
+def test_renumber_lookup_tables():
+    gdf = cudf.DataFrame(
+        {"src": [40, 10, 30, 10, -5], "dst": [10, 20, 40, -5, 30], "wgt": range(5)}
+    )
+
+    # Brackets are added to the column names to trigger the python renumebring
+    renumbered_gdf, renumber_map = NumberMap.renumber(gdf, ["src"], ["dst"])
+
+    # Single-column integer vertices are converted with the lookup tables,
+    # which keep the order of the rows
+    assert renumber_map.implementation.external_ids is not None
+    assert renumbered_gdf["wgt"].to_arrow().to_pylist() == list(range(5))
+
+    unrenumbered_gdf = renumber_map.unrenumber(
+        renumbered_gdf, renumber_map.renumbered_src_col_name
+    )
+    unrenumbered_gdf = renumber_map.unrenumber(
+        unrenumbered_gdf, renumber_map.renumbered_dst_col_name
+    )
+    assert_series_equal(
+        unrenumbered_gdf[renumber_map.renumbered_src_col_name],
+        gdf["src"],
+        check_names=False,
+    )
+    assert_series_equal(
+        unrenumbered_gdf[renumber_map.renumbered_dst_col_name],
+        gdf["dst"],
+        check_names=False,
+    )
+
+    # Vertices not in the map have no internal id, and vice versa
+    vertices = cudf.Series([30, 99, -5, 40, 10, 20])
+    ids = renumber_map.to_internal_vertex_id(vertices)
+    assert ids.isna().to_arrow().to_pylist() == [
+        False,
+        True,
+        False,
+        False,
+        False,
+        False,
+    ]
+    ids[1] = 100
+    unrenumbered = renumber_map.unrenumber(
+        cudf.DataFrame({"vertex": ids}), "vertex", preserve_order=True
+    )
+    assert unrenumbered["vertex"].to_arrow().to_pylist() == [
+        30,
+        None,
+        -5,
+        40,
+        10,
+        20,
+    ]
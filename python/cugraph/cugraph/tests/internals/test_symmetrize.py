@@ -1,4 +1,4 @@
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -17,7 +17,9 @@ import pytest
 import pandas as pd
 
 import cudf
+import cupy
 import cugraph
+from cugraph.structure.symmetrize import symmetrize_df
 from cugraph.testing import DEFAULT_DATASETS
 
 
@@ -186,3 +188,44 @@ def test_symmetrize_weighted(graph_file):
     sym_src, sym_dst, sym_w = cugraph.symmetrize(cu_M["src"], cu_M["dst"], cu_M["wgt"])
 
     compare(cu_M["src"], cu_M["dst"], cu_M["wgt"], sym_src, sym_dst, sym_w)
+
+
+@pytest.mark.sg
+@pytest.mark.filterwarnings("ignore:Multi is deprecated:FutureWarning")
+@pytest.mark.parametrize("graph_file", DEFAULT_DATASETS)
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("symmetrize", [False, True])
+def test_symmetrize_df_hash(graph_file, weighted, symmetrize):
+    gc.collect()
+
+    df = graph_file.get_edgelist()
+    columns = ["src", "dst", "wgt"] if weighted else ["src", "dst"]
+    df = df[columns]
+    # Add duplicate and reversed edges with larger and smaller weights
+    dups = df.iloc[::3].rename(columns={"src": "dst", "dst": "src"})[columns]
+    if weighted:
+        offsets = cupy.where(cupy.arange(len(dups)) % 2 == 0, -1.0, 1.0)
+        dups["wgt"] = (dups["wgt"] + offsets).astype(df["wgt"].dtype)
+    df = cudf.concat([df, dups, df.iloc[::5]], ignore_index=True)
+
+    weight_name = "wgt" if weighted else None
+    expected = symmetrize_df(
+        df, "src", "dst", weight_name, symmetrize=symmetrize, method="groupby"
+    )
+    result = symmetrize_df(
+        df, "src", "dst", weight_name, symmetrize=symmetrize, method="hash"
+    )
+
+    assert list(result.columns) == list(expected.columns)
+    assert list(result.dtypes) == list(expected.dtypes)
+    pd.testing.assert_frame_equal(
+        result.sort_values(["src", "dst"]).reset_index(drop=True).to_pandas(),
+        expected.sort_values(["src", "dst"]).reset_index(drop=True).to_pandas(),
+    )
+
+    # Unsupported edge lists fall back to groupby, unless hash is required
+    df["src"] = df["src"].astype("int64") - 1
+    df["dst"] = df["dst"].astype("int64")
+    symmetrize_df(df, "src", "dst", weight_name, symmetrize=symmetrize)
+    with pytest.raises(ValueError):
+        symmetrize_df(df, "src", "dst", weight_name, method="hash")
@@ -132,6 +132,131 @@ def test_bulk_sampler_remainder(scratch_dir):
     shutil.rmtree(samples_path)
 
 
+@pytest.mark.sg
+@pytest.mark.parametrize("write_queue_size", [0, 1, 2])
+def test_bulk_sampler_write_queue(scratch_dir, write_queue_size):
+    el = karate.get_edgelist().reset_index().rename(columns={"index": "eid"})
+    el["eid"] = el["eid"].astype("int32")
+    el["etp"] = cupy.int32(0)
+
+    G = cugraph.Graph(directed=True)
+    G.from_cudf_edgelist(
+        el,
+        source="src",
+        destination="dst",
+        edge_attr=["wgt", "eid", "etp"],
+    )
+
+    samples_path = os.path.join(
+        scratch_dir, f"test_bulk_sampler_write_queue_{write_queue_size}"
+    )
+    create_directory_with_overwrite(samples_path)
+
+    bs = BulkSampler(
+        batch_size=2,
+        output_path=samples_path,
+        graph=G,
+        seeds_per_call=4,
+        batches_per_partition=1,
+        write_queue_size=write_queue_size,
+        fanout_vals=[2, 2],
+        with_replacement=False,
+    )
+
+    # 10 batches, sampled in windows of 2 batches each
+    batches = cudf.DataFrame(
+        {
+            "start": cudf.Series(range(20), dtype="int32"),
+            "batch": cudf.Series([b // 2 for b in range(20)], dtype="int32"),
+        }
+    )
+
+    bs.add_batches(batches, start_col_name="start", batch_col_name="batch")
+    bs.flush()
+    assert bs.size == 0
+
+    stats = bs.stats
+    assert stats["num_windows"] == 5
+    assert stats["sample_time"] > 0
+    assert stats["write_time"] > 0
+    assert stats["write_wait_time"] >= 0
+
+    files = sorted(os.listdir(samples_path))
+    assert files == sorted(f"batch={b}-{b}.parquet" for b in range(10))
+    recovered_samples = cudf.read_parquet(samples_path)
+    assert sorted(recovered_samples["batch_id"].unique().values_host.tolist()) == list(
+        range(10)
+    )
+
+    shutil.rmtree(samples_path)
+
+    with pytest.raises(ValueError, match="write_queue_size"):
+        BulkSampler(
+            batch_size=2, output_path=samples_path, graph=G, write_queue_size=-1
+        )
+
+
+@pytest.mark.sg
+def test_bulk_sampler_write_queue_errors(scratch_dir, monkeypatch):
+    el = karate.get_edgelist().reset_index().rename(columns={"index": "eid"})
+    el["eid"] = el["eid"].astype("int32")
+    el["etp"] = cupy.int32(0)
+
+    G = cugraph.Graph(directed=True)
+    G.from_cudf_edgelist(
+        el,
+        source="src",
+        destination="dst",
+        edge_attr=["wgt", "eid", "etp"],
+    )
+
+    samples_path = os.path.join(scratch_dir, "test_bulk_sampler_write_queue_errors")
+    create_directory_with_overwrite(samples_path)
+
+    bs = BulkSampler(
+        batch_size=2,
+        output_path=samples_path,
+        graph=G,
+        seeds_per_call=4,
+        batches_per_partition=1,
+        write_queue_size=1,
+        fanout_vals=[2, 2],
+        with_replacement=False,
+    )
+
+    # The first window fails to be written while the second fails to be sampled
+    def write_window(*args):
+        raise OSError("write failed")
+
+    sample_next_window = bs._BulkSampler__sample_next_window
+    num_calls = 0
+
+    def fail_second_window():
+        nonlocal num_calls
+        num_calls += 1
+        if num_calls == 2:
+            raise RuntimeError("sampling failed")
+        return sample_next_window()
+
+    monkeypatch.setattr(bs, "_BulkSampler__write_window", write_window)
+    monkeypatch.setattr(bs, "_BulkSampler__sample_next_window", fail_second_window)
+
+    batches = cudf.DataFrame(
+        {
+            "start": cudf.Series(range(8), dtype="int32"),
+            "batch": cudf.Series([b // 2 for b in range(8)], dtype="int32"),
+        }
+    )
+
+    # The sampling error propagates, with the write error as its cause
+    with pytest.raises(RuntimeError, match="sampling failed") as excinfo:
+        # Flushes, since there are more than seeds_per_call seeds
+        bs.add_batches(batches, start_col_name="start", batch_col_name="batch")
+    assert isinstance(excinfo.value.__cause__, OSError)
+
+    shutil.rmtree(samples_path)
+
+
 @pytest.mark.sg
 def test_bulk_sampler_large_batch_size(scratch_dir):
     el = karate.get_edgelist().reset_index().rename(columns={"index": "eid"})
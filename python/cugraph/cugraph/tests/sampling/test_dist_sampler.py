@@ -96,3 +96,137 @@ def test_dist_sampler_simple(
             assert original_el.dst.iloc[edge_id.iloc[i]] == dst.iloc[i]
 
     shutil.rmtree(samples_path)
+
+
+@pytest.mark.sg
+@pytest.mark.parametrize("prefetch,pin_memory", [(1, False), (2, False), (2, True)])
+@pytest.mark.skipif(isinstance(torch, MissingModule), reason="torch not available")
+def test_dist_sampler_reader_prefetch(scratch_dir, karate_graph, prefetch, pin_memory):
+    G = karate_graph
+
+    samples_path = os.path.join(scratch_dir, "test_dist_sampler_reader_prefetch")
+    create_directory_with_overwrite(samples_path)
+
+    writer = DistSampleWriter(samples_path, batches_per_partition=2)
+    sampler = UniformNeighborSampler(G, writer, fanout=[4, 4])
+
+    seeds = cupy.arange(16, dtype="int64")
+    sampler.sample_from_nodes(seeds, batch_size=2)
+
+    expected = list(sampler.get_reader())
+    reader = sampler.get_reader(prefetch=prefetch, pin_memory=pin_memory)
+    actual = list(reader)
+
+    assert len(actual) == len(expected)
+    for (tensors, start, end), (exp_tensors, exp_start, exp_end) in zip(
+        actual, expected
+    ):
+        assert (start, end) == (exp_start, exp_end)
+        assert tensors.keys() == exp_tensors.keys()
+        for col, t in tensors.items():
+            assert t.is_cuda
+            assert (t == exp_tensors[col]).all()
+
+    stats = reader.stats
+    assert stats["num_partitions_read"] == len(expected)
+    assert stats["stall_time"] >= 0.0
+    assert stats["read_time"] > 0.0
+
+    shutil.rmtree(samples_path)
+
+
+@pytest.mark.sg
+@pytest.mark.skipif(isinstance(torch, MissingModule), reason="torch not available")
+def test_dist_sampler_reader_prefetch_end(scratch_dir, karate_graph):
+    G = karate_graph
+
+    samples_path = os.path.join(scratch_dir, "test_dist_sampler_reader_prefetch_end")
+    create_directory_with_overwrite(samples_path)
+
+    writer = DistSampleWriter(samples_path, batches_per_partition=2)
+    sampler = UniformNeighborSampler(G, writer, fanout=[4, 4])
+
+    seeds = cupy.arange(8, dtype="int64")
+    sampler.sample_from_nodes(seeds, batch_size=2)
+
+    # Calling next() after the last partition keeps raising StopIteration
+    reader = sampler.get_reader(prefetch=1)
+    assert len(list(reader)) == 2
+    for _ in range(2):
+        with pytest.raises(StopIteration):
+            next(reader)
+    reader.close()
+
+    # An error from the prefetch thread is raised again by later next() calls
+    reader = sampler.get_reader(prefetch=1)
+    for f in os.listdir(samples_path):
+        os.remove(os.path.join(samples_path, f))
+    with pytest.raises(OSError) as first_error:
+        next(reader)
+    with pytest.raises(OSError) as second_error:
+        next(reader)
+    assert second_error.value is first_error.value
+    reader.close()
+
+    shutil.rmtree(samples_path)
+
+
+@pytest.mark.sg
+@pytest.mark.parametrize("compression", [None, "zlib"])
+@pytest.mark.parametrize("sparse_format", ["COO", "CSR"])
+@pytest.mark.skipif(isinstance(torch, MissingModule), reason="torch not available")
+def test_dist_sampler_indexed_format(
+    scratch_dir, karate_graph, sparse_format, compression
+):
+    G = karate_graph
+    seeds = cupy.arange(16, dtype="int64")
+
+    readers = {}
+    for format in ["parquet", "indexed"]:
+        samples_path = os.path.join(scratch_dir, f"test_dist_sampler_{format}")
+        create_directory_with_overwrite(samples_path)
+
+        writer = DistSampleWriter(
+            samples_path,
+            batches_per_partition=3,
+            format=format,
+            compression=compression if format == "indexed" else None,
+        )
+        sampler = UniformNeighborSampler(
+            G, writer, fanout=[4, 4], compression=sparse_format
+        )
+        sampler.sample_from_nodes(seeds, batch_size=2)
+        readers[format] = sampler.get_reader()
+
+    expected = list(readers["parquet"])
+    actual = list(readers["indexed"])
+
+    assert len(actual) == len(expected)
+    for (tensors, start, end), (exp_tensors, exp_start, exp_end) in zip(
+        actual, expected
+    ):
+        assert (start, end) == (exp_start, exp_end)
+        assert tensors.keys() == exp_tensors.keys()
+        for col, t in tensors.items():
+            assert t.dtype == exp_tensors[col].dtype
+            assert (t == exp_tensors[col]).all()
+
+        # Reading the batches one by one gives the same columns
+        batches = [readers["indexed"].read_batch(b) for b in range(start, end + 1)]
+        assert [(s, e) for _, s, e in batches] == [
+            (b, b) for b in range(start, end + 1)
+        ]
+        for col, t in tensors.items():
+            parts = [batches[0][0][col]]
+            for batch_tensors, _, _ in batches[1:]:
+                part = batch_tensors[col]
+                parts.append(part[1:] if col.endswith("offsets") else part)
+            assert (torch.cat(parts) == t).all()
+
+    with pytest.raises(IndexError):
+        readers["indexed"].read_batch(len(seeds) // 2)
+    with pytest.raises(ValueError):
+        readers["parquet"].read_batch(0)
+
+    for format in ["parquet", "indexed"]:
+        shutil.rmtree(os.path.join(scratch_dir, f"test_dist_sampler_{format}"))
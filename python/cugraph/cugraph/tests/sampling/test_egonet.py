@@ -1,4 +1,4 @@
-# Copyright (c) 2021-2023, NVIDIA CORPORATION.
+# Copyright (c) 2021-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -15,6 +15,7 @@ import gc
 
 import pytest
 import networkx as nx
+from pandas.testing import assert_frame_equal
 
 import cudf
 import cugraph
@@ -73,6 +74,28 @@ def test_batched_ego_graphs(graph_file, seeds, radius):
     assert nx.is_isomorphic(ego_nx, ego_cugraph)
 
 
+@pytest.mark.sg
+@pytest.mark.parametrize("graph_file", DEFAULT_DATASETS)
+@pytest.mark.parametrize("radius", [1, 2])
+def test_batched_ego_graphs_repeated_seeds(graph_file, radius):
+    gc.collect()
+
+    G = graph_file.get_graph()
+    seeds = [13, 0, 5, 0, 13, 13]
+
+    df, offsets = cugraph.batched_ego_graphs(G, seeds, radius=radius)
+    assert len(offsets) == len(seeds) + 1
+    assert offsets.iloc[-1] == len(df)
+
+    for i, seed in enumerate(seeds):
+        ego_df = df[offsets.iloc[i] : offsets.iloc[i + 1]]
+        expected, _ = cugraph.batched_ego_graphs(G, [seed], radius=radius)
+        assert_frame_equal(
+            ego_df.sort_values(["src", "dst"]).reset_index(drop=True).to_pandas(),
+            expected.sort_values(["src", "dst"]).reset_index(drop=True).to_pandas(),
+        )
+
+
 @pytest.mark.sg
 @pytest.mark.parametrize("graph_file", DEFAULT_DATASETS)
 @pytest.mark.parametrize("seed", SEEDS)
@@ -1,4 +1,4 @@
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -474,3 +474,56 @@ def test_hyper_to_pa_all_direct():
     edges_err = hg["graph"].edges().to_arrow()
     assert len(hg["graph"].edges()) == 9
     assert len(edges_err) == 9
+
+
+@pytest.mark.sg
+@pytest.mark.parametrize("direct", [False, True])
+def test_hyperedges_many_columns(direct):
+    num_rows = 5
+    columns = [f"c{i:02d}" for i in range(40)]
+    pdf = pd.DataFrame(
+        {
+            key: pd.Series(
+                [None if (i + r) % 7 == 0 else (i * r) % 4 for r in range(num_rows)],
+                dtype="Int64",
+            )
+            for i, key in enumerate(columns)
+        }
+    )
+    h = cugraph.hypergraph(cudf.from_pandas(pdf), direct=direct)
+
+    expected_entities = {
+        f"{key}::{value}" for key in columns for value in pdf[key].dropna()
+    }
+    entities = h["entities"]["node_id"].to_pandas()
+    assert len(entities) == len(expected_entities)
+    assert set(entities) == expected_entities
+
+    if direct:
+        expected_edges = pd.DataFrame(
+            [
+                (
+                    f"event_id::{r}",
+                    f"{key1}::{key2}",
+                    f"{key1}::{pdf[key1][r]}",
+                    f"{key2}::{pdf[key2][r]}",
+                )
+                for i, key1 in enumerate(columns)
+                for key2 in columns[i + 1 :]
+                for r in range(num_rows)
+                if not (pd.isna(pdf[key1][r]) or pd.isna(pdf[key2][r]))
+            ],
+            columns=["event_id", "edge_type", "src", "dst"],
+        )
+    else:
+        expected_edges = pd.DataFrame(
+            [
+                (f"event_id::{r}", key, f"{key}::{pdf[key][r]}")
+                for key in columns
+                for r in range(num_rows)
+                if not pd.isna(pdf[key][r])
+            ],
+            columns=["event_id", "edge_type", "attrib_id"],
+        )
+    edges = h["edges"][list(expected_edges.columns)].astype(str).to_pandas()
+    pd.testing.assert_frame_equal(edges, expected_edges)
@@ -13,6 +13,8 @@
 
 import os
 import gc
+import shutil
+import warnings
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -220,6 +222,81 @@ def test_get_dask_edgelist(dask_client, dataset):
     assert isinstance(E, dask_cudf.DataFrame)
 
 
+@pytest.mark.parametrize("dataset", SMALL_DATASETS)
+def test_get_edgelist_cache(dataset, tmp_path):
+    expected = dataset.get_edgelist(download=True)
+    dataset.unload()
+
+    # Use a copy of the datafile so its cache starts out empty and the shared
+    # datafile is not modified below.
+    csv_file = tmp_path / dataset.get_path().name
+    shutil.copyfile(dataset.get_path(), csv_file)
+    ds = datasets.Dataset(
+        csv_file=csv_file,
+        csv_header=dataset.metadata["header"],
+        csv_delim=dataset.metadata["delim"],
+        csv_col_names=dataset.metadata["col_names"],
+        csv_col_dtypes=dataset.metadata["col_types"],
+    )
+
+    # The first call parses the datafile and caches it, the second reads the
+    # cache.
+    cache_path = ds.get_cache_path()
+    assert not cache_path.exists()
+    E = ds.get_edgelist(cache=True)
+    assert cache_path.is_dir()
+    ds.unload()
+
+    for reader, df_type in [("cudf", cudf.DataFrame), ("pandas", pandas.DataFrame)]:
+        E = ds.get_edgelist(reader=reader, cache=True)
+        assert isinstance(E, df_type)
+        assert list(E.dtypes) == list(expected.dtypes)
+        if reader == "pandas":
+            E = cudf.from_pandas(E)
+        cudf.testing.assert_frame_equal(E, expected)
+        ds.unload()
+
+    # A different datafile (or metadata) is cached separately
+    with open(csv_file, "a") as datafile:
+        datafile.write("\n")
+    assert ds.get_cache_path() != cache_path
+
+
+def test_get_edgelist_cache_string_columns(tmp_path):
+    # String columns cannot be memory-mapped, so they are never cached
+    csv_file = tmp_path / "strings.csv"
+    csv_file.write_text("a b 1\nb c 2\n")
+    ds = datasets.Dataset(
+        csv_file=csv_file,
+        csv_col_names=["src", "dst", "wgt"],
+        csv_col_dtypes=["str", "str", "int32"],
+    )
+
+    for _ in range(2):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            E = ds.get_edgelist(cache=True)
+        assert E["src"].to_arrow().to_pylist() == ["a", "b"]
+        assert E["wgt"].to_arrow().to_pylist() == [1, 2]
+        assert not ds.get_cache_path().exists()
+        ds.unload()
+
+
+@pytest.mark.skipif(is_single_gpu(), reason="skipping MG testing on Single GPU system")
+@pytest.mark.skip(reason="MG not supported on CI")
+@pytest.mark.parametrize("dataset", SMALL_DATASETS)
+def test_get_dask_edgelist_cache(dask_client, dataset):
+    expected = dataset.get_edgelist(download=True)
+    dataset.unload()
+
+    dataset.get_dask_edgelist(cache=True)
+    dataset.unload()
+    E = dataset.get_dask_edgelist(cache=True)
+
+    assert isinstance(E, dask_cudf.DataFrame)
+    cudf.testing.assert_frame_equal(E.compute().reset_index(drop=True), expected)
+
+
 @pytest.mark.parametrize("dataset", ALL_DATASETS)
 def test_get_graph(dataset):
     G = dataset.get_graph(download=True)
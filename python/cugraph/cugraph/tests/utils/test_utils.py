@@ -1,4 +1,4 @@
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -62,6 +62,36 @@ def test_bfs_paths_array():
         assert "not in the result set" in str(ErrorMsg)
 
 
+@pytest.mark.sg
+@pytest.mark.parametrize("as_pandas", [False, True])
+def test_get_traversed_paths(as_pandas):
+    G = karate.get_graph()
+
+    df = cugraph.sssp(G, 16)
+    # Paths must not depend on the order of the result
+    df = df.sample(frac=1, random_state=42)
+    if as_pandas:
+        df = df.to_pandas()
+
+    vertices = df["vertex"].values.tolist()
+    offsets, paths = cugraph.utils.get_traversed_paths(df, vertices)
+    assert isinstance(paths, type(df["vertex"]))
+    assert len(offsets) == len(vertices) + 1
+
+    predecessors = dict(zip(vertices, df["predecessor"].values.tolist()))
+    offsets = offsets.values.tolist()
+    paths = paths.values.tolist()
+    for i, v in enumerate(vertices):
+        expected = [v]
+        while predecessors[expected[-1]] != -1:
+            expected.append(predecessors[expected[-1]])
+        assert paths[offsets[i] : offsets[i + 1]] == expected
+        assert expected[-1] == 16
+
+    with pytest.raises(ValueError, match="not in the result set"):
+        cugraph.utils.get_traversed_paths(df, [0, 100])
+
+
 @pytest.mark.sg
 @pytest.mark.parametrize("graph_file", utils.DATASETS)
 @pytest.mark.skip(reason="Skipping large tests")
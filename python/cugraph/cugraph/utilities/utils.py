@@ -1,4 +1,4 @@
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -17,6 +17,8 @@ import shutil
 
 from numba import cuda
 
+import numpy as np
+import pandas as pd
 import cudf
 from cudf.core.column import as_column
 
@@ -66,6 +68,142 @@ except ModuleNotFoundError:
 nx_package = nx
 
 
+def _check_traversal_result(df):
+    if "vertex" not in df.columns:
+        raise ValueError(
+            "DataFrame does not appear to be a BFS or "
+            "SSP result - 'vertex' column missing"
+        )
+    if "distance" not in df.columns:
+        raise ValueError(
+            "DataFrame does not appear to be a BFS or "
+            "SSP result - 'distance' column missing"
+        )
+    if "predecessor" not in df.columns:
+        raise ValueError(
+            "DataFrame does not appear to be a BFS or "
+            "SSP result - 'predecessor' column missing"
+        )
+
+
+def _get_traversed_path_rows(df, vertices):
+    """
+    Returns the offsets and the row numbers of the paths from each of
+    vertices to the root of a BFS or SSSP result, as arrays (cupy arrays
+    for a cudf.DataFrame and numpy arrays for a pandas.DataFrame).
+
+    There is no guarantee that the dataframe has not been filtered or
+    edited, so rows are found by sorting the vertex column once rather
+    than by using the vertex IDs as an index.  The depth of each row is
+    then found by pointer jumping, which also gives the 2**j-th ancestor
+    of each row, from which the k-th vertex of each path is looked up.
+    """
+    xp = cp if isinstance(df, cudf.DataFrame) else np
+
+    vertex = df["vertex"].values
+    predecessor = df["predecessor"].values
+    if isinstance(vertices, (cudf.Series, pd.Series)):
+        vertices = vertices.values
+    if xp is np and cp is not None and isinstance(vertices, cp.ndarray):
+        vertices = cp.asnumpy(vertices)
+    vertices = xp.asarray(vertices)
+
+    num_rows = len(vertex)
+    if num_rows == 0:
+        if len(vertices) > 0:
+            raise ValueError(f"The vertex {vertices[0]} is not in the result set")
+        return xp.zeros(1, dtype=np.int64), xp.zeros(0, dtype=np.int64)
+
+    sorter = xp.argsort(vertex)
+    sorted_vertex = vertex[sorter]
+
+    def find_rows(values):
+        positions = xp.minimum(xp.searchsorted(sorted_vertex, values), num_rows - 1)
+        found = sorted_vertex[positions] == values
+        return xp.where(found, sorter[positions], -1)
+
+    target_rows = find_rows(vertices)
+    if bool((target_rows == -1).any()):
+        missing = vertices[target_rows == -1][0]
+        raise ValueError(f"The vertex {missing} is not in the result set")
+
+    # A path ends at a vertex whose predecessor is -1 (or is not in df)
+    parent = find_rows(predecessor)
+    parent[predecessor == -1] = -1
+
+    # After j iterations, ancestors[j][r] is the 2**j-th ancestor of row r
+    # (or -1), and depth[r] is the number of edges from r to that ancestor
+    # or, if there is none, to the root of the path.
+    ancestors = [parent]
+    depth = (parent != -1).astype(np.int64)
+    while bool((ancestors[-1] != -1).any()):
+        if len(ancestors) > num_rows.bit_length():
+            raise ValueError("The predecessors of the result contain a cycle")
+        jump = ancestors[-1]
+        has_jump = jump != -1
+        depth = depth + xp.where(has_jump, depth[jump], 0)
+        ancestors.append(xp.where(has_jump, ancestors[-1][jump], -1))
+
+    lengths = depth[target_rows] + 1
+    offsets = xp.zeros(len(vertices) + 1, dtype=np.int64)
+    xp.cumsum(lengths, out=offsets[1:])
+
+    # The k-th row of each path is the k-th ancestor of its first row
+    positions = xp.arange(int(offsets[-1]))
+    path_index = xp.searchsorted(offsets, positions, side="right") - 1
+    steps = positions - offsets[path_index]
+    rows = target_rows[path_index]
+    for j, jump in enumerate(ancestors[:-1]):
+        rows = xp.where(((steps >> j) & 1).astype(bool), jump[rows], rows)
+
+    return offsets, rows
+
+
+def get_traversed_paths(df, vertices):
+    """
+    Take the DataFrame result from a BFS or SSSP function call and extract
+    the paths to many vertices at once.  This is much faster than calling
+    get_traversed_path_list for each vertex, since the result is only
+    scanned a few times no matter how many paths are extracted.
+
+    Input Parameters
+    ----------
+    df : cudf.DataFrame or pandas.DataFrame
+        The dataframe containing the results of a BFS or SSSP call
+
+    vertices : array-like
+        The vertex IDs to extract the paths to
+
+    Returns
+    ---------
+    offsets : cudf.Series or pandas.Series
+        The offsets of the path to each vertex in paths, so the path to
+        vertices[i] is paths[offsets[i]:offsets[i + 1]]
+
+    paths : cudf.Series or pandas.Series
+        The steps of each path from the vertex to the root, concatenated
+
+    Examples
+    --------
+    >>> gdf = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
+    ...                     dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(gdf, source='0', destination='1', edge_attr='2')
+    >>> sssp_df = cugraph.sssp(G, 1)
+    >>> offsets, paths = cugraph.utils.get_traversed_paths(sssp_df, [32, 33])
+
+    """
+
+    _check_traversal_result(df)
+
+    offsets, rows = _get_traversed_path_rows(df, vertices)
+    series_type = cudf.Series if isinstance(df, cudf.DataFrame) else pd.Series
+    return (
+        series_type(offsets, name="offsets"),
+        series_type(df["vertex"].values[rows], name="vertex"),
+    )
+
+
 def get_traversed_path(df, id):
     """
     Take the DataFrame result from a BFS or SSSP function call and extract
@@ -101,42 +239,12 @@ def get_traversed_path(df, id):
 
     """
 
-    if "vertex" not in df.columns:
-        raise ValueError(
-            "DataFrame does not appear to be a BFS or "
-            "SSP result - 'vertex' column missing"
-        )
-    if "distance" not in df.columns:
-        raise ValueError(
-            "DataFrame does not appear to be a BFS or "
-            "SSP result - 'distance' column missing"
-        )
-    if "predecessor" not in df.columns:
-        raise ValueError(
-            "DataFrame does not appear to be a BFS or "
-            "SSP result - 'predecessor' column missing"
-        )
+    _check_traversal_result(df)
     if isinstance(id, type(df["vertex"].iloc[0])):
         raise ValueError("The vertex 'id' needs to be the same as df['vertex']")
 
-    # There is no guarantee that the dataframe has not been filtered
-    # or edited.  Therefore we cannot assume that using the vertex ID
-    # as an index will work
-
-    ddf = df[df["vertex"] == id]
-    if len(ddf) == 0:
-        raise ValueError("The vertex (", id, " is not in the result set")
-    pred = ddf["predecessor"].iloc[0]
-
-    answer = []
-    answer.append(ddf)
-
-    while pred != -1:
-        ddf = df[df["vertex"] == pred]
-        pred = ddf["predecessor"].iloc[0]
-        answer.append(ddf)
-
-    return cudf.concat(answer)
+    _, rows = _get_traversed_path_rows(df, [id])
+    return df.iloc[rows]
 
 
 def get_traversed_path_list(df, id):
@@ -168,45 +276,12 @@ def get_traversed_path_list(df, id):
 
     """
 
-    if "vertex" not in df.columns:
-        raise ValueError(
-            "DataFrame does not appear to be a BFS or "
-            "SSP result - 'vertex' column missing"
-        )
-    if "distance" not in df.columns:
-        raise ValueError(
-            "DataFrame does not appear to be a BFS or "
-            "SSP result - 'distance' column missing"
-        )
-    if "predecessor" not in df.columns:
-        raise ValueError(
-            "DataFrame does not appear to be a BFS or "
-            "SSP result - 'predecessor' column missing"
-        )
+    _check_traversal_result(df)
     if isinstance(id, type(df["vertex"].iloc[0])):
         raise ValueError("The vertex 'id' needs to be the same as df['vertex']")
 
-    # There is no guarantee that the dataframe has not been filtered
-    # or edited.  Therefore we cannot assume that using the vertex ID
-    # as an index will work
-
-    pred = -1
-    answer = []
-    answer.append(id)
-
-    ddf = df[df["vertex"] == id]
-    if len(ddf) == 0:
-        raise ValueError("The vertex (", id, " is not in the result set")
-
-    pred = ddf["predecessor"].iloc[0]
-
-    while pred != -1:
-        answer.append(pred)
-
-        ddf = df[df["vertex"] == pred]
-        pred = ddf["predecessor"].iloc[0]
-
-    return answer
+    _, rows = _get_traversed_path_rows(df, [id])
+    return [id] + df["vertex"].values[rows[1:]].tolist()
 
 
 def is_cuda_version_less_than(min_version=(10, 2)):
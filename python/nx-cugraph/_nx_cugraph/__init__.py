@@ -182,10 +182,22 @@ _info = {
     "additional_parameters": {
         # BEGIN: additional_parameters
         "all_pairs_bellman_ford_path": {
+            "batch_size : int, optional": "The maximum number of source nodes to traverse from at once. If None, then use as many as fit within ``memory_budget``.",
             "dtype : dtype or None, optional": "The data type (np.float32, np.float64, or None) to use for the edge weights in the algorithm. If None, then dtype is determined by the edge values.",
+            "memory_budget : int, optional": "The approximate number of bytes of GPU memory to use for the results of each batch of traversals and for each step of expanding their frontiers; default is 1 GiB.",
         },
         "all_pairs_bellman_ford_path_length": {
+            "batch_size : int, optional": "The maximum number of source nodes to traverse from at once. If None, then use as many as fit within ``memory_budget``.",
             "dtype : dtype or None, optional": "The data type (np.float32, np.float64, or None) to use for the edge weights in the algorithm. If None, then dtype is determined by the edge values.",
+            "memory_budget : int, optional": "The approximate number of bytes of GPU memory to use for the results of each batch of traversals and for each step of expanding their frontiers; default is 1 GiB.",
+        },
+        "all_pairs_shortest_path": {
+            "batch_size : int, optional": "The maximum number of source nodes to traverse from at once. If None, then use as many as fit within ``memory_budget``.",
+            "memory_budget : int, optional": "The approximate number of bytes of GPU memory to use for the results of each batch of traversals and for each step of expanding their frontiers; default is 1 GiB.",
+        },
+        "all_pairs_shortest_path_length": {
+            "batch_size : int, optional": "The maximum number of source nodes to traverse from at once. If None, then use as many as fit within ``memory_budget``.",
+            "memory_budget : int, optional": "The approximate number of bytes of GPU memory to use for the results of each batch of traversals and for each step of expanding their frontiers; default is 1 GiB.",
         },
         "bellman_ford_path": {
             "dtype : dtype or None, optional": "The data type (np.float32, np.float64, or None) to use for the edge weights in the algorithm. If None, then dtype is determined by the edge values.",
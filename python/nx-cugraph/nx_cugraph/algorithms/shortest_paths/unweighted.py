@@ -22,6 +22,7 @@ from nx_cugraph.utils import _groupby, index_dtype, networkx_algorithm
 
 __all__ = [
     "bidirectional_shortest_path",
+    "bidirectional_shortest_paths",
     "single_source_shortest_path",
     "single_source_shortest_path_length",
     "single_target_shortest_path",
@@ -32,6 +33,22 @@ __all__ = [
 
 concat = itertools.chain.from_iterable
 
+# To add to `extra_params=` of `networkx_algorithm` for all-pairs algorithms
+_batch_params = {
+    "batch_size : int, optional": (
+        "The maximum number of source nodes to traverse from at once. "
+        "If None, then use as many as fit within ``memory_budget``."
+    ),
+    "memory_budget : int, optional": (
+        "The approximate number of bytes of GPU memory to use for the results "
+        "of each batch of traversals and for each step of expanding their "
+        "frontiers; default is 1 GiB."
+    ),
+}
+_default_memory_budget = 2**30
+# Temporary bytes per edge leaving a frontier: a few int64 arrays and masks
+_bytes_per_frontier_edge = 48
+
 
 @networkx_algorithm(version_added="23.12", _plc="bfs")
 def single_source_shortest_path_length(G, source, cutoff=None):
@@ -48,21 +65,71 @@ def single_target_shortest_path_length(G, target, cutoff=None):
     return rv
 
 
-@networkx_algorithm(version_added="24.04", _plc="bfs")
-def all_pairs_shortest_path_length(G, cutoff=None):
-    # TODO PERF: batched bfs to compute many at once
+@networkx_algorithm(extra_params=_batch_params, version_added="24.04")
+def all_pairs_shortest_path_length(
+    G, cutoff=None, *, batch_size=None, memory_budget=None
+):
     G = _to_graph(G)
-    for n in G:
-        yield (n, _bfs(G, n, cutoff, "Source", return_type="length"))
+    yield from _batched_bfs(
+        G,
+        cutoff,
+        return_type="length",
+        batch_size=batch_size,
+        memory_budget=memory_budget,
+    )
 
 
-@networkx_algorithm(version_added="24.04", _plc="bfs")
+@networkx_algorithm(version_added="24.04")
 def bidirectional_shortest_path(G, source, target):
-    # TODO PERF: do bidirectional traversal in core
     G = _to_graph(G)
     if source not in G or target not in G:
         raise nx.NodeNotFound(f"Either source {source} or target {target} is not in G")
-    return _bfs(G, source, None, "Source", return_type="path", target=target)
+    [path] = _bidirectional_bfs(G, [(source, target)])
+    if path is None:
+        raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+    return path
+
+
+def bidirectional_shortest_paths(G, pairs, *, batch_size=None, memory_budget=None):
+    """Compute unweighted shortest paths between many pairs of nodes at once.
+
+    This is a batched version of ``bidirectional_shortest_path`` that searches
+    from both ends of many ``(source, target)`` pairs together.
+
+    Parameters
+    ----------
+    G : nx_cugraph.Graph or networkx.Graph
+    pairs : iterable of (source, target) node pairs
+    batch_size : int, optional
+        The maximum number of pairs to search at once. If None, then use as
+        many as fit within ``memory_budget``.
+    memory_budget : int, optional
+        The approximate number of bytes of GPU memory to use for each batch of
+        searches; default is 1 GiB.
+
+    Returns
+    -------
+    list
+        A shortest path (as a list of nodes) for each pair in ``pairs``, or
+        None if the target is not reachable from the source.
+
+    Raises
+    ------
+    NodeNotFound
+        If a source or target is not in G.
+    """
+    G = _to_graph(G)
+    pairs = list(pairs)
+    for source, target in pairs:
+        if source not in G or target not in G:
+            raise nx.NodeNotFound(
+                f"Either source {source} or target {target} is not in G"
+            )
+    return list(
+        _bidirectional_bfs(
+            G, pairs, batch_size=batch_size, memory_budget=memory_budget
+        )
+    )
 
 
 @networkx_algorithm(version_added="24.04", _plc="bfs")
@@ -77,12 +144,16 @@ def single_target_shortest_path(G, target, cutoff=None):
     return _bfs(G, target, cutoff, "Target", return_type="path", reverse_path=True)
 
 
-@networkx_algorithm(version_added="24.04", _plc="bfs")
-def all_pairs_shortest_path(G, cutoff=None):
-    # TODO PERF: batched bfs to compute many at once
+@networkx_algorithm(extra_params=_batch_params, version_added="24.04")
+def all_pairs_shortest_path(G, cutoff=None, *, batch_size=None, memory_budget=None):
     G = _to_graph(G)
-    for n in G:
-        yield (n, _bfs(G, n, cutoff, "Source", return_type="path"))
+    yield from _batched_bfs(
+        G,
+        cutoff,
+        return_type="path",
+        batch_size=batch_size,
+        memory_budget=memory_budget,
+    )
 
 
 def _bfs(
@@ -143,6 +214,34 @@ def _bfs(
         compute_predecessors=return_type != "length",
         do_expensive_check=False,
     )
+    return _bfs_results(
+        G,
+        source,
+        src_index,
+        distances,
+        predecessors,
+        node_ids,
+        return_type=return_type,
+        reverse_path=reverse_path,
+        target=target,
+        scale=scale,
+    )
+
+
+def _bfs_results(
+    G,
+    source,
+    src_index,
+    distances,
+    predecessors,
+    node_ids,
+    *,
+    return_type,
+    reverse_path=False,
+    target=None,
+    scale=None,
+):
+    """Convert the BFS arrays from a single source to the results of `_bfs`."""
     mask = distances != np.iinfo(distances.dtype).max
     node_ids = node_ids[mask]
     if return_type != "path":
@@ -205,3 +304,271 @@ def _bfs(
         return lengths
     # return_type == "length-path"
     return lengths, paths
+
+
+def _get_batch_size(num_sources, bytes_per_source, batch_size, memory_budget):
+    """Number of sources to traverse at once within the memory budget."""
+    if memory_budget is None:
+        memory_budget = _default_memory_budget
+    max_batch_size = max(1, memory_budget // max(1, bytes_per_source))
+    if batch_size is None:
+        batch_size = max_batch_size
+    elif batch_size < 1:
+        raise ValueError(f"batch_size must be positive; got {batch_size}")
+    return max(1, min(batch_size, max_batch_size, num_sources))
+
+
+def _get_max_frontier_edges(memory_budget):
+    """Number of frontier edges to expand at once within the memory budget."""
+    if memory_budget is None:
+        memory_budget = _default_memory_budget
+    return max(1, memory_budget // _bytes_per_frontier_edge)
+
+
+def _get_csr(G, *, reverse=False):
+    """Return ``(indptr, indices, edge_ids)`` of the adjacency of G (or its reverse).
+
+    ``edge_ids`` maps each position of ``indices`` to an index into ``G.src_indices``.
+    The arrays are cached on the graph, so repeated traversals don't rebuild them.
+    """
+
+    def build():
+        src_indices = G.src_indices
+        dst_indices = G.dst_indices
+        if reverse:
+            src_indices, dst_indices = dst_indices, src_indices
+        edge_ids = cp.argsort(src_indices)
+        indptr = cp.searchsorted(
+            src_indices[edge_ids], cp.arange(G._N + 1, dtype=index_dtype)
+        ).astype(np.int64)
+        rv = (indptr, dst_indices[edge_ids], edge_ids)
+        return rv, rv
+
+    return G._get_cached(("csr", reverse), build)
+
+
+def _expand_frontier(indptr, nodes):
+    """Find all edges leaving a frontier of many traversals at once.
+
+    The frontier is given as the ``nodes`` reached by traversals in a batch; the
+    same node may appear once per traversal. Returns ``(seg, positions)`` where
+    ``seg`` is the index into the frontier for each outgoing edge, and
+    ``positions`` is the index of the edge into the CSR indices.
+    """
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    offsets = cp.cumsum(counts)
+    total = int(offsets[-1]) if offsets.size > 0 else 0
+    if total == 0:
+        empty = cp.empty(0, np.int64)
+        return empty, empty
+    positions = cp.arange(total, dtype=np.int64)
+    seg = cp.searchsorted(offsets, positions, side="right")
+    positions += starts[seg] - (offsets[seg] - counts[seg])
+    return seg, positions
+
+
+def _split_frontier(indptr, nodes, max_edges):
+    """Split a frontier into slices of about ``max_edges`` outgoing edges each.
+
+    Expanding all edges leaving the frontier of a batch of traversals at once
+    may create arrays as large as the batch size times the number of edges, so
+    this bounds the size of each expansion. A slice exceeds ``max_edges`` only
+    by the degree of its first node, so a node of very high degree may get a
+    slice of its own.
+    """
+    if nodes.size == 0:
+        return [slice(None)]
+    offsets = cp.cumsum(indptr[nodes + 1] - indptr[nodes])
+    total = int(offsets[-1])
+    if total <= max_edges:
+        return [slice(None)]
+    bounds = cp.searchsorted(
+        offsets, cp.arange(max_edges, total, max_edges, dtype=offsets.dtype), "right"
+    )
+    bounds = [0, *cp.unique(bounds).tolist(), nodes.size]
+    return [
+        slice(start, stop)
+        for start, stop in zip(bounds[:-1], bounds[1:])
+        if start < stop
+    ]
+
+
+def _batched_bfs(
+    G, cutoff, *, return_type, scale=None, batch_size=None, memory_budget=None
+):
+    """Lazily yield ``(source, result)`` of `_bfs` from every node in G.
+
+    Rather than running a traversal for each source node, this advances the
+    frontiers of many sources at once, so one step of a batch of traversals is
+    a handful of vectorized array operations. The number of sources in a batch
+    is bounded such that dense ``(batch_size, N)`` results fit in memory, and
+    the frontier is expanded in slices whose outgoing edges fit in memory.
+    """
+    N = G._N
+    if N == 0:
+        return
+    if cutoff is None:
+        cutoff = -1
+    compute_predecessors = return_type != "length"
+    dist_max = np.iinfo(np.int32).max
+    bytes_per_source = N * (np.dtype(np.int32).itemsize + compute_predecessors * 4)
+    batch_size = _get_batch_size(N, bytes_per_source, batch_size, memory_budget)
+    max_edges = _get_max_frontier_edges(memory_budget)
+    indptr, indices, _ = _get_csr(G)
+    node_ids = cp.arange(N, dtype=index_dtype)
+    sources = list(G)
+    source_ids = G._list_to_nodearray(sources).astype(np.int64)
+    for start in range(0, N, batch_size):
+        batch = sources[start : start + batch_size]
+        B = len(batch)
+        rows = cp.arange(B, dtype=np.int64)
+        nodes = source_ids[start : start + B]
+        distances = cp.full((B, N), dist_max, np.int32)
+        distances[rows, nodes] = 0
+        if compute_predecessors:
+            predecessors = cp.full((B, N), -1, index_dtype)
+        depth = 0
+        while nodes.size > 0 and depth != cutoff:
+            depth += 1
+            next_rows = []
+            next_nodes = []
+            for chunk in _split_frontier(indptr, nodes, max_edges):
+                prev_nodes = nodes[chunk]
+                seg, positions = _expand_frontier(indptr, prev_nodes)
+                nbrs = indices[positions].astype(np.int64)
+                seg_rows = rows[chunk][seg]
+                # Nodes reached by earlier chunks of this step are visited too
+                unvisited = distances[seg_rows, nbrs] == dist_max
+                seg = seg[unvisited]
+                # Keep the first edge that reaches each (row, node) pair
+                keys, first = cp.unique(
+                    seg_rows[unvisited] * N + nbrs[unvisited], return_index=True
+                )
+                new_rows, new_nodes = cp.divmod(keys, N)
+                distances[new_rows, new_nodes] = depth
+                if compute_predecessors:
+                    predecessors[new_rows, new_nodes] = prev_nodes[seg[first]]
+                next_rows.append(new_rows)
+                next_nodes.append(new_nodes)
+            rows = cp.concatenate(next_rows)
+            nodes = cp.concatenate(next_nodes)
+        batch_ids = source_ids[start : start + B].tolist()
+        for i, (source, src_index) in enumerate(zip(batch, batch_ids)):
+            yield (
+                source,
+                _bfs_results(
+                    G,
+                    source,
+                    src_index,
+                    distances[i],
+                    predecessors[i] if compute_predecessors else None,
+                    node_ids,
+                    return_type=return_type,
+                    scale=scale,
+                ),
+            )
+
+
+def _bidirectional_bfs(G, pairs, *, batch_size=None, memory_budget=None):
+    """Lazily yield a shortest path (or None) for each ``(source, target)`` pair.
+
+    Each search advances a frontier from the source along out-edges and one from
+    the target along in-edges, always expanding the smaller side, and stops as
+    soon as the two frontiers meet. Many searches are advanced together.
+    """
+    N = G._N
+    fwd_csr = _get_csr(G)[:2]
+    bwd_csr = _get_csr(G, reverse=True)[:2] if G.is_directed() else fwd_csr
+    bytes_per_pair = 2 * N * np.dtype(index_dtype).itemsize
+    batch_size = _get_batch_size(len(pairs), bytes_per_pair, batch_size, memory_budget)
+    id_to_key = G.id_to_key
+    for start in range(0, len(pairs), batch_size):
+        batch = pairs[start : start + batch_size]
+        B = len(batch)
+        rows = cp.arange(B, dtype=np.int64)
+        src_ids = G._list_to_nodearray([source for source, _ in batch])
+        dst_ids = G._list_to_nodearray([target for _, target in batch])
+        # pred[i, v] is the node before v on a path from the source of pair i,
+        # and succ[i, v] is the node after v on a path to the target of pair i.
+        # The source and target point to themselves to mark the ends of paths.
+        pred = cp.full((B, N), -1, index_dtype)
+        succ = cp.full((B, N), -1, index_dtype)
+        pred[rows, src_ids] = src_ids
+        succ[rows, dst_ids] = dst_ids
+        # A node where the frontiers met for each pair, or -1
+        meet = cp.where(src_ids == dst_ids, src_ids, -1).astype(np.int64)
+        active = meet < 0
+        fwd = (rows[active], src_ids[active].astype(np.int64))
+        bwd = (rows[active], dst_ids[active].astype(np.int64))
+        while fwd[0].size > 0:
+            if fwd[0].size <= bwd[0].size:
+                fwd = _bidirectional_step(fwd, fwd_csr, pred, succ, meet, N)
+            else:
+                bwd = _bidirectional_step(bwd, bwd_csr, succ, pred, meet, N)
+            # Stop searching for pairs that met or that can't reach each other
+            alive = meet < 0
+            alive &= _has_rows(fwd[0], B)
+            alive &= _has_rows(bwd[0], B)
+            fwd = _filter_frontier(fwd, alive)
+            bwd = _filter_frontier(bwd, alive)
+        met_rows = cp.nonzero(meet >= 0)[0]
+        heads = _walk_to_ends(pred, met_rows, meet[met_rows])
+        tails = _walk_to_ends(succ, met_rows, meet[met_rows])
+        paths = {
+            row: [*reversed(head), *tail[1:]]
+            for row, head, tail in zip(met_rows.tolist(), heads, tails)
+        }
+        for i in range(B):
+            path = paths.get(i)
+            if path is not None and id_to_key is not None:
+                path = [id_to_key[node] for node in path]
+            yield path
+
+
+def _bidirectional_step(frontier, csr, parents, others, meet, N):
+    """Advance one side of the bidirectional searches by one level."""
+    rows, nodes = frontier
+    indptr, indices = csr
+    seg, positions = _expand_frontier(indptr, nodes)
+    seg_rows = rows[seg]
+    nbrs = indices[positions].astype(np.int64)
+    unvisited = parents[seg_rows, nbrs] == -1
+    seg = seg[unvisited]
+    seg_rows = seg_rows[unvisited]
+    nbrs = nbrs[unvisited]
+    parents[seg_rows, nbrs] = nodes[seg]
+    # Every meeting node found in the same level gives a path of equal length
+    met = others[seg_rows, nbrs] != -1
+    meet[seg_rows[met]] = nbrs[met]
+    return cp.divmod(cp.unique(seg_rows * N + nbrs), N)
+
+
+def _has_rows(rows, B):
+    """Mask of length ``B`` of which rows appear in ``rows``."""
+    mask = cp.zeros(B, bool)
+    mask[rows] = True
+    return mask
+
+
+def _filter_frontier(frontier, alive):
+    rows, nodes = frontier
+    keep = alive[rows]
+    return rows[keep], nodes[keep]
+
+
+def _walk_to_ends(parents, rows, nodes):
+    """Follow ``parents`` from ``nodes`` until each walk reaches a self-loop.
+
+    All walks are advanced together, and the results are copied to the host once.
+    Returns a list of paths (lists of node ids), one per row.
+    """
+    steps = [nodes]
+    while True:
+        nodes = parents[rows, nodes].astype(np.int64)
+        if (nodes == steps[-1]).all():
+            break
+        steps.append(nodes)
+    steps = cp.vstack(steps).T
+    lengths = (cp.diff(steps, axis=1) != 0).sum(axis=1) + 1
+    return [row[:length] for row, length in zip(steps.tolist(), lengths.tolist())]
@@ -10,6 +10,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import cupy as cp
+import cupyx
 import networkx as nx
 import numpy as np
 import pylibcugraph as plc
@@ -19,10 +21,20 @@ from nx_cugraph.utils import (
     _dtype_param,
     _get_float_dtype,
     _groupby,
+    index_dtype,
     networkx_algorithm,
 )
 
-from .unweighted import _bfs
+from .unweighted import (
+    _batch_params,
+    _batched_bfs,
+    _bfs,
+    _expand_frontier,
+    _get_batch_size,
+    _get_csr,
+    _get_max_frontier_edges,
+    _split_frontier,
+)
 
 __all__ = [
     "bellman_ford_path",
@@ -129,18 +141,27 @@ def _(G, source, target=None, weight="weight", *, dtype=None):
     )
 
 
-@networkx_algorithm(extra_params=_dtype_param, version_added="24.04", _plc="sssp")
+@networkx_algorithm(
+    extra_params={**_dtype_param, **_batch_params}, version_added="24.04"
+)
 @_add_doc
-def all_pairs_bellman_ford_path_length(G, weight="weight", *, dtype=None):
-    # TODO PERF: batched bfs to compute many at once
+def all_pairs_bellman_ford_path_length(
+    G, weight="weight", *, dtype=None, batch_size=None, memory_budget=None
+):
     G = _to_graph(G, weight, 1, np.float32)
     dtype = _get_float_dtype(dtype, graph=G, weight=weight)
-    for n in G:
-        yield (n, _sssp(G, n, weight, return_type="length", dtype=dtype))
+    yield from _batched_sssp(
+        G,
+        weight,
+        return_type="length",
+        dtype=dtype,
+        batch_size=batch_size,
+        memory_budget=memory_budget,
+    )
 
 
 @all_pairs_bellman_ford_path_length._can_run
-def _(G, weight="weight", *, dtype=None):
+def _(G, weight="weight", *, dtype=None, batch_size=None, memory_budget=None):
     return (
         weight is None
         or not callable(weight)
@@ -148,18 +169,27 @@ def _(G, weight="weight", *, dtype=None):
     )
 
 
-@networkx_algorithm(extra_params=_dtype_param, version_added="24.04", _plc="sssp")
+@networkx_algorithm(
+    extra_params={**_dtype_param, **_batch_params}, version_added="24.04"
+)
 @_add_doc
-def all_pairs_bellman_ford_path(G, weight="weight", *, dtype=None):
-    # TODO PERF: batched bfs to compute many at once
+def all_pairs_bellman_ford_path(
+    G, weight="weight", *, dtype=None, batch_size=None, memory_budget=None
+):
     G = _to_graph(G, weight, 1, np.float32)
     dtype = _get_float_dtype(dtype, graph=G, weight=weight)
-    for n in G:
-        yield (n, _sssp(G, n, weight, return_type="path", dtype=dtype))
+    yield from _batched_sssp(
+        G,
+        weight,
+        return_type="path",
+        dtype=dtype,
+        batch_size=batch_size,
+        memory_budget=memory_budget,
+    )
 
 
 @all_pairs_bellman_ford_path._can_run
-def _(G, weight="weight", *, dtype=None):
+def _(G, weight="weight", *, dtype=None, batch_size=None, memory_budget=None):
     return (
         weight is None
         or not callable(weight)
@@ -235,6 +265,32 @@ def _sssp(G, source, weight, target=None, *, return_type, dtype, reverse_path=Fa
         # compute_predecessors=return_type != "length",
         do_expensive_check=False,
     )
+    return _sssp_results(
+        G,
+        source,
+        src_index,
+        distances,
+        predecessors,
+        node_ids,
+        return_type=return_type,
+        target=target,
+        reverse_path=reverse_path,
+    )
+
+
+def _sssp_results(
+    G,
+    source,
+    src_index,
+    distances,
+    predecessors,
+    node_ids,
+    *,
+    return_type,
+    target=None,
+    reverse_path=False,
+):
+    """Convert the SSSP arrays from a single source to the results of `_sssp`."""
     mask = distances != np.finfo(distances.dtype).max
     node_ids = node_ids[mask]
     if return_type != "path":
@@ -284,3 +340,107 @@ def _sssp(G, source, weight, target=None, *, return_type, dtype, reverse_path=Fa
         return lengths
     # return_type == "length-path"
     return lengths, paths
+
+
+def _batched_sssp(
+    G, weight, *, return_type, dtype, batch_size=None, memory_budget=None
+):
+    """Lazily yield ``(source, result)`` of `_sssp` from every node in G.
+
+    This is a batched Bellman-Ford: the frontier of each traversal in a batch
+    holds the nodes whose distance improved in the previous step, and all edges
+    leaving the frontiers of the batch are relaxed together.
+    """
+    if callable(weight):
+        raise NotImplementedError("callable `weight` argument is not supported")
+    N = G._N
+    if weight not in G.edge_values or N == 0 or G.src_indices.size == 0:
+        # No edge values, so use BFS instead
+        yield from _batched_bfs(
+            G,
+            None,
+            return_type=return_type,
+            batch_size=batch_size,
+            memory_budget=memory_budget,
+        )
+        return
+
+    # Check for negative values since we don't support negative cycles
+    edge_vals = G.edge_values[weight]
+    if weight in G.edge_masks:
+        edge_vals = edge_vals[G.edge_masks[weight]]
+    if (edge_vals < 0).any():
+        raise NotImplementedError("Negative edge weights not yet supported")
+    edge_val = edge_vals[0]
+    if (edge_vals == edge_val).all() and (
+        edge_vals.size == G.src_indices.size or edge_val == 1
+    ):
+        # Edge values are all the same, so use scaled BFS instead
+        yield from _batched_bfs(
+            G,
+            None,
+            return_type=return_type,
+            scale=edge_val,
+            batch_size=batch_size,
+            memory_budget=memory_budget,
+        )
+        return
+
+    # Missing edge values default to 1 as in `G._get_plc_graph(weight, 1, dtype)`
+    edge_array = G.edge_values[weight]
+    if weight in G.edge_masks:
+        edge_array = cp.where(G.edge_masks[weight], edge_array, 1)
+    indptr, indices, edge_ids = _get_csr(G)
+    weights = edge_array[edge_ids].astype(dtype)
+    dist_max = np.finfo(dtype).max
+    bytes_per_source = N * (dtype.itemsize + np.dtype(index_dtype).itemsize)
+    batch_size = _get_batch_size(N, bytes_per_source, batch_size, memory_budget)
+    max_edges = _get_max_frontier_edges(memory_budget)
+    node_ids = cp.arange(N, dtype=index_dtype)
+    sources = list(G)
+    source_ids = G._list_to_nodearray(sources).astype(np.int64)
+    for start in range(0, N, batch_size):
+        batch = sources[start : start + batch_size]
+        B = len(batch)
+        rows = cp.arange(B, dtype=np.int64)
+        nodes = source_ids[start : start + B]
+        distances = cp.full((B, N), dist_max, dtype)
+        distances[rows, nodes] = 0
+        predecessors = cp.full((B, N), -1, index_dtype)
+        flat_distances = distances.reshape(-1)
+        flat_predecessors = predecessors.reshape(-1)
+        while nodes.size > 0:
+            improved_keys = []
+            for chunk in _split_frontier(indptr, nodes, max_edges):
+                chunk_rows = rows[chunk]
+                chunk_nodes = nodes[chunk]
+                seg, positions = _expand_frontier(indptr, chunk_nodes)
+                keys = chunk_rows[seg] * N + indices[positions]
+                candidates = (
+                    distances[chunk_rows[seg], chunk_nodes[seg]] + weights[positions]
+                )
+                improved = candidates < flat_distances[keys]
+                keys = keys[improved]
+                candidates = candidates[improved]
+                seg = seg[improved]
+                cupyx.scatter_min(flat_distances, keys, candidates)
+                # Any candidate that achieved the new minimum is a valid predecessor
+                winners = candidates == flat_distances[keys]
+                keys = keys[winners]
+                flat_predecessors[keys] = chunk_nodes[seg[winners]]
+                improved_keys.append(keys)
+            rows, nodes = cp.divmod(cp.unique(cp.concatenate(improved_keys)), N)
+        batch_ids = source_ids[start : start + B].tolist()
+        for i, (source, src_index) in enumerate(zip(batch, batch_ids)):
+            yield (
+                source,
+                _sssp_results(
+                    G,
+                    source,
+                    src_index,
+                    distances[i],
+                    predecessors[i],
+                    node_ids,
+                    return_type=return_type,
+                ),
+            )
@@ -143,15 +143,9 @@ class DiGraph(Graph):
 
         node_values = self.node_values
         node_masks = self.node_masks
-        key_to_id = self.key_to_id
-        id_to_key = None if key_to_id is None else self._id_to_key
         if not as_view:
             node_values = {key: val.copy() for key, val in node_values.items()}
             node_masks = {key: val.copy() for key, val in node_masks.items()}
-            if key_to_id is not None:
-                key_to_id = key_to_id.copy()
-                if id_to_key is not None:
-                    id_to_key = id_to_key.copy()
         rv = self.to_undirected_class().from_coo(
             N,
             src_indices,
@@ -160,8 +154,8 @@ class DiGraph(Graph):
             edge_masks,
             node_values,
             node_masks,
-            key_to_id=key_to_id,
-            id_to_key=id_to_key,
+            # Node keys are never modified, so they are shared
+            key_to_id=self._node_keys,
         )
         if as_view:
             rv.graph = self.graph
@@ -13,7 +13,10 @@
 from __future__ import annotations
 
 import operator as op
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from copy import deepcopy
+from functools import partial
 from typing import TYPE_CHECKING
 
 import cupy as cp
@@ -45,6 +48,166 @@ __all__ = ["Graph"]
 networkx_api = nxcg.utils.decorators.networkx_class(nx.Graph)
 
 
+class _NodeKeyMap(Mapping):
+    """Compact map of node keys to node ids ``0..N-1`` that is shared by graphs.
+
+    ``keys`` holds the node keys in node id order as an int64 array if all keys are
+    int, else as an object array. Int and str keys are looked up with searchsorted
+    using ``sorter``, the argsort of ``keys``. Other keys (tuples, mixed types,
+    etc.) are looked up in a dict. Instances are never modified.
+    """
+
+    keys: np.ndarray[NodeKey]
+    key_type: type | None  # int or str if keys are looked up with searchsorted
+    _sorter: np.ndarray[IndexValue] | None
+    _dict: dict[NodeKey, IndexValue] | None
+
+    def __init__(
+        self,
+        keys: np.ndarray[NodeKey],
+        key_type: type | None,
+        key_to_id: dict[NodeKey, IndexValue] | None = None,
+    ):
+        self.keys = keys
+        self.key_type = key_type
+        self._sorter = None
+        self._dict = key_to_id
+        if key_type is None and key_to_id is None:
+            try:
+                self._dict = dict(zip(self.id_to_key, range(keys.size)))
+            except TypeError as exc:
+                raise ValueError("Bad type of a node value") from exc
+
+    @classmethod
+    def from_keys(
+        cls,
+        N: int,
+        key_to_id: dict[NodeKey, IndexValue] | _NodeKeyMap | None = None,
+        id_to_key: list[NodeKey] | _IdToKeyView | None = None,
+    ) -> _NodeKeyMap | None:
+        """Create from ``key_to_id`` and/or ``id_to_key`` as given to ``from_coo``."""
+        if isinstance(key_to_id, _NodeKeyMap):
+            rv = key_to_id
+        elif isinstance(id_to_key, _IdToKeyView):
+            rv = id_to_key.node_key_map
+        elif key_to_id is None and id_to_key is None:
+            return None
+        else:
+            if key_to_id is not None and len(key_to_id) != N:
+                raise ValueError
+            if id_to_key is not None:
+                id_to_key = list(id_to_key)
+            elif all(map(op.eq, key_to_id.values(), range(N))):
+                # Node ids are in insertion order, such as from `from_networkx`
+                id_to_key = list(key_to_id)
+            else:
+                id_to_key = sorted(key_to_id, key=key_to_id.__getitem__)
+            key_types = set(map(type, id_to_key))
+            if key_types == {int}:
+                try:
+                    return cls(np.fromiter(id_to_key, np.int64, len(id_to_key)), int)
+                except OverflowError:
+                    pass
+            # Use `fromiter` so numpy doesn't make e.g. tuple keys into a 2-d array
+            keys = np.fromiter(id_to_key, object, len(id_to_key))
+            if key_types == {str}:
+                rv = cls(keys, str)
+            else:
+                rv = cls(keys, None, None if key_to_id is None else dict(key_to_id))
+        if rv.keys.size != N:
+            raise ValueError
+        return rv
+
+    @property
+    def key_to_id(self) -> Mapping[NodeKey, IndexValue]:
+        """The dict of keys to ids if there is one, else this map."""
+        return self if self._dict is None else self._dict
+
+    @property
+    def id_to_key(self) -> _IdToKeyView:
+        return _IdToKeyView(self)
+
+    @property
+    def sorter(self) -> np.ndarray[IndexValue]:
+        if self._sorter is None:
+            self._sorter = np.argsort(self.keys, kind="stable").astype(index_dtype)
+        return self._sorter
+
+    def __getitem__(self, key: NodeKey) -> IndexValue:
+        if self._dict is not None:
+            return self._dict[key]
+        if self.key_type is int:
+            # Also accept e.g. numpy ints and bools like dict keys would
+            if not isinstance(key, (int, np.integer)) or not (-(2**63) <= key < 2**63):
+                raise KeyError(key)
+        elif not isinstance(key, str):
+            raise KeyError(key)
+        sorter = self.sorter
+        pos = self.keys.searchsorted(key, sorter=sorter)
+        if pos < sorter.size and self.keys.item(node_id := sorter.item(pos)) == key:
+            return node_id
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[NodeKey]:
+        return iter(self.id_to_key)
+
+    def __len__(self) -> int:
+        return self.keys.size
+
+    def get_ids(self, nodes: list[NodeKey]) -> np.ndarray[IndexValue] | None:
+        """Look up many int or str keys at once.
+
+        Returns None if any node is missing or is not exactly of the key type, or
+        if keys are of other types. Look up nodes one at a time to raise KeyError.
+        """
+        if self.key_type is int:
+            if not all(
+                isinstance(node, int) and not isinstance(node, bool) for node in nodes
+            ):
+                return None
+            try:
+                keys = np.array(nodes, np.int64)
+            except OverflowError:
+                return None
+        elif self.key_type is str:
+            if not all(isinstance(node, str) for node in nodes):
+                return None
+            keys = np.fromiter(nodes, object, len(nodes))
+        else:
+            return None
+        sorter = self.sorter
+        pos = self.keys.searchsorted(keys, sorter=sorter)
+        pos[pos == sorter.size] = 0
+        node_ids = sorter[pos]
+        if not (self.keys[node_ids] == keys).all():
+            return None
+        return node_ids
+
+
+class _IdToKeyView(Sequence):
+    """Read-only list of node keys indexed by node id; see ``_NodeKeyMap``."""
+
+    def __init__(self, node_key_map: _NodeKeyMap):
+        self.node_key_map = node_key_map
+        self._keys = node_key_map.keys
+
+    def __getitem__(self, index: int | slice) -> NodeKey | list[NodeKey]:
+        if isinstance(index, slice):
+            return self._keys[index].tolist()
+        return self._keys.item(index)
+
+    def __iter__(self) -> Iterator[NodeKey]:
+        return iter(self._keys.tolist())
+
+    def __len__(self) -> int:
+        return self._keys.size
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _IdToKeyView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+
 class Graph:
     # Tell networkx to dispatch calls with this object to nx-cugraph
     __networkx_backend__: ClassVar[str] = "cugraph"  # nx >=3.2
@@ -62,11 +225,24 @@ class Graph:
     edge_masks: dict[AttrKey, cp.ndarray[bool]]
     node_values: dict[AttrKey, any_ndarray[NodeValue]]
     node_masks: dict[AttrKey, any_ndarray[bool]]
-    key_to_id: dict[NodeKey, IndexValue] | None
-    _id_to_key: list[NodeKey] | None
+    # Node keys, if any, exposed as `key_to_id` and `id_to_key`
+    _node_keys: _NodeKeyMap | None
     _N: int
     _node_ids: cp.ndarray[IndexValue] | None  # holds plc.SGGraph.vertices_array data
 
+    # PLC graphs built by `_get_plc_graph` (and other structures derived from the
+    # edges, see `_get_cached`) are cached per graph in LRU order. Each value is
+    # `(plc_graph, arrays, nbytes)`, where `arrays` keeps the device arrays used
+    # to build the PLC graph alive as long as it is cached. The cache is cleared
+    # whenever the graph structure is mutated.
+    _plc_cache: OrderedDict[tuple, tuple[object, tuple, int]]
+    _plc_cache_nbytes: int
+    _plc_cache_hits: int
+    _plc_cache_misses: int
+    # Maximum bytes of index and weight arrays held by the PLC graph cache of
+    # a single graph; set to 0 to disable caching.
+    plc_cache_max_bytes: ClassVar[int] = 2**30
+
     # Used by graph._get_plc_graph
     _plc_type_map: ClassVar[dict[np.dtype, np.dtype]] = {
         # signed int
@@ -114,10 +290,13 @@ class Graph:
         new_graph.edge_masks = {} if edge_masks is None else dict(edge_masks)
         new_graph.node_values = {} if node_values is None else dict(node_values)
         new_graph.node_masks = {} if node_masks is None else dict(node_masks)
-        new_graph.key_to_id = None if key_to_id is None else dict(key_to_id)
-        new_graph._id_to_key = None if id_to_key is None else list(id_to_key)
         new_graph._N = op.index(N)  # Ensure N is integral
+        new_graph._node_keys = _NodeKeyMap.from_keys(N, key_to_id, id_to_key)
         new_graph._node_ids = None
+        new_graph._plc_cache = OrderedDict()
+        new_graph._plc_cache_nbytes = 0
+        new_graph._plc_cache_hits = 0
+        new_graph._plc_cache_misses = 0
         new_graph.graph = new_graph.graph_attr_dict_factory()
         new_graph.graph.update(attr)
         size = new_graph.src_indices.size
@@ -134,15 +313,6 @@ class Graph:
                 for key, val in datadict.items():
                     if val.shape[0] != N:
                         raise ValueError(key)
-        if new_graph.key_to_id is not None and len(new_graph.key_to_id) != N:
-            raise ValueError
-        if new_graph._id_to_key is not None and len(new_graph._id_to_key) != N:
-            raise ValueError
-        if new_graph._id_to_key is not None and new_graph.key_to_id is None:
-            try:
-                new_graph.key_to_id = dict(zip(new_graph._id_to_key, range(N)))
-            except TypeError as exc:
-                raise ValueError("Bad type of a node value") from exc
         if new_graph.src_indices.dtype != index_dtype:
             src_indices = new_graph.src_indices.astype(index_dtype)
             if not (new_graph.src_indices == src_indices).all():
@@ -356,12 +526,27 @@ class Graph:
         return {key: val.dtype for key, val in self.node_values.items()}
 
     @property
-    def id_to_key(self) -> [NodeKey] | None:
-        if self.key_to_id is None:
+    def key_to_id(self) -> Mapping[NodeKey, IndexValue] | None:
+        if self._node_keys is None:
             return None
-        if self._id_to_key is None:
-            self._id_to_key = sorted(self.key_to_id, key=self.key_to_id.__getitem__)
-        return self._id_to_key
+        return self._node_keys.key_to_id
+
+    @property
+    def id_to_key(self) -> Sequence[NodeKey] | None:
+        if self._node_keys is None:
+            return None
+        return self._node_keys.id_to_key
+
+    @property
+    def plc_cache_info(self) -> dict[str, int]:
+        """Statistics of the cache of pylibcugraph graphs used by algorithms."""
+        return {
+            "hits": self._plc_cache_hits,
+            "misses": self._plc_cache_misses,
+            "currsize": len(self._plc_cache),
+            "nbytes": self._plc_cache_nbytes,
+            "max_bytes": self.plc_cache_max_bytes,
+        }
 
     name = nx.Graph.name
 
@@ -409,6 +594,7 @@ class Graph:
 
     @networkx_api
     def clear(self) -> None:
+        self._clear_plc_cache()
         self.edge_values.clear()
         self.edge_masks.clear()
         self.node_values.clear()
@@ -418,11 +604,11 @@ class Graph:
         self.dst_indices = cp.empty(0, self.dst_indices.dtype)
         self._N = 0
         self._node_ids = None
-        self.key_to_id = None
-        self._id_to_key = None
+        self._node_keys = None
 
     @networkx_api
     def clear_edges(self) -> None:
+        self._clear_plc_cache()
         self.edge_values.clear()
         self.edge_masks.clear()
         self.src_indices = cp.empty(0, self.src_indices.dtype)
@@ -551,8 +737,6 @@ class Graph:
         edge_masks = self.edge_masks
         node_values = self.node_values
         node_masks = self.node_masks
-        key_to_id = self.key_to_id
-        id_to_key = None if key_to_id is None else self._id_to_key
         if not as_view:
             src_indices = src_indices.copy()
             dst_indices = dst_indices.copy()
@@ -560,10 +744,6 @@ class Graph:
             edge_masks = {key: val.copy() for key, val in edge_masks.items()}
             node_values = {key: val.copy() for key, val in node_values.items()}
             node_masks = {key: val.copy() for key, val in node_masks.items()}
-            if key_to_id is not None:
-                key_to_id = key_to_id.copy()
-                if id_to_key is not None:
-                    id_to_key = id_to_key.copy()
         if reverse:
             src_indices, dst_indices = dst_indices, src_indices
         rv = cls.from_coo(
@@ -574,8 +754,8 @@ class Graph:
             edge_masks,
             node_values,
             node_masks,
-            key_to_id=key_to_id,
-            id_to_key=id_to_key,
+            # Node keys are never modified, so they are shared
+            key_to_id=self._node_keys,
         )
         if as_view:
             rv.graph = self.graph
@@ -594,6 +774,73 @@ class Graph:
         edge_array: cp.ndarray[EdgeValue] | None = None,
         symmetrize: str | None = None,
     ):
+        build = partial(
+            self._build_plc_graph,
+            edge_attr,
+            edge_default,
+            edge_dtype,
+            store_transposed=store_transposed,
+            switch_indices=switch_indices,
+            edge_array=edge_array,
+            symmetrize=symmetrize,
+        )
+        if edge_array is not None:
+            # Don't cache graphs that use arbitrary user-given edge arrays
+            return build()[0]
+        cache_key = (
+            edge_attr,
+            edge_default,
+            None if edge_dtype is None else np.dtype(edge_dtype),
+            store_transposed,
+            switch_indices,
+            symmetrize,
+        )
+        return self._get_cached(cache_key, build)
+
+    def _get_cached(self, cache_key, build):
+        """Get a value derived from the graph structure from the LRU cache.
+
+        If it is not cached, then call ``build()``, which must return a tuple
+        ``(value, arrays)``, where ``arrays`` are the device arrays that must be
+        kept alive as long as ``value`` is used; their sizes are counted against
+        ``plc_cache_max_bytes``.
+        """
+        if (max_bytes := self.plc_cache_max_bytes) <= 0:
+            return build()[0]
+        cache = self._plc_cache
+        try:
+            is_cached = cache_key in cache
+        except TypeError:
+            # Unhashable key (such as `edge_default`); build without caching
+            return build()[0]
+        if is_cached:
+            self._plc_cache_hits += 1
+            cache.move_to_end(cache_key)
+            return cache[cache_key][0]
+        self._plc_cache_misses += 1
+        value, arrays = build()
+        nbytes = sum(x.nbytes for x in arrays if x is not None)
+        if nbytes <= max_bytes:
+            # Evict least recently used values to stay within the memory cap
+            while cache and self._plc_cache_nbytes + nbytes > max_bytes:
+                *_, evicted_nbytes = cache.popitem(last=False)[1]
+                self._plc_cache_nbytes -= evicted_nbytes
+            cache[cache_key] = (value, arrays, nbytes)
+            self._plc_cache_nbytes += nbytes
+        return value
+
+    def _build_plc_graph(
+        self,
+        edge_attr: AttrKey | None = None,
+        edge_default: EdgeValue | None = None,
+        edge_dtype: Dtype | None = None,
+        *,
+        store_transposed: bool = False,
+        switch_indices: bool = False,
+        edge_array: cp.ndarray[EdgeValue] | None = None,
+        symmetrize: str | None = None,
+    ):
+        """Create a new ``plc.SGGraph``; also return the arrays it was built from."""
         if edge_array is not None or edge_attr is None:
             pass
         elif edge_attr not in self.edge_values:
@@ -645,7 +892,6 @@ class Graph:
                 edge_array = edge_array.astype(self._plc_type_map[edge_array.dtype])
             elif edge_array.dtype not in self._plc_allowed_edge_types:
                 raise TypeError(edge_array.dtype)
-        # Should we cache PLC graph?
         src_indices = self.src_indices
         dst_indices = self.dst_indices
         if switch_indices:
@@ -671,7 +917,7 @@ class Graph:
             src_indices = src_indices.astype(index_dtype)
             dst_indices = dst_indices.astype(index_dtype)
 
-        return plc.SGGraph(
+        plc_graph = plc.SGGraph(
             resource_handle=plc.ResourceHandle(),
             graph_properties=plc.GraphProperties(
                 is_multigraph=self.is_multigraph() and symmetrize is None,
@@ -685,6 +931,12 @@ class Graph:
             do_expensive_check=False,
             vertices_array=self._node_ids,
         )
+        return plc_graph, (src_indices, dst_indices, edge_array, self._node_ids)
+
+    def _clear_plc_cache(self) -> None:
+        """Drop cached PLC graphs and other derived data; call this on mutation."""
+        self._plc_cache.clear()
+        self._plc_cache_nbytes = 0
 
     def _sort_edge_indices(self, primary="src"):
         # DRY warning: see also MultiGraph._sort_edge_indices
@@ -700,6 +952,7 @@ class Graph:
         if (cp.diff(indices) > 0).all():
             # Already sorted
             return
+        self._clear_plc_cache()
         self.src_indices = self.src_indices[indices]
         self.dst_indices = self.dst_indices[indices]
         self.edge_values.update(
@@ -715,6 +968,8 @@ class Graph:
                 "Attempting to update graph inplace with graph of different type!"
             )
         self.clear()
+        plc_cache = self._plc_cache
+        plc_cache_stats = (self._plc_cache_hits, self._plc_cache_misses)
         edge_values = self.edge_values
         edge_masks = self.edge_masks
         node_values = self.node_values
@@ -726,6 +981,10 @@ class Graph:
         node_masks.update(other.node_masks)
         graph.update(other.graph)
         self.__dict__.update(other.__dict__)
+        # Don't share PLC graph cache or its statistics with `other`
+        self._plc_cache = plc_cache
+        self._plc_cache_hits, self._plc_cache_misses = plc_cache_stats
+        self._plc_cache_nbytes = 0
         self.edge_values = edge_values
         self.edge_masks = edge_masks
         self.node_values = node_values
@@ -755,7 +1014,7 @@ class Graph:
     def _nodekeys_to_nodearray(self, nodes: Iterable[NodeKey]) -> cp.array[IndexValue]:
         if self.key_to_id is None:
             return cp.fromiter(nodes, dtype=index_dtype)
-        return cp.fromiter(map(self.key_to_id.__getitem__, nodes), dtype=index_dtype)
+        return self._list_to_nodearray(list(nodes))
 
     def _nodeiter_to_iter(self, node_ids: Iterable[IndexValue]) -> Iterable[NodeKey]:
         """Convert an iterable of node IDs to an iterable of node keys."""
@@ -763,36 +1022,42 @@ class Graph:
             return map(id_to_key.__getitem__, node_ids)
         return node_ids
 
+    def _get_id_to_key_array(self) -> np.ndarray[NodeKey] | None:
+        """Get node keys as a numpy array indexed by node id, or None if no keys."""
+        if self._node_keys is None:
+            return None
+        return self._node_keys.keys
+
     def _nodearray_to_list(self, node_ids: cp.ndarray[IndexValue]) -> list[NodeKey]:
-        if self.key_to_id is None:
+        if (keys := self._get_id_to_key_array()) is None:
             return node_ids.tolist()
-        return list(self._nodeiter_to_iter(node_ids.tolist()))
+        return keys[cp.asnumpy(node_ids)].tolist()
 
     def _list_to_nodearray(self, nodes: list[NodeKey]) -> cp.ndarray[IndexValue]:
-        if (key_to_id := self.key_to_id) is not None:
-            nodes = [key_to_id[node] for node in nodes]
-        return cp.array(nodes, dtype=index_dtype)
+        if (node_keys := self._node_keys) is None:
+            return cp.array(nodes, dtype=index_dtype)
+        if (node_ids := node_keys.get_ids(nodes)) is not None:
+            return cp.array(node_ids)
+        # Not all keys found (or of other types); look up each to raise KeyError
+        key_to_id = node_keys.key_to_id
+        return cp.array([key_to_id[node] for node in nodes], dtype=index_dtype)
 
     def _nodearray_to_set(self, node_ids: cp.ndarray[IndexValue]) -> set[NodeKey]:
-        if self.key_to_id is None:
+        if (keys := self._get_id_to_key_array()) is None:
             return set(node_ids.tolist())
-        return set(self._nodeiter_to_iter(node_ids.tolist()))
+        return set(keys[cp.asnumpy(node_ids)].tolist())
 
     def _nodearray_to_dict(
         self, values: cp.ndarray[NodeValue]
     ) -> dict[NodeKey, NodeValue]:
-        it = enumerate(values.tolist())
         if (id_to_key := self.id_to_key) is not None:
-            return {id_to_key[key]: val for key, val in it}
-        return dict(it)
+            return dict(zip(id_to_key, values.tolist()))
+        return dict(enumerate(values.tolist()))
 
     def _nodearrays_to_dict(
         self, node_ids: cp.ndarray[IndexValue], values: any_ndarray[NodeValue]
     ) -> dict[NodeKey, NodeValue]:
-        it = zip(node_ids.tolist(), values.tolist())
-        if (id_to_key := self.id_to_key) is not None:
-            return {id_to_key[key]: val for key, val in it}
-        return dict(it)
+        return dict(zip(self._nodearray_to_list(node_ids), values.tolist()))
 
     def _edgearrays_to_dict(
         self,
@@ -800,13 +1065,8 @@ class Graph:
         dst_ids: cp.ndarray[IndexValue],
         values: cp.ndarray[EdgeValue],
     ) -> dict[EdgeTuple, EdgeValue]:
-        it = zip(zip(src_ids.tolist(), dst_ids.tolist()), values.tolist())
-        if (id_to_key := self.id_to_key) is not None:
-            return {
-                (id_to_key[src_id], id_to_key[dst_id]): val
-                for (src_id, dst_id), val in it
-            }
-        return dict(it)
+        edges = zip(self._nodearray_to_list(src_ids), self._nodearray_to_list(dst_ids))
+        return dict(zip(edges, values.tolist()))
 
     def _dict_to_nodearrays(
         self,
@@ -814,10 +1074,9 @@ class Graph:
         dtype: Dtype | None = None,
     ) -> tuple[cp.ndarray[IndexValue], cp.ndarray[NodeValue]]:
         if self.key_to_id is None:
-            indices_iter = d
+            node_ids = cp.fromiter(d, index_dtype)
         else:
-            indices_iter = map(self.key_to_id.__getitem__, d)
-        node_ids = cp.fromiter(indices_iter, index_dtype)
+            node_ids = self._list_to_nodearray(list(d))
         if dtype is None:
             values = cp.array(list(d.values()))
         else:
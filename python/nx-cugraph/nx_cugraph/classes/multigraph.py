@@ -412,8 +412,6 @@ class MultiGraph(Graph):
         edge_masks = self.edge_masks
         node_values = self.node_values
         node_masks = self.node_masks
-        key_to_id = self.key_to_id
-        id_to_key = None if key_to_id is None else self._id_to_key
         edge_keys = self.edge_keys
         if not as_view:
             src_indices = src_indices.copy()
@@ -423,10 +421,6 @@ class MultiGraph(Graph):
             edge_masks = {key: val.copy() for key, val in edge_masks.items()}
             node_values = {key: val.copy() for key, val in node_values.items()}
             node_masks = {key: val.copy() for key, val in node_masks.items()}
-            if key_to_id is not None:
-                key_to_id = key_to_id.copy()
-                if id_to_key is not None:
-                    id_to_key = id_to_key.copy()
             if edge_keys is not None:
                 edge_keys = edge_keys.copy()
         if reverse:
@@ -440,8 +434,8 @@ class MultiGraph(Graph):
             edge_masks,
             node_values,
             node_masks,
-            key_to_id=key_to_id,
-            id_to_key=id_to_key,
+            # Node keys are never modified, so they are shared
+            key_to_id=self._node_keys,
             edge_keys=edge_keys,
         )
         if as_view:
@@ -472,6 +466,7 @@ class MultiGraph(Graph):
         if (cp.diff(indices) > 0).all():
             # Already sorted
             return
+        self._clear_plc_cache()
         self.src_indices = self.src_indices[indices]
         self.dst_indices = self.dst_indices[indices]
         self.edge_values.update(
@@ -14,8 +14,9 @@ from __future__ import annotations
 
 import itertools
 import operator as op
+import re
 from collections import Counter
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING
 
 import cupy as cp
@@ -27,7 +28,14 @@ import nx_cugraph as nxcg
 from .utils import index_dtype
 
 if TYPE_CHECKING:  # pragma: no cover
-    from nx_cugraph.typing import AttrKey, Dtype, EdgeValue, NodeValue, any_ndarray
+    from nx_cugraph.typing import (
+        AttrKey,
+        Dtype,
+        EdgeValue,
+        IndexValue,
+        NodeValue,
+        any_ndarray,
+    )
 
 __all__ = [
     "from_networkx",
@@ -35,8 +43,15 @@ __all__ = [
 ]
 
 concat = itertools.chain.from_iterable
+# Conversions are shared with the cache of the networkx dispatcher, whose keys are
+# not public API, so only for networkx versions known to use the same cache keys
+# as ``_conversion_cache_key``.
+_nx_version = tuple(map(int, re.findall(r"\d+", nx.__version__)[:2]))
+_shares_dispatcher_cache = (3, 4) <= _nx_version <= (3, 6)
 # A "required" attribute is one that all edges or nodes must have or KeyError is raised
 REQUIRED = ...
+# Name of this backend in networkx, such as in the networkx conversion cache
+_backend_name = "cugraph"
 
 
 def _iterate_values(graph, adj, is_dicts, func):
@@ -71,6 +86,8 @@ def from_networkx(
     as_directed: bool = False,
     name: str | None = None,
     graph_name: str | None = None,
+    chunksize: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
 ) -> nxcg.Graph:
     """Convert a networkx graph to nx_cugraph graph; can convert all attributes.
 
@@ -111,6 +128,14 @@ def from_networkx(
         The name of the algorithm when dispatched from networkx.
     graph_name : str, optional
         The name of the graph argument geing converted when dispatched from networkx.
+    chunksize : int, optional
+        If given, build the edge arrays for this many nodes (rows of the adjacency)
+        at a time and copy them to the GPU before continuing with the next chunk.
+        This bounds the host memory used for large graphs to about the size of a
+        chunk. By default, all edges are converted at once.
+    progress : callable, optional
+        Called as ``progress(num_nodes_done, num_nodes)`` after each chunk of the
+        adjacency has been converted.
 
     Returns
     -------
@@ -125,6 +150,7 @@ def from_networkx(
     3. Do you know the default values? Specify with ``edge_attrs={weight: default}``.
     4. Do you know if all edges have values? Specify with ``edge_attrs={weight: ...}``.
     5. Do you know the dtype of attributes? Specify with `edge_dtypes`.
+    6. Is the graph too large to convert at once? Specify `chunksize`.
 
     Conversely, using ``preserve_edge_attrs=True`` or ``preserve_all_attrs=True`` are
     the slowest, but are also the most flexible and generic.
@@ -273,114 +299,50 @@ def from_networkx(
                 node_attrs[attr] = REQUIRED
 
     key_to_id = dict(zip(adj, range(N)))
-    dst_iter = concat(adj.values())
     try:
         no_renumber = all(k == v for k, v in key_to_id.items())
     except Exception:
         no_renumber = False
     if no_renumber:
         key_to_id = None
-    else:
-        dst_iter = map(key_to_id.__getitem__, dst_iter)
-    if graph.is_multigraph():
-        dst_indices = np.fromiter(dst_iter, index_dtype)
-        num_multiedges, is_dicts = _iterate_values(
-            None, adj, is_dicts, lambda it: np.fromiter(map(len, it), index_dtype)
-        )
-        # cp.repeat is slow to use here, so use numpy instead
-        dst_indices = cp.array(np.repeat(dst_indices, num_multiedges))
-        # Determine edge keys and edge ids for multigraphs
-        if is_dicts:
-            edge_keys = list(concat(concat(map(dict.values, adj.values()))))
-            it = concat(map(dict.values, adj.values()))
-        else:
-            edge_keys = list(concat(concat(x.values() for x in adj.values())))
-            it = concat(x.values() for x in adj.values())
-        edge_indices = cp.fromiter(concat(map(range, map(len, it))), index_dtype)
-        if edge_keys == edge_indices.tolist():
-            edge_keys = None  # Prefer edge_indices
-    else:
-        dst_indices = cp.fromiter(dst_iter, index_dtype)
 
-    edge_values = {}
-    edge_masks = {}
     if edge_attrs:
         if edge_dtypes is None:
             edge_dtypes = {}
         elif not isinstance(edge_dtypes, Mapping):
             edge_dtypes = dict.fromkeys(edge_attrs, edge_dtypes)
-        for edge_attr, edge_default in edge_attrs.items():
-            dtype = edge_dtypes.get(edge_attr)
-            if edge_default is None:
-                vals = []
-                append = vals.append
-                if graph.is_multigraph():
-                    iter_mask = (
-                        append(
-                            edgedata[edge_attr]
-                            if (present := edge_attr in edgedata)
-                            else False
-                        )
-                        or present
-                        for rowdata in adj.values()
-                        for multiedges in rowdata.values()
-                        for edgedata in multiedges.values()
-                    )
-                else:
-                    iter_mask = (
-                        append(
-                            edgedata[edge_attr]
-                            if (present := edge_attr in edgedata)
-                            else False
-                        )
-                        or present
-                        for rowdata in adj.values()
-                        for edgedata in rowdata.values()
-                    )
-                edge_masks[edge_attr] = cp.fromiter(iter_mask, bool)
-                edge_values[edge_attr] = cp.array(vals, dtype)
-                # if vals.ndim > 1: ...
-            elif edge_default is REQUIRED:
-                if dtype is None:
-
-                    def func(it, edge_attr=edge_attr):
-                        return cp.array(list(map(op.itemgetter(edge_attr), it)))
-
-                else:
-
-                    def func(it, edge_attr=edge_attr, dtype=dtype):
-                        return cp.fromiter(map(op.itemgetter(edge_attr), it), dtype)
-
-                edge_value, is_dicts = _iterate_values(graph, adj, is_dicts, func)
-                edge_values[edge_attr] = edge_value
-            else:
-                if graph.is_multigraph():
-                    iter_values = (
-                        edgedata.get(edge_attr, edge_default)
-                        for rowdata in adj.values()
-                        for multiedges in rowdata.values()
-                        for edgedata in multiedges.values()
-                    )
-                else:
-                    iter_values = (
-                        edgedata.get(edge_attr, edge_default)
-                        for rowdata in adj.values()
-                        for edgedata in rowdata.values()
-                    )
-                if dtype is None:
-                    edge_values[edge_attr] = cp.array(list(iter_values))
-                else:
-                    edge_values[edge_attr] = cp.fromiter(iter_values, dtype)
-            # if vals.ndim > 1: ...
-
-    # cp.repeat is slow to use here, so use numpy instead
-    src_indices = np.repeat(
-        np.arange(N, dtype=index_dtype),
-        np.fromiter(map(len, adj.values()), index_dtype),
-    )
-    if graph.is_multigraph():
-        src_indices = np.repeat(src_indices, num_multiedges)
-    src_indices = cp.array(src_indices)
+    if chunksize is not None and chunksize <= 0:
+        raise ValueError(f"chunksize must be positive; got {chunksize}")
+    if chunksize is None or chunksize >= N:
+        chunks = [adj]
+    else:
+        keys = iter(adj)
+        chunks = (
+            {key: adj[key] for key in itertools.islice(keys, chunksize)}
+            for _ in range(0, N, chunksize)
+        )
+    # Python lists built while iterating over edges only live as long as a chunk;
+    # each chunk is copied to the GPU before building the next one.
+    edge_chunks = []
+    start = 0
+    for chunk in chunks:
+        edge_chunks.append(
+            _edge_arrays(graph, chunk, start, key_to_id, edge_attrs, edge_dtypes)
+        )
+        start += len(chunk)
+        if progress is not None:
+            progress(start, N)
+    (
+        src_indices,
+        dst_indices,
+        edge_indices,
+        edge_keys,
+        edge_values,
+        edge_masks,
+    ) = _concat_edge_arrays(edge_chunks)
+    del edge_chunks
+    if edge_keys is not None and edge_keys == edge_indices.tolist():
+        edge_keys = None  # Prefer edge_indices
 
     node_values = {}
     node_masks = {}
@@ -474,6 +436,267 @@ def from_networkx(
     return rv
 
 
+def _edge_arrays(graph, adj, start, key_to_id, edge_attrs, edge_dtypes):
+    """Build the COO edge arrays on the GPU for the rows of ``adj``.
+
+    ``adj`` may be a chunk of the full adjacency, in which case ``start`` is the
+    node id of its first row. Returns ``(src_indices, dst_indices, edge_indices,
+    edge_keys, edge_values, edge_masks)``; ``edge_indices`` and ``edge_keys`` are
+    None for non-multigraphs.
+    """
+    is_dicts = None
+    dst_iter = concat(adj.values())
+    if key_to_id is not None:
+        dst_iter = map(key_to_id.__getitem__, dst_iter)
+    if graph.is_multigraph():
+        dst_indices = np.fromiter(dst_iter, index_dtype)
+        num_multiedges, is_dicts = _iterate_values(
+            None, adj, is_dicts, lambda it: np.fromiter(map(len, it), index_dtype)
+        )
+        # cp.repeat is slow to use here, so use numpy instead
+        dst_indices = cp.array(np.repeat(dst_indices, num_multiedges))
+        # Determine edge keys and edge ids for multigraphs
+        if is_dicts:
+            edge_keys = list(concat(concat(map(dict.values, adj.values()))))
+            it = concat(map(dict.values, adj.values()))
+        else:
+            edge_keys = list(concat(concat(x.values() for x in adj.values())))
+            it = concat(x.values() for x in adj.values())
+        edge_indices = cp.fromiter(concat(map(range, map(len, it))), index_dtype)
+    else:
+        dst_indices = cp.fromiter(dst_iter, index_dtype)
+        edge_indices = edge_keys = None
+
+    edge_values = {}
+    edge_masks = {}
+    if edge_attrs:
+        for edge_attr, edge_default in edge_attrs.items():
+            dtype = edge_dtypes.get(edge_attr)
+            if edge_default is None:
+                vals = []
+                append = vals.append
+                if graph.is_multigraph():
+                    iter_mask = (
+                        append(
+                            edgedata[edge_attr]
+                            if (present := edge_attr in edgedata)
+                            else False
+                        )
+                        or present
+                        for rowdata in adj.values()
+                        for multiedges in rowdata.values()
+                        for edgedata in multiedges.values()
+                    )
+                else:
+                    iter_mask = (
+                        append(
+                            edgedata[edge_attr]
+                            if (present := edge_attr in edgedata)
+                            else False
+                        )
+                        or present
+                        for rowdata in adj.values()
+                        for edgedata in rowdata.values()
+                    )
+                edge_masks[edge_attr] = cp.fromiter(iter_mask, bool)
+                edge_values[edge_attr] = cp.array(vals, dtype)
+                # if vals.ndim > 1: ...
+            elif edge_default is REQUIRED:
+                if dtype is None:
+
+                    def func(it, edge_attr=edge_attr):
+                        return cp.array(list(map(op.itemgetter(edge_attr), it)))
+
+                else:
+
+                    def func(it, edge_attr=edge_attr, dtype=dtype):
+                        return cp.fromiter(map(op.itemgetter(edge_attr), it), dtype)
+
+                edge_value, is_dicts = _iterate_values(graph, adj, is_dicts, func)
+                edge_values[edge_attr] = edge_value
+            else:
+                if graph.is_multigraph():
+                    iter_values = (
+                        edgedata.get(edge_attr, edge_default)
+                        for rowdata in adj.values()
+                        for multiedges in rowdata.values()
+                        for edgedata in multiedges.values()
+                    )
+                else:
+                    iter_values = (
+                        edgedata.get(edge_attr, edge_default)
+                        for rowdata in adj.values()
+                        for edgedata in rowdata.values()
+                    )
+                if dtype is None:
+                    edge_values[edge_attr] = cp.array(list(iter_values))
+                else:
+                    edge_values[edge_attr] = cp.fromiter(iter_values, dtype)
+            # if vals.ndim > 1: ...
+
+    # cp.repeat is slow to use here, so use numpy instead
+    src_indices = np.repeat(
+        np.arange(start, start + len(adj), dtype=index_dtype),
+        np.fromiter(map(len, adj.values()), index_dtype),
+    )
+    if graph.is_multigraph():
+        src_indices = np.repeat(src_indices, num_multiedges)
+    src_indices = cp.array(src_indices)
+    return src_indices, dst_indices, edge_indices, edge_keys, edge_values, edge_masks
+
+
+def _concat_edge_arrays(edge_chunks):
+    """Concatenate the results of ``_edge_arrays`` for chunks of the adjacency."""
+    if len(edge_chunks) == 1:
+        return edge_chunks[0]
+    src_chunks, dst_chunks, index_chunks, key_chunks, _, _ = zip(*edge_chunks)
+    src_indices = cp.concatenate(src_chunks)
+    dst_indices = cp.concatenate(dst_chunks)
+    if index_chunks[0] is None:
+        edge_indices = edge_keys = None
+    else:
+        edge_indices = cp.concatenate(index_chunks)
+        edge_keys = list(concat(key_chunks))
+    # Chunks without edges may infer a different dtype for values, so skip them
+    nonempty = [chunk for chunk in edge_chunks if chunk[1].size > 0]
+    if not nonempty:
+        nonempty = edge_chunks[:1]
+    edge_values = {
+        key: cp.concatenate([chunk[4][key] for chunk in nonempty])
+        for key in nonempty[0][4]
+    }
+    edge_masks = {
+        key: cp.concatenate([chunk[5][key] for chunk in nonempty])
+        for key in nonempty[0][5]
+    }
+    return src_indices, dst_indices, edge_indices, edge_keys, edge_values, edge_masks
+
+
+def _conversion_cache(graph: nx.Graph) -> dict | None:
+    """Get the networkx dispatcher's cache of conversions of graph to nx-cugraph.
+
+    Returns None if conversions should not be cached: if caching is disabled with
+    ``nx.config.cache_converted_graphs``, if the networkx version isn't known to
+    cache conversions the same way, or if graph is a view (whose cache is not
+    cleared when the underlying graph is mutated).
+    """
+    config = getattr(nx, "config", None)
+    if (
+        not _shares_dispatcher_cache
+        or config is None
+        or not getattr(config, "cache_converted_graphs", False)
+        or graph.__class__ not in {nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph}
+        or hasattr(graph, "_graph")  # a view of another graph
+    ):
+        return None
+    cache = getattr(graph, "__networkx_cache__", None)
+    if cache is None:
+        return None
+    return cache.setdefault("backends", {}).setdefault(_backend_name, {})
+
+
+def _conversion_cache_key(
+    edge_attrs, node_attrs, preserve_edge_attrs, preserve_node_attrs
+):
+    """Return the key of a conversion in the networkx dispatcher's cache, or None.
+
+    Edge and node attributes are frozensets of ``(attr, default)`` items, or True
+    if all attributes are preserved, or False if there are none.
+    """
+    if edge_attrs is not None and not isinstance(edge_attrs, Mapping):
+        edge_attrs = {edge_attrs: 1}
+    if node_attrs is not None and not isinstance(node_attrs, Mapping):
+        node_attrs = {node_attrs: None}
+    try:
+        return (
+            _attrs_cache_key(edge_attrs, preserve_edge_attrs),
+            _attrs_cache_key(node_attrs, preserve_node_attrs),
+        )
+    except TypeError:
+        # Unhashable default values
+        return None
+
+
+def _attrs_cache_key(attrs, preserve_attrs):
+    if preserve_attrs:
+        return True
+    if attrs is None:
+        return False
+    return frozenset(attrs.items())
+
+
+def _get_from_conversion_cache(cache: dict, key: tuple) -> nxcg.Graph | None:
+    """Return a cached graph with the attributes of key, or None.
+
+    Graphs that preserved all edge or node attributes have the attributes of key.
+    """
+    edge_key, node_key = key
+    for compat_key in itertools.product(
+        (edge_key, True) if edge_key is not True else (True,),
+        (node_key, True) if node_key is not True else (True,),
+    ):
+        if isinstance(rv := cache.get(compat_key), nxcg.Graph):
+            return rv
+    return None
+
+
+def _from_networkx_cached(
+    graph: nx.Graph,
+    edge_attrs: AttrKey | dict[AttrKey, EdgeValue | None] | None = None,
+    edge_dtypes: Dtype | dict[AttrKey, Dtype | None] | None = None,
+    *,
+    node_attrs: AttrKey | dict[AttrKey, NodeValue | None] | None = None,
+    as_directed: bool = False,
+) -> nxcg.Graph:
+    """Like ``from_networkx``, but reuse conversions cached on the networkx graph.
+
+    Conversions are shared with the networkx dispatcher: they are looked up in and
+    saved to ``graph.__networkx_cache__["backends"]["cugraph"]`` with the same keys,
+    so calling nx-cugraph functions directly with networkx graphs reuses graphs
+    converted by dispatched calls and vice versa. Networkx clears the cache when
+    the graph is mutated through its methods, and ``nx.config.cache_converted_graphs
+    = False`` disables caching.
+
+    The dispatcher doesn't cache by dtype or directedness, so conversions with
+    dtypes, or to a directed graph from an undirected graph, are not cached.
+    """
+    if (
+        edge_dtypes is None
+        and (not as_directed or graph.is_directed())
+        and (cache := _conversion_cache(graph)) is not None
+        and (key := _conversion_cache_key(edge_attrs, node_attrs, False, False))
+        is not None
+    ):
+        rv = _get_from_conversion_cache(cache, key)
+        if rv is None:
+            rv = cache[key] = from_networkx(graph, edge_attrs, node_attrs=node_attrs)
+        return rv
+    return from_networkx(
+        graph, edge_attrs, edge_dtypes, node_attrs=node_attrs, as_directed=as_directed
+    )
+
+
+def _get_cached_conversion(
+    graph: nx.Graph,
+    edge_attrs: AttrKey | dict[AttrKey, EdgeValue | None] | None = None,
+    *,
+    node_attrs: AttrKey | dict[AttrKey, NodeValue | None] | None = None,
+    preserve_edge_attrs: bool = False,
+    preserve_node_attrs: bool = False,
+) -> nxcg.Graph | None:
+    """Get a cached conversion of graph that the networkx dispatcher would use.
+
+    Returns None if no compatible conversion is cached for these attributes.
+    """
+    if (cache := _conversion_cache(graph)) is None or (
+        key := _conversion_cache_key(
+            edge_attrs, node_attrs, preserve_edge_attrs, preserve_node_attrs
+        )
+    ) is None:
+        return None
+    return _get_from_conversion_cache(cache, key)
+
+
 def _iter_attr_dicts(
     values: dict[AttrKey, any_ndarray[EdgeValue | NodeValue]],
     masks: dict[AttrKey, any_ndarray[bool]],
@@ -502,7 +725,9 @@ def _iter_attr_dicts(
     return full_dicts
 
 
-def to_networkx(G: nxcg.Graph, *, sort_edges: bool = False) -> nx.Graph:
+def to_networkx(
+    G: nxcg.Graph, *, sort_edges: bool = False, lazy: bool = False
+) -> nx.Graph:
     """Convert a nx_cugraph graph to networkx graph.
 
     All edge and node attributes and ``G.graph`` properties are converted.
@@ -515,6 +740,11 @@ def to_networkx(G: nxcg.Graph, *, sort_edges: bool = False) -> nx.Graph:
         before converting. This can be useful to convert to networkx graphs
         that iterate over edges consistently since edges are stored in dicts
         in the order they were added.
+    lazy : bool, default False
+        Whether to only create the neighbor dict (and edge data dicts) of a node
+        when it is first accessed, which is much faster when only part of the
+        returned graph is used. The edges are copied to host memory up front.
+        This is ignored for multigraphs.
 
     Returns
     -------
@@ -555,12 +785,19 @@ def to_networkx(G: nxcg.Graph, *, sort_edges: bool = False) -> nx.Graph:
             edge_values = {k: v[mask] for k, v in edge_values.items()}
         if edge_masks:
             edge_masks = {k: v[mask] for k, v in edge_masks.items()}
+    if not G.is_multigraph():
+        _set_networkx_adjacency(
+            rv, G, src_indices, dst_indices, edge_values, edge_masks, lazy
+        )
+        rv.graph.update(G.graph)
+        return rv
+
     src_indices = src_iter = src_indices.tolist()
     dst_indices = dst_iter = dst_indices.tolist()
     if id_to_key is not None:
         src_iter = map(id_to_key.__getitem__, src_indices)
         dst_iter = map(id_to_key.__getitem__, dst_indices)
-    if G.is_multigraph() and (G.edge_keys is not None or G.edge_indices is not None):
+    if G.edge_keys is not None or G.edge_indices is not None:
         if G.edge_keys is not None:
             if not G.is_directed():
                 edge_keys = [k for k, m in zip(G.edge_keys, mask.tolist()) if m]
@@ -585,6 +822,230 @@ def to_networkx(G: nxcg.Graph, *, sort_edges: bool = False) -> nx.Graph:
     return rv
 
 
+def _set_networkx_adjacency(
+    rv: nx.Graph,
+    G: nxcg.Graph,
+    src_indices: cp.ndarray[IndexValue],
+    dst_indices: cp.ndarray[IndexValue],
+    edge_values: dict[AttrKey, cp.ndarray[EdgeValue]],
+    edge_masks: dict[AttrKey, cp.ndarray[bool]],
+    lazy: bool,
+):
+    """Set the adjacency of networkx graph ``rv``, which has all nodes of ``G``.
+
+    Rather than adding edges one at a time with ``add_edges_from``, edges are
+    grouped by source node on the GPU and each neighbor dict is created at once.
+    Each edge has one data dict, which is shared by both of its entries in
+    the adjacency (``_adj[u][v]`` and ``_adj[v][u]`` if undirected, or
+    ``_succ[u][v]`` and ``_pred[v][u]`` if directed), as networkx does.
+    Neighbors are in the same order as if edges were added in edge order.
+    """
+    N = len(G)
+    num_edges = src_indices.size
+    if num_edges == 0:
+        return
+    edge_ids = cp.arange(num_edges, dtype=index_dtype)
+    if G.is_directed():
+        rows = {"_succ": (src_indices, dst_indices, edge_ids)}
+        rows["_pred"] = (dst_indices, src_indices, edge_ids)
+    else:
+        # Add both (u, v) and (v, u) for each edge, but only once for self-loops
+        keep = cp.ones(2 * num_edges, dtype=bool)
+        keep[1::2] = src_indices != dst_indices
+        rows = {
+            "_adj": (
+                cp.stack([src_indices, dst_indices], axis=1).ravel()[keep],
+                cp.stack([dst_indices, src_indices], axis=1).ravel()[keep],
+                cp.repeat(edge_ids, 2)[keep],
+            )
+        }
+
+    id_to_key = G.id_to_key
+    if lazy:
+        get_edge_dict = _lazy_edge_dicts(num_edges, edge_values, edge_masks)
+        if id_to_key is None:
+            key_to_id = None
+        else:
+            key_to_id = G.key_to_id
+        for name, (row_ids, col_ids, row_edge_ids) in rows.items():
+            offsets, cols, eids = _group_by_row(N, row_ids, col_ids, row_edge_ids)
+            if id_to_key is not None:
+                cols = G._get_id_to_key_array()[cols].tolist()
+            adj = _LazyAdjacency(
+                rv._node,
+                key_to_id,
+                offsets.tolist(),
+                cols,
+                eids,
+                get_edge_dict,
+            )
+            setattr(rv, name, adj)
+        if G.is_directed():
+            # Also ``_adj``, which networkx expects to be the same as ``_succ``
+            rv._adj = rv._succ
+        return
+
+    if edge_values:
+        edge_dicts = list(_iter_attr_dicts(edge_values, edge_masks))
+    else:
+        edge_dicts = [{} for _ in range(num_edges)]
+    node_keys = range(N) if id_to_key is None else id_to_key
+    for name, (row_ids, col_ids, row_edge_ids) in rows.items():
+        offsets, cols, eids = _group_by_row(N, row_ids, col_ids, row_edge_ids)
+        if id_to_key is not None:
+            cols = G._get_id_to_key_array()[cols].tolist()
+        dicts = list(map(edge_dicts.__getitem__, eids))
+        adj = getattr(rv, name)
+        offsets = offsets.tolist()
+        for key, start, end in zip(node_keys, offsets[:-1], offsets[1:]):
+            if start != end:
+                adj[key].update(zip(cols[start:end], dicts[start:end]))
+
+
+def _group_by_row(
+    N: int,
+    row_ids: cp.ndarray[IndexValue],
+    col_ids: cp.ndarray[IndexValue],
+    edge_ids: cp.ndarray[IndexValue],
+) -> tuple[np.ndarray[int], list[int], list[int]]:
+    """Sort edges by (row, edge id) and return row offsets, cols, and edge ids.
+
+    Returned cols and edge ids are lists (on host), and ``offsets[i]`` to
+    ``offsets[i + 1]`` are the positions of the edges of row ``i``.
+    """
+    order = cp.lexsort(cp.stack([edge_ids, row_ids]))
+    offsets = np.zeros(N + 1, dtype=np.int64)
+    np.cumsum(cp.bincount(row_ids, minlength=N).get(), out=offsets[1:])
+    return offsets, col_ids[order].tolist(), edge_ids[order].tolist()
+
+
+def _lazy_edge_dicts(
+    num_edges: int,
+    edge_values: dict[AttrKey, cp.ndarray[EdgeValue]],
+    edge_masks: dict[AttrKey, cp.ndarray[bool]],
+):
+    """Return a function that returns the data dict of an edge id.
+
+    Each dict is created once, when first requested.
+    """
+    edge_dicts = [None] * num_edges
+    full_values = {
+        k: cp.asnumpy(v) for k, v in edge_values.items() if k not in edge_masks
+    }
+    partial_values = {
+        k: (cp.asnumpy(v), cp.asnumpy(edge_masks[k]))
+        for k, v in edge_values.items()
+        if k in edge_masks
+    }
+
+    def get_edge_dict(edge_id):
+        rv = edge_dicts[edge_id]
+        if rv is None:
+            rv = {k: v[edge_id].item() for k, v in full_values.items()}
+            for k, (v, m) in partial_values.items():
+                if m[edge_id]:
+                    rv[k] = v[edge_id].item()
+            edge_dicts[edge_id] = rv
+        return rv
+
+    return get_edge_dict
+
+
+_UNBUILT = object()
+
+
+class _LazyAdjacency(dict):
+    """Dict of node to neighbor dict that creates each neighbor dict when accessed.
+
+    Used as the adjacency (``_adj``, ``_succ``, or ``_pred``) of a networkx graph
+    returned by ``to_networkx(G, lazy=True)``.
+
+    Neighbor dicts are only created by item access; methods that return all
+    values (``values``, ``items``, ``copy``, etc.) first create all of them.
+    """
+
+    def __init__(self, nodes, key_to_id, offsets, cols, edge_ids, get_edge_dict):
+        super().__init__(dict.fromkeys(nodes, _UNBUILT))
+        self._key_to_id = key_to_id
+        self._offsets = offsets
+        self._cols = cols
+        self._edge_ids = edge_ids
+        self._get_edge_dict = get_edge_dict
+        self._num_unbuilt = len(self)
+
+    def __iter__(self):
+        # Overriding ``__iter__`` stops CPython from copying the stored values
+        # directly in ``dict(adj)``, ``{**adj}``, and ``d.update(adj)``; they
+        # use ``keys`` and ``__getitem__`` instead, which create neighbor dicts.
+        return dict.__iter__(self)
+
+    def __getitem__(self, key):
+        rv = dict.__getitem__(self, key)
+        if rv is _UNBUILT:
+            node_id = key if self._key_to_id is None else self._key_to_id[key]
+            start = self._offsets[node_id]
+            end = self._offsets[node_id + 1]
+            rv = dict(
+                zip(
+                    self._cols[start:end],
+                    map(self._get_edge_dict, self._edge_ids[start:end]),
+                )
+            )
+            dict.__setitem__(self, key, rv)
+            self._num_unbuilt -= 1
+        return rv
+
+    def _build_all(self):
+        if self._num_unbuilt:
+            for key in dict.keys(self):
+                self[key]
+        return self
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key, *args):
+        if key in self:
+            self[key]
+        return dict.pop(self, key, *args)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        return dict.setdefault(self, key, default)
+
+    def values(self):
+        return dict.values(self._build_all())
+
+    def items(self):
+        return dict.items(self._build_all())
+
+    def popitem(self):
+        return dict.popitem(self._build_all())
+
+    def copy(self):
+        return dict(self.items())
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return self.copy() | other
+
+    def __eq__(self, other):
+        return dict.__eq__(self._build_all(), other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
 def _to_graph(
     G,
     edge_attr: AttrKey | None = None,
@@ -599,7 +1060,7 @@ def _to_graph(
     if isinstance(G, nxcg.Graph):
         return G
     if isinstance(G, nx.Graph):
-        return from_networkx(
+        return _from_networkx_cached(
             G, {edge_attr: edge_default} if edge_attr is not None else None, edge_dtype
         )
     # TODO: handle cugraph.Graph
@@ -622,7 +1083,7 @@ def _to_directed_graph(
     if isinstance(G, nxcg.Graph):
         return G.to_directed()
     if isinstance(G, nx.Graph):
-        return from_networkx(
+        return _from_networkx_cached(
             G,
             {edge_attr: edge_default} if edge_attr is not None else None,
             edge_dtype,
@@ -648,7 +1109,7 @@ def _to_undirected_graph(
             raise ValueError("Only undirected graphs supported; got a directed graph")
         return G
     if isinstance(G, nx.Graph):
-        return from_networkx(
+        return _from_networkx_cached(
             G, {edge_attr: edge_default} if edge_attr is not None else None, edge_dtype
         )
     # TODO: handle cugraph.Graph
@@ -336,6 +336,16 @@ class BackendInterface:
 
     @classmethod
     def should_run(cls, name, args, kwargs):
-        """Should this backend run the specified algorithms with the given arguments?"""
+        """Should this backend run the specified algorithms with the given arguments?
+
+        Algorithms may decide for themselves with ``should_run``; otherwise, we use
+        a cost model based on the size of the graph (see ``_should_run_for_size``).
+        """
         # TODO: drop hasattr when networkx 3.0 support is dropped
-        return hasattr(cls, name) and getattr(cls, name).should_run(*args, **kwargs)
+        if not hasattr(cls, name):
+            return False
+        func = getattr(cls, name)
+        rv = func.should_run(*args, **kwargs)
+        if rv is not True:
+            return rv
+        return func._should_run_for_size(args, kwargs)
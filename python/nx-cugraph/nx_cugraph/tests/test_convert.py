@@ -1,4 +1,4 @@
-# Copyright (c) 2023, NVIDIA CORPORATION.
+# Copyright (c) 2023-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -224,3 +224,143 @@ def test_multigraph(graph_class):
     H = nxcg.to_networkx(Gcg)
     assert type(G) is type(H)
     assert nx.utils.graphs_equal(G, H)
+
+
+@pytest.mark.parametrize("graph_class", [nx.Graph, nx.DiGraph])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_to_networkx_adjacency(graph_class, lazy):
+    G = graph_class()
+    G.add_edge("c", "a", x=1)
+    G.add_edge("a", "b", x=2, y=3.5)
+    G.add_edge("b", "b", x=4)
+    G.add_edge("c", "b", x=5)
+    G.add_node("d")
+    Gcg = nxcg.from_networkx(G, preserve_all_attrs=True)
+    H = nxcg.to_networkx(Gcg, lazy=lazy)
+    assert type(G) is type(H)
+    assert nx.utils.graphs_equal(G, H)
+    assert list(H) == list(Gcg.id_to_key)
+    # Both adjacency entries of an edge share one data dict
+    if G.is_directed():
+        assert H._succ["a"]["b"] is H._pred["b"]["a"]
+    else:
+        assert H._adj["a"]["b"] is H._adj["b"]["a"]
+    # Copies of the adjacency have neighbor dicts, even if not yet accessed
+    H2 = nxcg.to_networkx(Gcg, lazy=lazy)
+    expected = {key: dict(val) for key, val in G._adj.items()}
+    assert dict(H2._adj) == expected
+    assert {**nxcg.to_networkx(Gcg, lazy=lazy)._adj} == expected
+    adj = {}
+    adj.update(nxcg.to_networkx(Gcg, lazy=lazy)._adj)
+    assert adj == expected
+    assert nxcg.to_networkx(Gcg, lazy=lazy)._adj | {} == expected
+    H["a"]["b"]["x"] = 10
+    assert H.edges["a", "b"]["x"] == 10
+    assert G.edges["a", "b"]["x"] == 2
+    H.add_edge("d", "a")
+    H.remove_node("b")
+    assert "b" not in H
+    assert H.number_of_edges() == 2
+    assert H.has_edge("c", "a")
+    assert H.has_edge("d", "a")
+
+
+@pytest.mark.parametrize(
+    "graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+def test_from_networkx_chunked(graph_class, chunksize):
+    G = graph_class()
+    G.add_edge("a", "b", x=1, y=0.5)
+    G.add_edge("b", "c", x=2)
+    G.add_edge("c", "d", x=3, y=1.5)
+    G.add_edge("d", "a", x=4)
+    G.add_node("e")  # isolated; its chunk has no edges
+    G.add_edge("f", "a", x=5)
+    if G.is_multigraph():
+        G.add_edge("a", "b", x=6)
+    progress = []
+    Gcg = nxcg.from_networkx(
+        G,
+        preserve_all_attrs=True,
+        chunksize=chunksize,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    expected = nxcg.from_networkx(G, preserve_all_attrs=True)
+    N = len(G)
+    expected_progress = [(done, N) for done in range(chunksize, N, chunksize)]
+    assert progress == [*expected_progress, (N, N)]
+    assert Gcg.src_indices.tolist() == expected.src_indices.tolist()
+    assert Gcg.dst_indices.tolist() == expected.dst_indices.tolist()
+    assert Gcg.edge_values.keys() == {"x", "y"}
+    for attr in ["edge_values", "edge_masks"]:
+        vals, expected_vals = getattr(Gcg, attr), getattr(expected, attr)
+        assert vals.keys() == expected_vals.keys()
+        for key, val in vals.items():
+            assert val.dtype == expected_vals[key].dtype
+            assert val.tolist() == expected_vals[key].tolist()
+    if G.is_multigraph():
+        assert Gcg.edge_indices.tolist() == expected.edge_indices.tolist()
+        assert Gcg.edge_keys == expected.edge_keys
+    assert nx.utils.graphs_equal(G, nxcg.to_networkx(Gcg))
+    with pytest.raises(ValueError, match="chunksize"):
+        nxcg.from_networkx(G, chunksize=0)
+
+
+@pytest.mark.skipif(
+    not nxcg.convert._shares_dispatcher_cache,
+    reason="nx-cugraph only shares the conversion cache with networkx 3.4 to 3.6",
+)
+@pytest.mark.parametrize("graph_class", [nx.Graph, nx.MultiDiGraph])
+def test_to_graph_conversion_cache(graph_class):
+    from networkx.utils.backends import _get_cache_key
+
+    from nx_cugraph.convert import _conversion_cache_key, _to_directed_graph, _to_graph
+
+    # Cache keys must be the same as the keys of the networkx dispatcher
+    for edge_attrs, node_attrs, preserve_edge_attrs in [
+        ({"x": 0}, None, False),
+        (None, {"y": None}, False),
+        (None, None, True),
+    ]:
+        assert _conversion_cache_key(
+            edge_attrs, node_attrs, preserve_edge_attrs, False
+        ) == _get_cache_key(
+            edge_attrs=edge_attrs,
+            node_attrs=node_attrs,
+            preserve_edge_attrs=preserve_edge_attrs,
+            preserve_node_attrs=False,
+            preserve_graph_attrs=False,
+        )
+
+    G = graph_class()
+    G.add_edge(0, 1, x=1, y=10)
+    G.add_edge(1, 2, x=2)
+    # Conversions are saved in the cache of the networkx dispatcher
+    Gcg = _to_graph(G, "x", 0)
+    assert _to_graph(G, "x", 0) is Gcg
+    assert Gcg in G.__networkx_cache__["backends"]["cugraph"].values()
+    # The dispatcher does the caching when it converts graphs
+    assert interface.BackendInterface.convert_from_nx(G, edge_attrs={"x": 0}) is not Gcg
+    # Conversions with different defaults, dtypes, or directedness are not reused
+    assert _to_graph(G, "x", 1) is not Gcg
+    assert _to_graph(G, "x", 0, "float32") is not _to_graph(G, "x", 0, "float32")
+    if not G.is_directed():
+        H = _to_directed_graph(G, "x", 0)
+        assert H.is_directed()
+        assert _to_directed_graph(G, "x", 0) is not H
+        assert _to_graph(G, "x", 0) is Gcg
+    # Mutating the graph invalidates the cache
+    G.add_edge(2, 3, x=3)
+    H = _to_graph(G, "x", 0)
+    assert H is not Gcg
+    assert H.number_of_edges() == G.number_of_edges()
+    # Caching can be disabled
+    cache_converted_graphs = nx.config.cache_converted_graphs
+    nx.config.cache_converted_graphs = False
+    try:
+        G.__networkx_cache__.clear()
+        assert _to_graph(G, "x", 0) is not _to_graph(G, "x", 0)
+        assert not G.__networkx_cache__
+    finally:
+        nx.config.cache_converted_graphs = cache_converted_graphs
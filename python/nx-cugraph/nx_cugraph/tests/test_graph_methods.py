@@ -10,7 +10,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import cupy as cp
 import networkx as nx
+import numpy as np
 import pytest
 
 import nx_cugraph as nxcg
@@ -65,3 +67,101 @@ def test_multidigraph_to_undirected():
     Gcg = nxcg.MultiDiGraph(Gnx)
     with pytest.raises(NotImplementedError):
         Gcg.to_undirected()
+
+
+def test_plc_graph_cache():
+    G = nxcg.from_networkx(nx.karate_club_graph(), preserve_edge_attrs=True)
+    assert G.plc_cache_info["hits"] == G.plc_cache_info["misses"] == 0
+    plc_graph = G._get_plc_graph("weight", 1, "float32")
+    assert G._get_plc_graph("weight", 1, "float32") is plc_graph
+    assert G._get_plc_graph("weight", 1, "float64") is not plc_graph
+    info = G.plc_cache_info
+    assert info["hits"] == 1
+    assert info["misses"] == 2
+    assert info["currsize"] == 2
+    assert info["nbytes"] > 0
+    # Results using the cache should match results without it
+    nx.pagerank(G)
+    result = nx.pagerank(G)
+    assert G.plc_cache_info["hits"] == 2
+    G.clear_edges()
+    assert G.plc_cache_info["currsize"] == G.plc_cache_info["nbytes"] == 0
+    G = nxcg.from_networkx(nx.karate_club_graph(), preserve_edge_attrs=True)
+    G.plc_cache_max_bytes = 0
+    assert nx.pagerank(G) == result
+    assert G.plc_cache_info["currsize"] == 0
+
+
+def test_plc_graph_cache_eviction():
+    G = nxcg.from_networkx(nx.karate_club_graph(), preserve_edge_attrs=True)
+    G._get_plc_graph()
+    G.plc_cache_max_bytes = G.plc_cache_info["nbytes"]
+    G._get_plc_graph(store_transposed=True)
+    assert G.plc_cache_info["currsize"] == 1
+    G._get_plc_graph()
+    assert G.plc_cache_info["misses"] == 3
+    G.clear()
+    assert G.plc_cache_info["currsize"] == 0
+
+
+@pytest.mark.parametrize(
+    ("keys", "key_type"),
+    [
+        ([10 * i for i in range(2000)], int),
+        ([f"node{i}" for i in range(2000)], str),
+        ([str(10 * i) for i in range(2000)], str),
+        ([f"node{i}" + "\x00" * (i % 2) for i in range(2000)], str),
+        ([(i, "x") for i in range(2000)], None),
+        ([f"node{i}" if i % 2 else i for i in range(2000)], None),
+    ],
+)
+def test_node_key_conversions(keys, key_type):
+    keys = keys[::-1]  # Don't be sorted
+    G = nx.Graph()
+    G.add_nodes_from(keys)
+    G.add_edges_from(zip(keys[:-1], keys[1:]))
+    Gcg = nxcg.from_networkx(G)
+    assert Gcg._node_keys.key_type is key_type
+    assert Gcg._get_id_to_key_array().dtype == (np.int64 if key_type is int else object)
+    # Only keys of other types are also stored in a dict
+    assert isinstance(Gcg.key_to_id, dict) == (key_type is None)
+    assert Gcg.id_to_key == list(G)
+    assert Gcg.id_to_key[-1] == keys[-1]
+    assert isinstance(Gcg.id_to_key[0], type(keys[0]))
+    assert list(Gcg) == list(G)
+    assert Gcg.key_to_id == dict(zip(keys, range(len(keys))))
+    assert keys[-1] in Gcg
+    assert "missing" not in Gcg
+    assert [] not in Gcg
+    # Copies share node keys
+    assert Gcg.copy()._node_keys is Gcg._node_keys
+    assert Gcg.to_directed()._node_keys is Gcg._node_keys
+    node_ids = cp.arange(len(keys) - 1, -1, -1, dtype=Gcg.src_indices.dtype)
+    assert Gcg._nodearray_to_list(node_ids) == keys[::-1]
+    assert Gcg._nodearray_to_set(node_ids[:10]) == set(keys[-10:])
+    values = cp.arange(len(keys))
+    assert Gcg._nodearray_to_dict(values) == dict(zip(keys, range(len(keys))))
+    assert Gcg._nodearrays_to_dict(node_ids[:3], values[:3]) == dict(
+        zip(keys[:-4:-1], range(3))
+    )
+    assert Gcg._edgearrays_to_dict(node_ids[:1], node_ids[1:2], values[:1]) == {
+        (keys[-1], keys[-2]): 0
+    }
+    # Vectorized lookups of many int or str keys
+    assert Gcg._list_to_nodearray(keys).tolist() == list(range(len(keys)))
+    with pytest.raises(KeyError):
+        Gcg._list_to_nodearray([*keys, "missing"])
+    if key_type is str:
+        # Nodes of other types don't match
+        with pytest.raises(KeyError):
+            Gcg._list_to_nodearray([*keys[:-1], 0])
+        with pytest.raises(KeyError):
+            Gcg._list_to_nodearray([*keys[:-1], keys[-1] + "\x00"])
+    elif key_type is int:
+        # numpy ints are looked up one at a time like with a dict
+        nodes = [*keys[:-1], np.int64(keys[-1])]
+        assert Gcg._list_to_nodearray(nodes).tolist() == list(range(len(keys)))
+        with pytest.raises(KeyError):
+            Gcg._list_to_nodearray([*keys[:-1], str(keys[-1])])
+        with pytest.raises(KeyError):
+            Gcg._list_to_nodearray([*keys[:-1], 2**64])
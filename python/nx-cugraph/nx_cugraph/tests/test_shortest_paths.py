@@ -0,0 +1,109 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import networkx as nx
+import pytest
+
+import nx_cugraph as nxcg
+
+
+def _assert_valid_paths(Gnx, paths, lengths, weight=None):
+    for source, source_paths in paths.items():
+        assert source_paths.keys() == lengths[source].keys()
+        for target, path in source_paths.items():
+            assert path[0] == source
+            assert path[-1] == target
+            if weight is None:
+                assert len(path) - 1 == lengths[source][target]
+            else:
+                assert nx.path_weight(Gnx, path, weight) == pytest.approx(
+                    lengths[source][target]
+                )
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 5, 1000])
+@pytest.mark.parametrize("cutoff", [None, 0, 2])
+def test_all_pairs_shortest_path_batched(batch_size, cutoff):
+    Gnx = nx.les_miserables_graph()
+    Gcg = nxcg.from_networkx(Gnx)
+    expected = dict(nx.all_pairs_shortest_path_length(Gnx, cutoff=cutoff))
+    lengths = nxcg.all_pairs_shortest_path_length(
+        Gcg, cutoff=cutoff, batch_size=batch_size
+    )
+    assert not isinstance(lengths, dict)  # Results are yielded lazily
+    lengths = dict(lengths)
+    assert lengths == expected
+    paths = dict(
+        nxcg.all_pairs_shortest_path(Gcg, cutoff=cutoff, batch_size=batch_size)
+    )
+    _assert_valid_paths(Gnx, paths, lengths)
+
+
+@pytest.mark.parametrize("memory_budget", [1, 500, 10_000])
+def test_all_pairs_shortest_path_memory_budget(memory_budget):
+    # Small budgets also split the frontier expansion of each step into slices
+    Gnx = nx.les_miserables_graph()
+    Gcg = nxcg.from_networkx(Gnx)
+    expected = dict(nx.all_pairs_shortest_path_length(Gnx))
+    lengths = dict(
+        nxcg.all_pairs_shortest_path_length(Gcg, memory_budget=memory_budget)
+    )
+    assert lengths == expected
+    paths = dict(nxcg.all_pairs_shortest_path(Gcg, memory_budget=memory_budget))
+    _assert_valid_paths(Gnx, paths, lengths)
+
+
+@pytest.mark.parametrize("memory_budget", [None, 1, 10_000])
+def test_all_pairs_bellman_ford_batched(memory_budget):
+    Gnx = nx.les_miserables_graph().to_directed()
+    Gcg = nxcg.from_networkx(Gnx, preserve_edge_attrs=True)
+    expected = dict(nx.all_pairs_bellman_ford_path_length(Gnx))
+    lengths = dict(
+        nxcg.all_pairs_bellman_ford_path_length(Gcg, memory_budget=memory_budget)
+    )
+    assert lengths.keys() == expected.keys()
+    for source, source_lengths in expected.items():
+        assert lengths[source] == pytest.approx(source_lengths)
+    paths = dict(nxcg.all_pairs_bellman_ford_path(Gcg, memory_budget=memory_budget))
+    _assert_valid_paths(Gnx, paths, lengths, weight="weight")
+
+
+def test_all_pairs_bad_batch_size():
+    G = nxcg.from_networkx(nx.path_graph(3))
+    with pytest.raises(ValueError, match="batch_size"):
+        dict(nxcg.all_pairs_shortest_path_length(G, batch_size=0))
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 7])
+def test_bidirectional_shortest_paths(batch_size):
+    Gnx = nx.gn_graph(50, seed=42)
+    Gnx.add_node("isolate")
+    Gcg = nxcg.from_networkx(Gnx)
+    pairs = [(u, v) for u in [0, 3, 10, "isolate"] for v in [0, 5, 49, "isolate"]]
+    paths = nxcg.bidirectional_shortest_paths(Gcg, pairs, batch_size=batch_size)
+    assert len(paths) == len(pairs)
+    for (source, target), path in zip(pairs, paths):
+        if not nx.has_path(Gnx, source, target):
+            assert path is None
+            with pytest.raises(nx.NetworkXNoPath):
+                nxcg.bidirectional_shortest_path(Gcg, source, target)
+            continue
+        expected = nx.bidirectional_shortest_path(Gnx, source, target)
+        assert len(path) == len(expected)
+        assert path[0] == source
+        assert path[-1] == target
+        assert nx.is_path(Gnx, path)
+        path = nxcg.bidirectional_shortest_path(Gcg, source, target)
+        assert len(path) == len(expected)
+        assert nx.is_path(Gnx, path)
+    with pytest.raises(nx.NodeNotFound):
+        nxcg.bidirectional_shortest_paths(Gcg, [(0, "missing")])
@@ -1,4 +1,4 @@
-# Copyright (c) 2023, NVIDIA CORPORATION.
+# Copyright (c) 2023-2024, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -10,9 +10,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import networkx as nx
 import numpy as np
 import pytest
 
+import nx_cugraph as nxcg
+from nx_cugraph.interface import BackendInterface
 from nx_cugraph.utils import _get_int_dtype
 
 
@@ -85,3 +88,32 @@ def test_get_int_dtype():
         _get_int_dtype(7, signed=True, unsigned=True)
     assert _get_int_dtype(7, signed=True, unsigned=False) == np.int8
     assert _get_int_dtype(7, signed=False, unsigned=True) == np.uint8
+
+
+def test_should_run_for_size():
+    func = BackendInterface.pagerank
+    orig_thresholds = func.should_run_thresholds
+    G = nx.path_graph(10)  # size is 10 nodes + 18 adjacency entries
+    try:
+        func.should_run_thresholds = (100, 20)
+        assert isinstance(BackendInterface.should_run("pagerank", (G,), {}), str)
+        assert BackendInterface.should_run("pagerank", (nx.path_graph(50),), {})
+        assert isinstance(BackendInterface.should_run("pagerank", (), {"G": G}), str)
+        if nxcg.convert._shares_dispatcher_cache:
+            # Lower threshold with a cached conversion that pagerank would use
+            nxcg.convert._to_graph(G, "other", 1)
+            assert isinstance(BackendInterface.should_run("pagerank", (G,), {}), str)
+            args = (G,), {"weight": "other"}
+            assert BackendInterface.should_run("pagerank", *args) is True
+            nxcg.convert._to_graph(G, "weight", 1)
+            assert BackendInterface.should_run("pagerank", (G,), {}) is True
+        func.should_run_thresholds = (None, None)
+        reason = BackendInterface.should_run("pagerank", (nx.path_graph(50),), {})
+        assert "any size" in reason
+        # Always run when the graph is already converted
+        Gcg = nxcg.from_networkx(G)
+        assert BackendInterface.should_run("pagerank", (Gcg,), {}) is True
+        func.should_run_thresholds = (0, 0)
+        assert BackendInterface.should_run("pagerank", (G,), {}) is True
+    finally:
+        func.should_run_thresholds = orig_thresholds
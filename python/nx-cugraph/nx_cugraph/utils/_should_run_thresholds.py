@@ -0,0 +1,38 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Graph sizes above which nx-cugraph is expected to be faster than networkx.
+
+The size of a graph is its number of nodes plus its number of adjacency entries
+(i.e., ``len(G) + sum(map(len, G.adj.values()))``). Each algorithm maps to
+``(uncached, cached)`` minimum sizes, where ``uncached`` includes the cost of
+converting the graph to nx-cugraph and ``cached`` is used when a conversion of
+the graph is already cached. ``None`` means nx-cugraph was never faster.
+
+The table is updated by benchmarking both backends on the current machine:
+
+$ python scripts/calibrate_should_run.py
+
+Running the script with ``--algorithms`` only updates the given algorithms.
+
+Algorithms not in the table use ``default_thresholds``. These are conservative
+estimates rather than measurements: below them, the fixed cost of converting the
+graph and launching GPU work is expected to outweigh running on the GPU.
+"""
+
+default_thresholds = (5_000, 500)
+
+# Entries between BEGIN and END are automatically generated
+thresholds = {
+    # BEGIN: thresholds
+    # END: thresholds
+}
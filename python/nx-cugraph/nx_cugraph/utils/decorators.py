@@ -13,6 +13,7 @@
 from __future__ import annotations
 
 from functools import partial, update_wrapper
+from inspect import signature
 from textwrap import dedent
 
 import networkx as nx
@@ -20,6 +21,8 @@ from networkx.utils.decorators import nodes_or_number, not_implemented_for
 
 from nx_cugraph.interface import BackendInterface
 
+from . import _should_run_thresholds
+
 try:
     from networkx.utils.backends import _registered_algorithms
 except ModuleNotFoundError:
@@ -44,6 +47,7 @@ class networkx_algorithm:
     version_added: str
     is_incomplete: bool
     is_different: bool
+    should_run_thresholds: tuple[int | None, int | None]
     _plc_names: set[str] | None
 
     def __new__(
@@ -109,6 +113,9 @@ class networkx_algorithm:
             instance.__doc__ = _registered_algorithms[instance.name].__doc__
         instance.can_run = _default_can_run
         instance.should_run = _default_should_run
+        instance.should_run_thresholds = _should_run_thresholds.thresholds.get(
+            instance.name, _should_run_thresholds.default_thresholds
+        )
         setattr(BackendInterface, instance.name, instance)
         # Set methods so they are in __dict__
         instance._can_run = instance._can_run
@@ -135,6 +142,71 @@ class networkx_algorithm:
             )
         self.should_run = func
 
+    def _should_run_for_size(self, args, kwargs):
+        """Whether nx-cugraph is expected to be faster than networkx for the graph.
+
+        This is a cost model that compares the size of the input networkx graph to
+        ``should_run_thresholds``. The size threshold is lower if a conversion of
+        the graph is cached, since then we only pay for running the algorithm.
+        Returns True or a string with the reason to not run.
+        """
+        G = args[0] if args else kwargs.get("G")
+        if not isinstance(G, nx.Graph):
+            # Already an nx-cugraph graph, or no graph input (such as generators)
+            return True
+        uncached, cached = self.should_run_thresholds
+        if uncached == cached:
+            is_cached = False  # No need to look in the cache
+        else:
+            is_cached = self._has_cached_conversion(G, args, kwargs)
+        if is_cached:
+            threshold = cached
+            reason = "even with a cached conversion"
+        else:
+            threshold = uncached
+            reason = "including conversion"
+        if threshold is None:
+            return f"networkx is faster for graphs of any size ({reason})."
+        if threshold <= 0:
+            return True
+        if G.__class__ in {nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph}:
+            # This is a NetworkX private attribute, but is much faster to use
+            adj = G._adj
+        else:
+            adj = G.adj
+        size = len(adj)
+        if size < threshold:
+            size += sum(map(len, adj.values()))
+        if size < threshold:
+            return (
+                f"networkx is faster for graphs of size {size} < {threshold} "
+                f"({reason})."
+            )
+        return True
+
+    def _has_cached_conversion(self, G, args, kwargs):
+        """Whether the networkx dispatcher would use a cached conversion of G.
+
+        The cached graph must have been converted with attributes compatible with
+        the attributes the dispatcher converts G with for these arguments.
+        """
+        from nx_cugraph.convert import _get_cached_conversion
+
+        attrs = _get_dispatched_attrs(self.name, args, kwargs)
+        if attrs is None:
+            return False
+        edge_attrs, node_attrs, preserve_edge_attrs, preserve_node_attrs = attrs
+        return (
+            _get_cached_conversion(
+                G,
+                edge_attrs,
+                node_attrs=node_attrs,
+                preserve_edge_attrs=preserve_edge_attrs,
+                preserve_node_attrs=preserve_node_attrs,
+            )
+            is not None
+        )
+
     def __call__(self, /, *args, **kwargs):
         return self.__wrapped__(*args, **kwargs)
 
@@ -150,5 +222,63 @@ def _default_should_run(*args, **kwargs):
     return True
 
 
+def _get_dispatched_attrs(name, args, kwargs):
+    """Get the attributes the networkx dispatcher converts graphs with for a call.
+
+    Returns ``(edge_attrs, node_attrs, preserve_edge_attrs, preserve_node_attrs)``
+    as given to ``convert_from_nx``, or None if they can't be determined simply
+    (such as per-graph attributes or attributes from a list argument).
+    """
+    dispatchable = _registered_algorithms.get(name)
+    if dispatchable is None or not hasattr(dispatchable, "preserve_edge_attrs"):
+        return None
+    try:
+        bound = signature(dispatchable).bind(*args, **kwargs)
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    arguments = bound.arguments
+    edges = _get_dispatched_attrs_of(
+        dispatchable.edge_attrs, dispatchable.preserve_edge_attrs, arguments, 1
+    )
+    nodes = _get_dispatched_attrs_of(
+        dispatchable.node_attrs, dispatchable.preserve_node_attrs, arguments, None
+    )
+    if edges is None or nodes is None:
+        return None
+    return edges[0], nodes[0], edges[1], nodes[1]
+
+
+def _get_dispatched_attrs_of(attrs, preserve, arguments, default):
+    """Resolve edge or node attributes like the networkx dispatcher.
+
+    Returns ``(attrs, preserve)`` or None if unknown.
+    """
+    if preserve is True:
+        return None, True
+    if preserve is not False:
+        # e.g. `preserve_edge_attrs="attr"` or per-graph attributes
+        return None
+    if attrs is None:
+        return None, False
+    if isinstance(attrs, str):
+        if attrs[0] == "[":
+            # e.g. `edge_attrs="[edge_attributes]"` (list of attributes)
+            return None
+        val = arguments.get(attrs)
+        if callable(val):
+            return None, True
+        if val is None:
+            return None, False
+        return {val: default}, False
+    if not isinstance(attrs, dict):
+        return None
+    return {
+        attr: arguments.get(val, default) if isinstance(val, str) else val
+        for key, val in attrs.items()
+        if (attr := arguments.get(key)) is not None
+    }, False
+
+
 def _restore_networkx_dispatched(name):
     return getattr(BackendInterface, name)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# Copyright (c) 2024, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Calibrate the graph sizes at which nx-cugraph becomes faster than networkx.
+
+Each algorithm that only requires a graph argument (or has arguments given in
+``EXTRA_ARGS``) is run with networkx and with nx-cugraph on random graphs of
+increasing size. nx-cugraph is timed both with and without a cached conversion
+of the input graph. The smallest size from which nx-cugraph is faster for all
+larger sizes is written to ``nx_cugraph/utils/_should_run_thresholds.py``.
+"""
+import argparse
+import inspect
+import time
+from pathlib import Path
+
+import networkx as nx
+
+from _nx_cugraph.core import dq_repr, get_functions, update_text
+
+# Required arguments other than the graph, given the graph
+EXTRA_ARGS = {
+    "ancestors": lambda G: (0,),
+    "bellman_ford_path_length": lambda G: (0, len(G) - 1),
+    "bfs_edges": lambda G: (0,),
+    "bfs_layers": lambda G: (0,),
+    "bfs_predecessors": lambda G: (0,),
+    "bfs_successors": lambda G: (0,),
+    "bfs_tree": lambda G: (0,),
+    "descendants": lambda G: (0,),
+    "ego_graph": lambda G: (0,),
+    "generic_bfs_edges": lambda G: (0,),
+    "k_truss": lambda G: (3,),
+    "node_connected_component": lambda G: (0,),
+    "single_source_bellman_ford_path_length": lambda G: (0,),
+    "single_source_shortest_path_length": lambda G: (0,),
+}
+
+
+def get_algorithms(names=None):
+    """Get the dispatchable algorithms that take a networkx graph to calibrate."""
+    functions = get_functions()
+    if names is not None:
+        functions = {name: functions[name] for name in names}
+    rv = {}
+    for name, func in functions.items():
+        params = list(inspect.signature(func).parameters.values())
+        if not params or params[0].name != "G":
+            # Generators and functions of multiple graphs
+            continue
+        required = [
+            p
+            for p in params[1:]
+            if p.default is inspect.Parameter.empty
+            and p.kind not in {p.VAR_POSITIONAL, p.VAR_KEYWORD}
+        ]
+        if required and name not in EXTRA_ARGS:
+            continue
+        rv[name] = func
+    return rv
+
+
+def make_graph(num_nodes, avg_degree, seed):
+    return nx.gnm_random_graph(num_nodes, num_nodes * avg_degree // 2, seed=seed)
+
+
+def get_graph_size(G):
+    return len(G) + sum(map(len, G._adj.values()))
+
+
+def time_call(func, repeat, before=None):
+    times = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def time_backends(name, G, repeat):
+    """Time ``name`` on G with networkx and nx-cugraph (uncached and cached).
+
+    Returns None if the algorithm can't be run on G.
+    """
+    args = (G, *EXTRA_ARGS.get(name, lambda G: ())(G))
+    dispatchable = nx.utils.backends._registered_algorithms[name]
+    orig_func = dispatchable.orig_func
+
+    def clear_cache():
+        # Networkx <3.3 doesn't cache conversions, so every call is uncached
+        if (cache := getattr(G, "__networkx_cache__", None)) is not None:
+            cache.clear()
+
+    try:
+        # Warm up both backends (and check the algorithm supports the graph)
+        orig_func(*args)
+        dispatchable(*args, backend="cugraph")
+    except (nx.NetworkXException, NotImplementedError, KeyError):
+        return None
+    nx_time = time_call(lambda: orig_func(*args), repeat)
+    cached_time = time_call(lambda: dispatchable(*args, backend="cugraph"), repeat)
+    uncached_time = time_call(
+        lambda: dispatchable(*args, backend="cugraph"), repeat, before=clear_cache
+    )
+    return nx_time, uncached_time, cached_time
+
+
+def find_threshold(sizes, nx_times, cg_times):
+    """Smallest size from which nx-cugraph is faster for all larger sizes."""
+    threshold = None
+    for size, nx_time, cg_time in zip(reversed(sizes), nx_times[::-1], cg_times[::-1]):
+        if cg_time > nx_time:
+            break
+        threshold = size
+    if threshold == sizes[0]:
+        return 0
+    return threshold
+
+
+def calibrate(algorithms, num_nodes_list, avg_degree, repeat, seed, verbose):
+    graphs = [make_graph(n, avg_degree, seed) for n in num_nodes_list]
+    sizes = [get_graph_size(G) for G in graphs]
+    thresholds = {}
+    for name in algorithms:
+        results = []
+        for G in graphs:
+            times = time_backends(name, G, repeat)
+            if times is None:
+                break
+            results.append(times)
+            if verbose:
+                print(
+                    f"{name}: size={get_graph_size(G)}, networkx={times[0]:.2e}s, "
+                    f"uncached={times[1]:.2e}s, cached={times[2]:.2e}s"
+                )
+        if len(results) != len(graphs):
+            if verbose:
+                print(f"{name}: skipped (unable to run on the calibration graphs)")
+            continue
+        nx_times, uncached_times, cached_times = zip(*results)
+        thresholds[name] = (
+            find_threshold(sizes, nx_times, uncached_times),
+            find_threshold(sizes, nx_times, cached_times),
+        )
+    return thresholds
+
+
+def main(filepath, thresholds):
+    filepath = Path(filepath)
+    with filepath.open() as f:
+        text = f.read()
+    # Keep the thresholds of algorithms that were not calibrated this time
+    namespace = {}
+    exec(text, namespace)  # noqa: S102
+    thresholds = {**namespace["thresholds"], **thresholds}
+    lines = [f"{dq_repr(key)}: {thresholds[key]!r}," for key in sorted(thresholds)]
+    text = update_text(text, lines, "thresholds", indent=" " * 4)
+    with filepath.open("w") as f:
+        f.write(text)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Calibrate when nx-cugraph should run instead of networkx"
+    )
+    parser.add_argument(
+        "--filepath",
+        default=Path(__file__).parent.parent
+        / "nx_cugraph"
+        / "utils"
+        / "_should_run_thresholds.py",
+        help="Path to the thresholds file to update",
+    )
+    parser.add_argument(
+        "--algorithms",
+        nargs="*",
+        default=None,
+        help="Names of the algorithms to calibrate. Default is all supported.",
+    )
+    parser.add_argument(
+        "--num-nodes",
+        nargs="*",
+        type=int,
+        default=[2**k for k in range(4, 19, 2)],
+        help="Number of nodes of the random graphs to benchmark",
+    )
+    parser.add_argument("--avg-degree", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the thresholds instead of updating the thresholds file",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    algorithms = get_algorithms(args.algorithms)
+    thresholds = calibrate(
+        algorithms,
+        sorted(args.num_nodes),
+        args.avg_degree,
+        args.repeat,
+        args.seed,
+        args.verbose,
+    )
+    if args.dry_run:
+        for key in sorted(thresholds):
+            print(f"{key}: {thresholds[key]}")
+    else:
+        main(args.filepath, thresholds)